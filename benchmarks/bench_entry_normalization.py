@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Entry Normalization Micro-Benchmark
+
+Measures entries/sec for turning raw client entry dicts into validated
+SymptomEntry models, comparing:
+- legacy: clean_entry + ensure_raw_notes (two deep copies) + SymptomEntry(**entry)
+- single_pass: SymptomEntry.model_validate with the SymptomDetails validator
+
+Entries are built from the gluten demo dataset with null-like strings and
+raw_notes fallbacks mixed in, as a stand-in for bulk historical imports.
+
+Usage:
+    python benchmarks/bench_entry_normalization.py --entries 200000
+"""
+
+import argparse
+import copy
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path so we can import from utils
+parent_dir = Path(__file__).parent.parent
+sys.path.append(str(parent_dir))
+
+from symptom_schema import SymptomEntry
+from utils.data_utils import is_null_value
+
+
+def legacy_clean_entry(entry):
+    """The original clean_entry, kept here as the baseline."""
+    entry = copy.deepcopy(entry)
+    sd = entry.get("symptom_details")
+    if sd:
+        for k, v in list(sd.items()):
+            if is_null_value(v):
+                if k in ("associated_symptoms",):
+                    sd[k] = []
+                else:
+                    sd[k] = None
+        if "associated_symptoms" in sd and not isinstance(
+            sd["associated_symptoms"], list
+        ):
+            if isinstance(sd["associated_symptoms"], str):
+                sd["associated_symptoms"] = [sd["associated_symptoms"]]
+            elif sd["associated_symptoms"] is None:
+                sd["associated_symptoms"] = []
+    entry["symptom_details"] = sd
+    return entry
+
+
+def legacy_ensure_raw_notes(entry):
+    """The original ensure_raw_notes, kept here as the baseline."""
+    entry = copy.deepcopy(entry)
+    sd = entry.get("symptom_details", {})
+    if not sd.get("raw_notes"):
+        for field in ["description", "notes", "summary", "context"]:
+            if field in sd and isinstance(sd[field], str) and sd[field].strip():
+                sd["raw_notes"] = sd[field].strip()
+                break
+    entry["symptom_details"] = sd
+    return entry
+
+
+def legacy_pipeline(entry):
+    return SymptomEntry(**legacy_ensure_raw_notes(legacy_clean_entry(entry)))
+
+
+def single_pass_pipeline(entry):
+    return SymptomEntry.model_validate(entry)
+
+
+def build_entries(count: int) -> list:
+    """Build count raw entries from the demo dataset with client-style noise."""
+    source = json.loads((parent_dir / "data" / "gluten_intolerance_symptoms.json").read_text())
+    entries = []
+    for i in range(count):
+        entry = copy.deepcopy(source[i % len(source)])
+        sd = entry["symptom_details"]
+        if i % 3 == 0:
+            sd["cause"] = "n/a"
+            sd["associated_symptoms"] = "bloating"
+        if i % 5 == 0:
+            sd["description"] = sd.pop("raw_notes", None) or "no notes"
+        entries.append(entry)
+    return entries
+
+
+def run(pipeline, entries: list) -> float:
+    """Return entries/sec for a pipeline over all entries."""
+    start = time.perf_counter()
+    for entry in entries:
+        pipeline(entry)
+    elapsed = time.perf_counter() - start
+    return len(entries) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--entries", type=int, default=100000, help="Entries per run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per pipeline (best is kept)")
+    args = parser.parse_args()
+
+    entries = build_entries(args.entries)
+
+    # Both pipelines must agree before timing them
+    for entry in entries[:100]:
+        assert legacy_pipeline(entry) == single_pass_pipeline(entry)
+
+    print(f"🚀 Entry normalization: {args.entries} entries, best of {args.repeat}")
+    print("=" * 60)
+    results = {}
+    for name, pipeline in (("legacy", legacy_pipeline), ("single_pass", single_pass_pipeline)):
+        results[name] = max(run(pipeline, entries) for _ in range(args.repeat))
+        print(f"  {name:12s} {results[name]:>12,.0f} entries/sec")
+
+    speedup = results["single_pass"] / results["legacy"]
+    print(f"\n📈 Speedup: {speedup:.2f}x")
+    for total in (1_000_000, 10_000_000):
+        print(
+            f"   {total:,} entries: legacy {total / results['legacy']:.0f}s, "
+            f"single_pass {total / results['single_pass']:.0f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Jury Counter Concurrency Benchmark
+
+Fires hundreds of concurrent confirm_and_save_symptom_entry calls against a
+scratch index and checks that the jury trigger counter ends at exactly the
+number of saves and that every_N sampling triggers exactly saves / N reviews.
+
+Compares three counter modes:
+- legacy: the old get + index read-modify-write (loses increments)
+- atomic: one scripted upsert per save
+- leased: blocks of counter values reserved in process
+
+Usage:
+    python benchmarks/bench_jury_counter.py --saves 500 --modulo 10
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add parent directory to path so we can import from utils
+parent_dir = Path(__file__).parent.parent
+sys.path.append(str(parent_dir))
+
+# Load environment variables from .env file (override shell env vars)
+load_dotenv(parent_dir / ".env", override=True)
+
+# Use scratch indices so the benchmark never touches real data
+os.environ["JURY_COUNTER_INDEX"] = "bench_jury_counter"
+BENCH_INDEX = "bench_symptom_entries"
+
+import tools.symptom_tools as symptom_tools
+from utils import es_utils
+from utils.es_utils import JURY_COUNTER_ID, JURY_COUNTER_INDEX, JuryCounterLease, create_es_client
+from utils.jury_queue import JuryJobQueue
+
+
+class RecordingJuryQueue(JuryJobQueue):
+    """Jury queue that records submissions instead of calling the models."""
+
+    def __init__(self):
+        super().__init__()
+        self.submitted = []
+
+    def submit(self, event_id, job):
+        self.submitted.append(event_id)
+        return True
+
+
+async def legacy_increment_jury_counter(es, by: int = 1) -> int:
+    """The original get + index counter, kept here as the baseline."""
+    try:
+        current = await es_utils.get_jury_counter(es)
+        new_count = current + by
+        await es.index(
+            index=JURY_COUNTER_INDEX, id=JURY_COUNTER_ID, document={"count": new_count}
+        )
+        return new_count
+    except Exception:
+        return 0
+
+
+async def run_mode(es, mode: str, saves: int, modulo: int, block_size: int) -> dict:
+    """Run one benchmark round and return its measurements."""
+    await es.options(ignore_status=404).indices.delete(index=JURY_COUNTER_INDEX)
+
+    queue = RecordingJuryQueue()
+    counter = JuryCounterLease(block_size=block_size) if mode == "leased" else None
+
+    original_increment = symptom_tools.increment_jury_counter
+    if mode == "legacy":
+        # Swap in the baseline via the name the save path imported
+        symptom_tools.increment_jury_counter = legacy_increment_jury_counter
+
+    latencies = []
+
+    async def one_save(i: int) -> dict:
+        start = time.perf_counter()
+        result = await symptom_tools.confirm_and_save_symptom_entry_impl(
+            es=es,
+            es_index=BENCH_INDEX,
+            jury_trigger_modulo=modulo,
+            symptom=f"benchmark symptom {i}",
+            severity=(i % 10) + 1,
+            timestamp="2025-09-01T12:00:00Z",
+            raw_notes=f"benchmark entry {i}",
+            user_id="bench_user",
+            jury_queue=queue,
+            jury_counter=counter,
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+        return result
+
+    try:
+        started = time.perf_counter()
+        results = await asyncio.gather(*[one_save(i) for i in range(saves)])
+        elapsed = time.perf_counter() - started
+    finally:
+        symptom_tools.increment_jury_counter = original_increment
+
+    final_count = await es_utils.get_jury_counter(es)
+    errors = sum(1 for r in results if r.get("status") != "saved")
+    latencies.sort()
+    return {
+        "mode": mode,
+        "saves": saves,
+        "errors": errors,
+        "final_counter": final_count,
+        "expected_counter": saves,
+        "jury_triggers": len(queue.submitted),
+        "expected_triggers": saves // modulo,
+        "elapsed_s": elapsed,
+        "saves_per_s": saves / elapsed if elapsed else 0,
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1],
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--saves", type=int, default=500, help="Concurrent saves per mode")
+    parser.add_argument("--modulo", type=int, default=10, help="every_N jury modulo")
+    parser.add_argument("--block-size", type=int, default=50, help="Lease block size")
+    parser.add_argument(
+        "--modes", default="legacy,atomic,leased", help="Comma-separated modes to run"
+    )
+    args = parser.parse_args()
+
+    es = create_es_client()
+    try:
+        print(f"🚀 Jury counter benchmark: {args.saves} concurrent saves, every_{args.modulo}")
+        print("=" * 60)
+        for mode in args.modes.split(","):
+            # Leased mode may leave unused values in the last block
+            r = await run_mode(es, mode, args.saves, args.modulo, args.block_size)
+            counter_ok = (
+                r["final_counter"] >= r["expected_counter"]
+                if mode == "leased"
+                else r["final_counter"] == r["expected_counter"]
+            )
+            triggers_ok = r["jury_triggers"] == r["expected_triggers"]
+            status = "✅" if counter_ok and triggers_ok and not r["errors"] else "❌"
+            print(
+                f"{status} {mode:7s} counter={r['final_counter']}/{r['expected_counter']} "
+                f"triggers={r['jury_triggers']}/{r['expected_triggers']} "
+                f"errors={r['errors']} {r['saves_per_s']:.0f} saves/s "
+                f"p50={r['p50_ms']:.1f}ms p99={r['p99_ms']:.1f}ms"
+            )
+    finally:
+        await es.options(ignore_status=404).indices.delete(index=BENCH_INDEX)
+        await es.options(ignore_status=404).indices.delete(index=JURY_COUNTER_INDEX)
+        await es.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Jury Load Benchmark
+
+Starts the fake Anthropic server (benchmarks/fake_anthropic_server.py) and
+drives the jury pipeline at a configurable concurrency, reporting throughput
+and p50/p95/p99 latency for:
+- jury: llm_jury_compare_notes runs (3 streamed jury models per run), plus
+  time to the first model verdict
+- saves: confirm_and_save_symptom_entry_impl with every_N jury sampling,
+  using the background jury queue (or inline juries with --inline-jury)
+
+Model latency, errors and 429s are simulated locally, so jury pipeline changes
+can be measured without network access. Elasticsearch is still used for
+storage, with scratch indices that are deleted afterwards.
+
+The server-wide jury rate limiter defaults to very high limits here so the
+pipeline itself is measured; pass --rpm/--tpm/--max-concurrency to measure
+the limiter instead.
+
+Usage:
+    python benchmarks/bench_jury_load.py --runs 200 --concurrency 20 --latency-ms 800
+    python benchmarks/bench_jury_load.py --rate-limit-rate 0.05 --error-rate 0.01
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add parent directory to path so we can import from utils
+parent_dir = Path(__file__).parent.parent
+sys.path.append(str(parent_dir))
+
+# Load environment variables from .env file (override shell env vars)
+load_dotenv(parent_dir / ".env", override=True)
+
+from fake_anthropic_server import FakeAnthropicServer
+
+BENCH_INDEX = "bench_symptom_entries"
+
+
+def configure_environment(args) -> None:
+    """Point jury storage and limits at benchmark settings before importing jury_tools."""
+    os.environ["JURY_SUMMARY_INDEX"] = "bench_event_summaries"
+    os.environ["JURY_COUNTER_INDEX"] = "bench_jury_counter"
+    os.environ.setdefault("ANTHROPIC_API_KEY", "fake-key")
+    os.environ["JURY_MAX_CONCURRENCY"] = str(args.max_concurrency)
+    os.environ["JURY_REQUESTS_PER_MINUTE"] = str(args.rpm)
+    os.environ["JURY_TOKENS_PER_MINUTE"] = str(args.tpm)
+    # Every run uses distinct notes, but keep the memo cache out of the picture
+    os.environ["JURY_CACHE_SIZE"] = "1"
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def report(name: str, latencies: list, errors: int, elapsed: float, unit: str) -> None:
+    """Print throughput and latency percentiles for one phase."""
+    latencies = sorted(latencies)
+    count = len(latencies)
+    print(
+        f"  {name:6s} {count:>5d} {unit} {errors:>4d} errors  "
+        f"{count / elapsed:>8.2f} {unit}/s  "
+        f"p50 {percentile(latencies, 50):>8.1f}ms  "
+        f"p95 {percentile(latencies, 95):>8.1f}ms  "
+        f"p99 {percentile(latencies, 99):>8.1f}ms"
+    )
+
+
+async def run_bounded(count: int, concurrency: int, make_call) -> tuple:
+    """Run count calls with at most concurrency in flight; return latencies, results, elapsed."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(i: int):
+        async with semaphore:
+            start = time.perf_counter()
+            result = await make_call(i)
+            latencies.append((time.perf_counter() - start) * 1000)
+            return result
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*[one(i) for i in range(count)])
+    return latencies, results, time.perf_counter() - started
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=100, help="Jury runs in the jury phase")
+    parser.add_argument("--saves", type=int, default=200, help="Saves in the save phase")
+    parser.add_argument("--concurrency", type=int, default=10, help="Calls in flight")
+    parser.add_argument("--modulo", type=int, default=5, help="every_N jury sampling for saves")
+    parser.add_argument("--inline-jury", action="store_true", help="Run save juries inline")
+    parser.add_argument("--workers", type=int, default=4, help="Jury queue workers for saves")
+    parser.add_argument("--latency-ms", type=float, default=500, help="Fake model latency")
+    parser.add_argument("--jitter-ms", type=float, default=200, help="Fake latency jitter")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of 500 responses")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of 429s")
+    parser.add_argument("--max-concurrency", type=int, default=1000, help="JURY_MAX_CONCURRENCY")
+    parser.add_argument("--rpm", type=float, default=1e9, help="JURY_REQUESTS_PER_MINUTE")
+    parser.add_argument("--tpm", type=float, default=1e12, help="JURY_TOKENS_PER_MINUTE")
+    parser.add_argument("--seed", type=int, default=42, help="Fake server random seed")
+    args = parser.parse_args()
+
+    server = FakeAnthropicServer(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed,
+    )
+    os.environ["ANTHROPIC_BASE_URL"] = await server.start()
+    configure_environment(args)
+
+    import jury_tools
+    from tools.symptom_tools import confirm_and_save_symptom_entry_impl
+    from utils.es_utils import JURY_COUNTER_INDEX, create_es_client, ensure_jury_summary_index
+    from utils.jury_queue import JuryJobQueue
+
+    es = create_es_client()
+    try:
+        await ensure_jury_summary_index(es, jury_tools.JURY_SUMMARY_INDEX)
+        print(
+            f"🚀 Jury load benchmark: concurrency {args.concurrency}, fake latency "
+            f"{args.latency_ms:g}±{args.jitter_ms:g}ms, errors {args.error_rate:.0%}, "
+            f"429s {args.rate_limit_rate:.0%}"
+        )
+        print("=" * 96)
+
+        # Phase 1: jury runs
+        async def jury_call(i: int) -> dict:
+            return await jury_tools.llm_jury_compare_notes(
+                f"bench-jury-{i}",
+                f"benchmark notes {i}: headache after lunch, lasted about {i % 90} minutes",
+                {"symptom_details": {"symptom": "headache", "severity": (i % 10) + 1}},
+                None,
+                es,
+            )
+
+        latencies, results, elapsed = await run_bounded(args.runs, args.concurrency, jury_call)
+        errors = sum(
+            1 for r in results
+            if r.get("status") != "jury_completed" or r.get("failed_models_count")
+        )
+        report("jury", latencies, errors, elapsed, "runs ")
+        first_verdicts = sorted(
+            r["first_verdict_ms"] for r in results if r.get("first_verdict_ms") is not None
+        )
+        if first_verdicts:
+            print(
+                f"  {'first verdict':>29s}  "
+                f"p50 {percentile(first_verdicts, 50):>8.1f}ms  "
+                f"p95 {percentile(first_verdicts, 95):>8.1f}ms  "
+                f"p99 {percentile(first_verdicts, 99):>8.1f}ms"
+            )
+        await jury_tools.finish_late_jury_results()
+
+        # Phase 2: saves with jury sampling
+        queue = None if args.inline_jury else JuryJobQueue(
+            workers=args.workers, maxsize=args.saves
+        )
+
+        async def save_call(i: int) -> dict:
+            return await confirm_and_save_symptom_entry_impl(
+                es=es,
+                es_index=BENCH_INDEX,
+                jury_trigger_modulo=args.modulo,
+                symptom=f"benchmark symptom {i}",
+                severity=(i % 10) + 1,
+                timestamp="2025-09-01T12:00:00Z",
+                raw_notes=f"benchmark save {i}: nausea after dinner",
+                user_id="bench_user",
+                jury_queue=queue,
+            )
+
+        latencies, results, elapsed = await run_bounded(args.saves, args.concurrency, save_call)
+        errors = sum(1 for r in results if r.get("status") != "saved")
+        report("saves", latencies, errors, elapsed, "saves")
+
+        if queue is not None:
+            drain_started = time.perf_counter()
+            await queue.stop(drain=True)
+            stats = queue.stats()
+            print(
+                f"  queue  drained in {time.perf_counter() - drain_started:.1f}s: {stats}"
+            )
+
+        print(f"\n🤖 Fake API: {server.stats()}")
+        print(f"🎛️  Limiter: {jury_tools.jury_rate_limiter.metrics()}")
+    finally:
+        await jury_tools.close_anthropic_client()
+        for index in (BENCH_INDEX, jury_tools.JURY_SUMMARY_INDEX, JURY_COUNTER_INDEX):
+            await es.options(ignore_status=404).indices.delete(index=index)
+        await es.close()
+        await server.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
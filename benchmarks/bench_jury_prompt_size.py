@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Jury Prompt Size Benchmark
+
+Compares the estimated input tokens of the original jury prompt
+(json.dumps(entry, indent=2) with every null field) against the compact
+prompt built by jury_tools.build_jury_prompt, over the demo dataset.
+
+Estimates use the same ~4 characters per token heuristic as the jury rate
+limiter. Actual per-call usage is recorded on every jury summary
+(jury_outputs[].input_tokens / output_tokens) for measuring live traffic.
+
+Usage:
+    python benchmarks/bench_jury_prompt_size.py
+"""
+
+import argparse
+import json
+import statistics
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import from utils
+parent_dir = Path(__file__).parent.parent
+sys.path.append(str(parent_dir))
+
+from jury_tools import JURY_MODELS, build_jury_prompt, estimate_tokens
+from symptom_schema import SymptomEntry
+
+# The prompt template before compaction, kept here as the baseline
+LEGACY_TEMPLATE = (
+    "Compare the following raw user notes with the finalized structured symptom entry.\n"
+    "- Identify any information in the notes that is missing or misrepresented in the entry.\n"
+    "- Rate the faithfulness of the structured entry to the user's notes on a scale of 1-10.\n"
+    "- Provide a brief summary of any discrepancies.\n\n"
+    "Raw Notes:\n{raw_notes}\n\n"
+    "Structured Entry (JSON):\n{structured_entry}"
+)
+
+
+def legacy_prompt(raw_notes, structured_entry):
+    return LEGACY_TEMPLATE.format(
+        raw_notes=raw_notes, structured_entry=json.dumps(structured_entry, indent=2)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--file",
+        type=Path,
+        default=parent_dir / "data" / "gluten_intolerance_symptoms.json",
+        help="JSON list of symptom entries",
+    )
+    args = parser.parse_args()
+
+    entries = [SymptomEntry.model_validate(e) for e in json.loads(args.file.read_text())]
+    legacy, compact = [], []
+    for entry in entries:
+        structured = entry.model_dump(mode="json")
+        notes = entry.symptom_details.raw_notes
+        legacy.append(estimate_tokens(legacy_prompt(notes, structured), 0))
+        compact.append(estimate_tokens(build_jury_prompt(notes, structured), 0))
+
+    print(f"📏 Jury prompt input tokens over {len(entries)} entries (estimated)")
+    print("=" * 60)
+    for name, sizes in (("legacy", legacy), ("compact", compact)):
+        print(
+            f"  {name:8s} mean {statistics.mean(sizes):>7.0f}  "
+            f"p95 {sorted(sizes)[int(len(sizes) * 0.95)]:>7d}  max {max(sizes):>7d}"
+        )
+    saved = 1 - sum(compact) / sum(legacy)
+    per_run = (statistics.mean(legacy) - statistics.mean(compact)) * len(JURY_MODELS)
+    print(f"\n📉 Input tokens saved: {saved:.1%} ({per_run:.0f} tokens per jury run)")
+
+
+if __name__ == "__main__":
+    main()
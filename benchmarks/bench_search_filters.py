@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+flexible_search Filter Context Benchmark
+
+Loads a large synthetic symptom index and compares the original
+flexible_search query (every condition in bool.must, raw date bounds) with
+tools.search_tools.build_search_query (exact conditions in bool.filter,
+date-only bounds rounded to whole days). For each query shape it reports:
+- took p50/p95: Elasticsearch-reported search time over repeated runs
+- profile ms: query time from the search profile API (one profiled run)
+- scored: documents scored according to the profile (0 for pure filters)
+
+Query caches are cleared before each builder runs, and the query cache hits,
+misses and new entries for the scratch index are printed for each builder.
+The scratch index maps raw_notes as plain text (no inference endpoint
+needed) and is deleted unless --keep-index is given.
+
+Usage:
+    python benchmarks/bench_search_filters.py --docs 200000 --repeat 50
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add parent directory to path so we can import from utils
+parent_dir = Path(__file__).parent.parent
+sys.path.append(str(parent_dir))
+
+# Load environment variables from .env file (override shell env vars)
+load_dotenv(parent_dir / ".env", override=True)
+
+from tools.search_tools import build_search_query
+from utils.cache import normalize_search_query
+from utils.es_utils import create_es_client
+
+BENCH_INDEX = "bench_search_filters"
+
+MAPPINGS = {
+    "properties": {
+        "timestamp": {"type": "date"},
+        "user_id": {"type": "keyword"},
+        "symptom_details": {
+            "properties": {
+                "symptom": {"type": "keyword"},
+                "severity": {"type": "integer"},
+                "on_medication": {"type": "boolean"},
+                "mediation_attempt": {"type": "keyword"},
+                "raw_notes": {"type": "text"},
+            }
+        },
+    }
+}
+
+SYMPTOMS = ["headache", "bloating", "nausea", "fatigue", "brain fog", "joint pain"]
+REMEDIES = ["advil", "rest", "water", "ginger tea", "peppermint"]
+NOTE_WORDS = (
+    "ate bread pasta pizza lunch dinner breakfast stomach cramps tired after "
+    "work walk coffee sleep poorly stress meeting gym rice salad sandwich"
+).split()
+
+QUERIES = {
+    "date range": {"start_time": "2025-03-01", "end_time": "2025-05-31"},
+    "date+medication": {"start_time": "2025-06-01", "on_medication": True},
+    "user+date": {"user_id": "user_7", "start_time": "2025-01-01", "end_time": "2025-12-31"},
+    "symptom+date": {"symptom": "bloating", "start_time": "2025-02-01", "end_time": "2025-08-31"},
+}
+
+
+def legacy_search_query(query: dict) -> dict:
+    """The original flexible_search query: every condition in bool.must."""
+    must = []
+    if query.get("symptom"):
+        must.append({"match": {"symptom_details.symptom": query["symptom"]}})
+    if query.get("on_medication") is not None:
+        must.append({"term": {"symptom_details.on_medication": query["on_medication"]}})
+    if query.get("user_id"):
+        must.append({"term": {"user_id": query["user_id"]}})
+    if query.get("start_time") or query.get("end_time"):
+        range_query = {}
+        if query.get("start_time"):
+            range_query["gte"] = query["start_time"]
+        if query.get("end_time"):
+            range_query["lte"] = query["end_time"]
+        must.append({"range": {"timestamp": range_query}})
+    return {"bool": {"must": must}} if must else {"match_all": {}}
+
+
+def synthetic_entry(rng: random.Random, start: datetime) -> dict:
+    """Build one random symptom entry within a year of start."""
+    return {
+        "timestamp": (start + timedelta(minutes=rng.randrange(365 * 24 * 60))).isoformat(),
+        "user_id": f"user_{rng.randrange(50)}",
+        "symptom_details": {
+            "symptom": rng.choice(SYMPTOMS),
+            "severity": rng.randint(1, 10),
+            "on_medication": rng.random() < 0.3,
+            "mediation_attempt": rng.choice(REMEDIES),
+            "raw_notes": " ".join(rng.choices(NOTE_WORDS, k=rng.randint(8, 40))),
+        },
+    }
+
+
+async def load_index(es, docs: int, seed: int, batch_size: int = 5000) -> None:
+    """Recreate the scratch index and fill it with synthetic entries."""
+    await es.options(ignore_status=404).indices.delete(index=BENCH_INDEX)
+    await es.indices.create(index=BENCH_INDEX, mappings=MAPPINGS)
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for offset in range(0, docs, batch_size):
+        operations = []
+        for _ in range(min(batch_size, docs - offset)):
+            operations.append({"index": {"_index": BENCH_INDEX}})
+            operations.append(synthetic_entry(rng, start))
+        await es.bulk(operations=operations)
+    await es.indices.refresh(index=BENCH_INDEX)
+    await es.indices.forcemerge(index=BENCH_INDEX, max_num_segments=1)
+
+
+def profile_totals(profile: dict) -> tuple:
+    """Sum top-level query time (ms) and score counts across shards."""
+    nanos = scored = 0
+    for shard in profile["shards"]:
+        for search in shard["searches"]:
+            for node in search["query"]:
+                nanos += node["time_in_nanos"]
+                scored += node["breakdown"].get("score_count", 0)
+    return nanos / 1e6, scored
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+async def run_builder(es, build, repeat: int) -> dict:
+    """Time every query shape with one query builder."""
+    await es.indices.clear_cache(index=BENCH_INDEX, query=True, request=True)
+    results = {}
+    for name, filters in QUERIES.items():
+        es_query = build(normalize_search_query(filters))
+        took = []
+        for _ in range(repeat):
+            resp = await es.search(
+                index=BENCH_INDEX,
+                size=20,
+                query=es_query,
+                sort=[{"timestamp": {"order": "desc"}}],
+            )
+            took.append(resp["took"])
+        resp = await es.search(
+            index=BENCH_INDEX,
+            size=20,
+            query=es_query,
+            sort=[{"timestamp": {"order": "desc"}}],
+            profile=True,
+        )
+        results[name] = (sorted(took), *profile_totals(resp["profile"]))
+    return results
+
+
+async def cache_counts(es) -> dict:
+    """Return the query cache counters for the scratch index."""
+    stats = await es.indices.stats(index=BENCH_INDEX, metric="query_cache")
+    return stats["indices"][BENCH_INDEX]["total"]["query_cache"]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--docs", type=int, default=200000, help="Synthetic entries to index")
+    parser.add_argument("--repeat", type=int, default=30, help="Timed runs per query shape")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for synthetic data")
+    parser.add_argument("--keep-index", action="store_true", help="Keep the scratch index")
+    args = parser.parse_args()
+
+    es = create_es_client()
+    try:
+        started = time.perf_counter()
+        await load_index(es, args.docs, args.seed)
+        print(f"📥 Indexed {args.docs} synthetic entries in {time.perf_counter() - started:.1f}s")
+        print("=" * 78)
+        print(
+            f"  {'query':16s} {'builder':8s} {'took p50':>9s} {'took p95':>9s} "
+            f"{'profile ms':>11s} {'scored':>9s}"
+        )
+        for builder, build in (("must", legacy_search_query), ("filter", build_search_query)):
+            before = await cache_counts(es)
+            results = await run_builder(es, build, args.repeat)
+            for name, (took, profile_ms, scored) in results.items():
+                print(
+                    f"  {name:16s} {builder:8s} {percentile(took, 50):>7d}ms "
+                    f"{percentile(took, 95):>7d}ms {profile_ms:>9.2f}ms {scored:>9d}"
+                )
+            after = await cache_counts(es)
+            print(
+                f"  {'':16s} {builder:8s} query cache: "
+                f"{after['hit_count'] - before['hit_count']} hits, "
+                f"{after['miss_count'] - before['miss_count']} misses, "
+                f"{after['cache_count'] - before['cache_count']} cached"
+            )
+    finally:
+        if not args.keep_index:
+            await es.options(ignore_status=404).indices.delete(index=BENCH_INDEX)
+        await es.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
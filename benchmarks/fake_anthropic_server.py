@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Fake Anthropic Messages API Server
+
+A local stand-in for POST /v1/messages, used to benchmark the jury pipeline
+without network access. Responses are canned jury reports with a random
+faithfulness rating, returned after a configurable latency. Requests with
+"stream": true get server-sent events: the first text delta arrives after
+part of the latency and the rest of the report streams over the remainder.
+A configurable share of requests fails with 500 errors or 429 rate limits
+(with a retry-after-ms header, as the real API sends).
+
+Point the Anthropic SDK at it with ANTHROPIC_BASE_URL.
+
+Usage:
+    python benchmarks/fake_anthropic_server.py --port 8765 --latency-ms 800 --rate-limit-rate 0.05
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8765 python server.py
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import uuid
+from typing import Any, Dict, Optional
+
+REPORT_TEMPLATE = (
+    "## Missing/Misrepresented Information\n\n"
+    "- **Duration**: the notes give a duration that is not captured in `length_minutes`\n"
+    "- **Trigger**: the suspected trigger in the notes is missing from `cause`\n\n"
+    "## Faithfulness Rating: {rating}/10\n\n"
+    "## Summary of Discrepancies\n\n"
+    "The entry captures the core symptom and severity but drops some context from the notes."
+)
+
+
+class FakeAnthropicServer:
+    """
+    Minimal HTTP/1.1 server speaking enough of the Messages API for the jury.
+
+    Examples:
+        server = FakeAnthropicServer(latency_ms=500, error_rate=0.01)
+        base_url = await server.start()
+        os.environ["ANTHROPIC_BASE_URL"] = base_url
+        ...
+        await server.stop()
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 500,
+        jitter_ms: float = 200,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        first_token_share: float = 0.3,
+        stream_chunks: int = 8,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            latency_ms: Mean response latency
+            jitter_ms: Latency varies uniformly by +/- this much
+            error_rate: Fraction of requests answered with a 500 api_error
+            rate_limit_rate: Fraction of requests answered with a 429 rate_limit_error
+            first_token_share: Share of the latency before the first streamed delta
+            stream_chunks: Number of text deltas a streamed report is split into
+            seed: Optional random seed
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.first_token_share = min(max(first_token_share, 0.0), 1.0)
+        self.stream_chunks = max(1, stream_chunks)
+        self._random = random.Random(seed)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self.requests = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Start listening.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+
+        Returns:
+            Base URL to use as ANTHROPIC_BASE_URL
+        """
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        bound_port = self._server.sockets[0].getsockname()[1]
+        return f"http://{host}:{bound_port}"
+
+    async def stop(self) -> None:
+        """Stop listening and close the server."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report request counters.
+
+        Returns:
+            Dict with total requests, injected errors and 429s, and peak concurrency
+        """
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rate_limited": self.rate_limited,
+            "max_in_flight": self.max_in_flight,
+        }
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve keep-alive requests on one connection until the client closes it."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode().split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                await self._handle_request(method, path.split("?")[0], body, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(
+        self, method: str, path: str, body: bytes, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer one request after the simulated latency."""
+        if method != "POST" or path != "/v1/messages":
+            await self._send_json(writer, 404, _error("not_found_error", f"No route {path}"))
+            return
+
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            payload = json.loads(body or b"{}")
+            delay = self.latency_ms + self._random.uniform(-self.jitter_ms, self.jitter_ms)
+            delay = max(0.0, delay) / 1000
+            streaming = bool(payload.get("stream"))
+            await asyncio.sleep(delay * self.first_token_share if streaming else delay)
+
+            roll = self._random.random()
+            if roll < self.rate_limit_rate:
+                self.rate_limited += 1
+                await self._send_json(
+                    writer,
+                    429,
+                    _error("rate_limit_error", "Fake rate limit"),
+                    {"retry-after-ms": "100"},
+                )
+                return
+            if roll < self.rate_limit_rate + self.error_rate:
+                self.errors += 1
+                await self._send_json(writer, 500, _error("api_error", "Fake server error"))
+                return
+
+            message = self._message(payload)
+            if streaming:
+                await self._send_stream(writer, message, delay * (1 - self.first_token_share))
+            else:
+                await self._send_json(writer, 200, message)
+        finally:
+            self.in_flight -= 1
+
+    async def _send_stream(
+        self, writer: asyncio.StreamWriter, message: dict, duration: float
+    ) -> None:
+        """Stream a message as Messages API server-sent events over chunked encoding."""
+        head = (
+            "HTTP/1.1 200 OK\r\n"
+            "content-type: text/event-stream\r\n"
+            "cache-control: no-cache\r\n"
+            "transfer-encoding: chunked\r\n"
+            f"request-id: req_{uuid.uuid4().hex[:24]}\r\n\r\n"
+        )
+        writer.write(head.encode())
+
+        async def send_event(event: str, data: dict) -> None:
+            chunk = f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+            writer.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            await writer.drain()
+
+        text = message["content"][0]["text"]
+        usage = message["usage"]
+        await send_event(
+            "message_start",
+            {
+                "type": "message_start",
+                "message": {
+                    **message,
+                    "content": [],
+                    "stop_reason": None,
+                    "usage": {"input_tokens": usage["input_tokens"], "output_tokens": 1},
+                },
+            },
+        )
+        await send_event(
+            "content_block_start",
+            {
+                "type": "content_block_start",
+                "index": 0,
+                "content_block": {"type": "text", "text": ""},
+            },
+        )
+        size = -(-len(text) // self.stream_chunks)
+        for i in range(0, len(text), size):
+            if i:
+                await asyncio.sleep(duration / self.stream_chunks)
+            await send_event(
+                "content_block_delta",
+                {
+                    "type": "content_block_delta",
+                    "index": 0,
+                    "delta": {"type": "text_delta", "text": text[i : i + size]},
+                },
+            )
+        await send_event("content_block_stop", {"type": "content_block_stop", "index": 0})
+        await send_event(
+            "message_delta",
+            {
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                "usage": {"output_tokens": usage["output_tokens"]},
+            },
+        )
+        await send_event("message_stop", {"type": "message_stop"})
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    def _message(self, payload: dict) -> dict:
+        """Build a Messages API response with a canned jury report."""
+        prompt = "".join(
+            m["content"] if isinstance(m.get("content"), str) else json.dumps(m.get("content"))
+            for m in payload.get("messages", [])
+        )
+        text = REPORT_TEMPLATE.format(rating=self._random.randint(5, 9))
+        return {
+            "id": f"msg_{uuid.uuid4().hex[:24]}",
+            "type": "message",
+            "role": "assistant",
+            "model": payload.get("model", "fake-model"),
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": len(prompt) // 4, "output_tokens": len(text) // 4},
+        }
+
+    @staticmethod
+    async def _send_json(
+        writer: asyncio.StreamWriter,
+        status: int,
+        body: dict,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Write a JSON response, keeping the connection open."""
+        data = json.dumps(body).encode()
+        reason = {200: "OK", 404: "Not Found", 429: "Too Many Requests", 500: "Internal Server Error"}
+        headers = {
+            "content-type": "application/json",
+            "content-length": str(len(data)),
+            "request-id": f"req_{uuid.uuid4().hex[:24]}",
+            **(extra_headers or {}),
+        }
+        head = f"HTTP/1.1 {status} {reason[status]}\r\n" + "".join(
+            f"{name}: {value}\r\n" for name, value in headers.items()
+        )
+        writer.write(head.encode() + b"\r\n" + data)
+        await writer.drain()
+
+
+def _error(error_type: str, message: str) -> dict:
+    """Build a Messages API error body."""
+    return {"type": "error", "error": {"type": error_type, "message": message}}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8765, help="Port to bind")
+    parser.add_argument("--latency-ms", type=float, default=500, help="Mean response latency")
+    parser.add_argument("--jitter-ms", type=float, default=200, help="Latency jitter (+/-)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of 500 responses")
+    parser.add_argument(
+        "--rate-limit-rate", type=float, default=0.0, help="Share of 429 responses"
+    )
+    parser.add_argument(
+        "--first-token-share",
+        type=float,
+        default=0.3,
+        help="Share of the latency before the first streamed delta",
+    )
+    args = parser.parse_args()
+
+    server = FakeAnthropicServer(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        first_token_share=args.first_token_share,
+    )
+    base_url = await server.start(args.host, args.port)
+    print(f"🤖 Fake Anthropic API listening on {base_url}")
+    print(f"   export ANTHROPIC_BASE_URL={base_url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+        print(f"📊 {server.stats()}")
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+flexible_search Payload Measurement
+
+Runs representative flexible_search queries against ES_INDEX (load the gluten
+dataset first with data/reset_and_load_gluten_data.py) in each result mode,
+and reports per mode:
+- es bytes: size of the Elasticsearch search response body
+- mcp bytes: size of the JSON results the tool returns
+- tokens: mcp bytes at ~4 characters per token, the LLM context cost
+
+The "full" baseline is the original request: full _source, no filter_path.
+
+Usage:
+    python benchmarks/measure_search_payload.py
+    python benchmarks/measure_search_payload.py --limit 50 --fields timestamp symptom_details.symptom
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add parent directory to path so we can import from utils
+parent_dir = Path(__file__).parent.parent
+sys.path.append(str(parent_dir))
+
+# Load environment variables from .env file (override shell env vars)
+load_dotenv(parent_dir / ".env", override=True)
+
+from tools.search_tools import (
+    build_search_query,
+    hit_to_entry,
+    search_hits,
+    search_response_options,
+)
+from utils.cache import normalize_search_query
+from utils.es_utils import create_es_client
+
+ES_INDEX = os.environ.get("ES_INDEX", "symptom_entries")
+
+QUERIES = [
+    {"start_time": "2025-08-01", "end_time": "2025-08-31"},
+    {"symptom": "bloating"},
+    {"notes_query": "bread pasta"},
+    {"symptom": "headache", "start_time": "2025-09-01"},
+    {"on_medication": True},
+]
+
+DEFAULT_FIELDS = [
+    "timestamp",
+    "symptom_details.symptom",
+    "symptom_details.severity",
+    "symptom_details.cause",
+]
+
+
+def body_size(resp) -> int:
+    """Size in bytes of a search response body serialized as JSON."""
+    body = resp.body if hasattr(resp, "body") else resp
+    return len(json.dumps(body).encode())
+
+
+async def measure(es, query: dict, legacy: bool) -> tuple:
+    """Run one query and return (es bytes, mcp bytes)."""
+    query = normalize_search_query(query)
+    options = {} if legacy else search_response_options(query)
+    resp = await es.search(
+        index=ES_INDEX,
+        size=query["limit"],
+        query=build_search_query(query),
+        sort=[{"timestamp": {"order": "desc"}}],
+        **options,
+    )
+    results = [hit_to_entry(hit, query) for hit in search_hits(resp)]
+    return body_size(resp), len(json.dumps(results).encode())
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--limit", type=int, default=20, help="Results per query")
+    parser.add_argument(
+        "--fields", nargs="+", default=DEFAULT_FIELDS, help="Projection used by fields modes"
+    )
+    args = parser.parse_args()
+
+    modes = {
+        "full": {},
+        "fields": {"fields": args.fields},
+        "snippets": {"snippets": True},
+        "fields+snip": {"fields": args.fields, "snippets": True},
+    }
+
+    es = create_es_client()
+    try:
+        totals = {}
+        for mode, extra in modes.items():
+            es_bytes = mcp_bytes = 0
+            for query in QUERIES:
+                sizes = await measure(
+                    es, {**query, **extra, "limit": args.limit}, legacy=mode == "full"
+                )
+                es_bytes += sizes[0]
+                mcp_bytes += sizes[1]
+            totals[mode] = (es_bytes, mcp_bytes)
+    finally:
+        await es.close()
+
+    print(f"📦 flexible_search payloads over {len(QUERIES)} queries, limit {args.limit}")
+    print("=" * 64)
+    print(f"  {'mode':12s} {'es bytes':>10s} {'mcp bytes':>10s} {'tokens':>8s} {'vs full':>8s}")
+    base_mcp = totals["full"][1] or 1
+    for mode, (es_bytes, mcp_bytes) in totals.items():
+        print(
+            f"  {mode:12s} {es_bytes:>10d} {mcp_bytes:>10d} {mcp_bytes // 4:>8d} "
+            f"{mcp_bytes / base_mcp - 1:>+8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Jury Sampling Policy Replay
+
+Replays stored jury results through the sampling policies to measure how well
+each one spends a fixed jury budget. Every entry with a stored jury summary is
+replayed in timestamp order, and the policy only "sees" the faithfulness
+rating of entries it selects (as in production).
+
+Compares at each target rate:
+- every_n: the fixed counter modulo (N = 1 / rate)
+- random: uniform sampling at the target rate
+- adaptive: AdaptiveJuryPolicy (utils/jury_policy.py)
+
+An entry counts as a structuring error when its mean faithfulness rating is
+below --bad-threshold. Recall is the share of those errors the policy sent to
+the jury; precision is the share of reviewed entries that were errors.
+
+Usage:
+    python benchmarks/replay_jury_policy.py --rates 0.1 0.2 0.3 --bad-threshold 7
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add parent directory to path so we can import from utils
+parent_dir = Path(__file__).parent.parent
+sys.path.append(str(parent_dir))
+
+# Load environment variables from .env file (override shell env vars)
+load_dotenv(parent_dir / ".env", override=True)
+
+from elasticsearch.helpers import async_scan
+
+from symptom_schema import SymptomEntry
+from utils.es_utils import create_es_client
+from utils.jury_parsing import parse_faithfulness_rating
+from utils.jury_policy import AdaptiveJuryPolicy
+
+ES_INDEX = os.environ.get("ES_INDEX", "symptom_entries")
+JURY_SUMMARY_INDEX = os.environ.get("JURY_SUMMARY_INDEX", "event_summaries")
+
+
+def summary_rating(summary: dict):
+    """Mean faithfulness of a summary, parsing report text for older summaries."""
+    if summary.get("faithfulness_mean") is not None:
+        return summary["faithfulness_mean"]
+    reports = [o.get("jury_report") for o in summary.get("jury_outputs") or [] if o.get("success")]
+    if summary.get("jury_report"):
+        reports.append(summary["jury_report"])
+    ratings = [r for r in (parse_faithfulness_rating(text or "") for text in reports) if r]
+    return sum(ratings) / len(ratings) if ratings else None
+
+
+async def load_replay_set(es) -> list:
+    """Return (entry, rating) pairs for every entry with a rated jury summary."""
+    ratings = {}
+    async for hit in async_scan(es, index=JURY_SUMMARY_INDEX, query={"match_all": {}}):
+        summary = hit["_source"]
+        rating = summary_rating(summary)
+        if summary.get("event_id") and rating is not None:
+            ratings[summary["event_id"]] = rating
+
+    pairs = []
+    event_ids = list(ratings)
+    for i in range(0, len(event_ids), 500):
+        resp = await es.mget(index=ES_INDEX, ids=event_ids[i : i + 500])
+        for doc in resp["docs"]:
+            if doc.get("found"):
+                try:
+                    entry = SymptomEntry.model_validate(doc["_source"])
+                except Exception:
+                    continue
+                pairs.append((entry, ratings[doc["_id"]]))
+    pairs.sort(key=lambda pair: pair[0].timestamp)
+    return pairs
+
+
+def replay(pairs: list, name: str, rate: float, bad_threshold: float, seed: int) -> dict:
+    """Replay all entries through one policy and score its selections."""
+    rng = random.Random(seed)
+    policy = AdaptiveJuryPolicy(target_rate=rate, seed=seed) if name == "adaptive" else None
+    modulo = max(1, round(1 / rate))
+
+    selected = []
+    for position, (entry, rating) in enumerate(pairs, start=1):
+        if name == "every_n":
+            chosen = position % modulo == 0
+        elif name == "random":
+            chosen = rng.random() < rate
+        else:
+            chosen = policy.should_review(entry)
+            if chosen:
+                policy.record_faithfulness(entry.user_id, rating)
+        if chosen:
+            selected.append(rating)
+
+    bad_total = sum(1 for _, rating in pairs if rating < bad_threshold)
+    bad_selected = sum(1 for rating in selected if rating < bad_threshold)
+    return {
+        "policy": name,
+        "reviewed": len(selected),
+        "rate": len(selected) / len(pairs),
+        "recall": bad_selected / bad_total if bad_total else 0.0,
+        "precision": bad_selected / len(selected) if selected else 0.0,
+        "mean_rating": sum(selected) / len(selected) if selected else 0.0,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--rates", type=float, nargs="+", default=[0.1, 0.2, 0.3], help="Target jury rates"
+    )
+    parser.add_argument(
+        "--bad-threshold", type=float, default=7, help="Ratings below this count as errors"
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    es = create_es_client()
+    try:
+        pairs = await load_replay_set(es)
+    finally:
+        await es.close()
+
+    if not pairs:
+        print(f"❌ No entries with rated jury summaries in {JURY_SUMMARY_INDEX}")
+        return 1
+
+    bad_total = sum(1 for _, rating in pairs if rating < args.bad_threshold)
+    print(f"🔁 Replaying {len(pairs)} reviewed entries ({bad_total} rated below {args.bad_threshold:g})")
+    print("=" * 72)
+    print(f"  {'target':>6s}  {'policy':10s} {'reviewed':>8s} {'rate':>7s} {'recall':>7s} {'precision':>9s} {'mean':>6s}")
+    for rate in args.rates:
+        for name in ("every_n", "random", "adaptive"):
+            r = replay(pairs, name, rate, args.bad_threshold, args.seed)
+            print(
+                f"  {rate:>6.2f}  {r['policy']:10s} {r['reviewed']:>8d} {r['rate']:>7.1%} "
+                f"{r['recall']:>7.1%} {r['precision']:>9.1%} {r['mean_rating']:>6.2f}"
+            )
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
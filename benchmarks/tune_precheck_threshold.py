@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Coverage Pre-check Threshold Tuning
+
+Joins each reviewed entry's coverage_score (computed on the fly for entries
+saved before it was stored) with its stored jury faithfulness rating, and
+reports for each candidate JURY_PRECHECK_THRESHOLD:
+- skipped: share of jury runs the pre-check would have saved
+- missed: structuring errors (rating below --bad-threshold) among skipped entries
+- skipped mean: mean jury rating of the entries that would have been skipped
+
+Usage:
+    python benchmarks/tune_precheck_threshold.py --thresholds 0.7 0.8 0.9 1.0
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import from utils
+parent_dir = Path(__file__).parent.parent
+sys.path.append(str(parent_dir))
+
+from replay_jury_policy import JURY_SUMMARY_INDEX, load_replay_set
+from utils.coverage import coverage_score
+from utils.es_utils import create_es_client
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--thresholds",
+        type=float,
+        nargs="+",
+        default=[0.6, 0.7, 0.8, 0.9, 1.0],
+        help="Candidate JURY_PRECHECK_THRESHOLD values",
+    )
+    parser.add_argument(
+        "--bad-threshold", type=float, default=7, help="Ratings below this count as errors"
+    )
+    args = parser.parse_args()
+
+    es = create_es_client()
+    try:
+        pairs = await load_replay_set(es)
+    finally:
+        await es.close()
+
+    scored = []
+    for entry, rating in pairs:
+        score = entry.coverage_score if entry.coverage_score is not None else coverage_score(entry)
+        if score is not None:
+            scored.append((score, rating))
+    if not scored:
+        print(f"❌ No reviewed entries with raw notes in {JURY_SUMMARY_INDEX}")
+        return 1
+
+    bad_total = sum(1 for _, rating in scored if rating < args.bad_threshold)
+    print(
+        f"🎯 {len(scored)} reviewed entries with notes "
+        f"({bad_total} rated below {args.bad_threshold:g})"
+    )
+    print("=" * 60)
+    print(f"  {'threshold':>9s} {'skipped':>9s} {'missed':>12s} {'skipped mean':>13s}")
+    for threshold in sorted(args.thresholds):
+        skipped = [rating for score, rating in scored if score >= threshold]
+        missed = sum(1 for rating in skipped if rating < args.bad_threshold)
+        mean = sum(skipped) / len(skipped) if skipped else 0.0
+        print(
+            f"  {threshold:>9.2f} {len(skipped) / len(scored):>9.1%} "
+            f"{missed:>5d} ({missed / bad_total if bad_total else 0:>4.0%}) {mean:>13.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Backfill Jury Reviews
+
+Finds symptom entries that have no jury summary (bulk-loaded data, or saves
+skipped by every_N sampling) and runs the LLM jury on them with a bounded pool
+of concurrent workers. Model calls go through the same server-wide rate
+limiter as the MCP server, so the pool can run at full API throughput without
+tripping provider 429s.
+
+Entries are scanned in timestamp order. Progress is checkpointed to a JSON
+file (a timestamp watermark plus failed event IDs), so an interrupted run
+resumes where it stopped and retries its failures.
+
+Usage:
+    python data/backfill_jury_reviews.py --concurrency 8
+    python data/backfill_jury_reviews.py --dry-run
+    python data/backfill_jury_reviews.py --reset-checkpoint --limit 100
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import Counter
+from contextlib import aclosing
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add parent directory to path so we can import from utils
+parent_dir = Path(__file__).parent.parent
+sys.path.append(str(parent_dir))
+
+# Load environment variables from .env file (override shell env vars)
+load_dotenv(parent_dir / ".env", override=True)
+
+from jury_tools import (
+    JURY_SUMMARY_INDEX,
+    close_anthropic_client,
+    finish_late_jury_results,
+    llm_jury_compare_notes,
+)
+from symptom_schema import SymptomEntry
+from utils.es_utils import create_es_client, ensure_jury_summary_index, exact_match_field
+
+ES_INDEX = os.environ.get("ES_INDEX", "symptom_entries")
+DEFAULT_CHECKPOINT = Path(__file__).parent / ".backfill_jury_checkpoint.json"
+
+
+def load_checkpoint(path: Path) -> dict:
+    """Load the checkpoint, or start fresh if it does not exist."""
+    if path.exists():
+        return json.loads(path.read_text())
+    return {"watermark": None, "failed": {}, "reviewed": 0}
+
+
+def save_checkpoint(path: Path, checkpoint: dict) -> None:
+    """Write the checkpoint atomically so a crash never leaves it half written."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(checkpoint, indent=2))
+    os.replace(tmp, path)
+
+
+async def reviewed_event_ids(es, event_ids: list, event_id_field: str = "event_id") -> set:
+    """
+    Return the subset of event_ids that already have a jury summary.
+
+    event_id_field is event_id.keyword on a summary index created with dynamic
+    mapping, where event_id is analyzed text (see exact_match_field).
+    """
+    resp = await es.search(
+        index=JURY_SUMMARY_INDEX,
+        size=0,
+        query={"terms": {event_id_field: event_ids}},
+        aggs={"reviewed": {"terms": {"field": event_id_field, "size": len(event_ids)}}},
+    )
+    return {b["key"] for b in resp["aggregations"]["reviewed"]["buckets"]}
+
+
+async def scan_unreviewed(
+    es, watermark: str = None, page_size: int = 500, event_id_field: str = "event_id"
+):
+    """
+    Yield (event_id, timestamp, source, reviewed) for entries from the watermark on.
+
+    Uses a point in time with search_after, so entries are visited in stable
+    timestamp order even while new entries are being saved.
+    """
+    pit = await es.open_point_in_time(index=ES_INDEX, keep_alive="5m")
+    pit_id = pit["id"]
+    query = {"range": {"timestamp": {"gte": watermark}}} if watermark else {"match_all": {}}
+    search_after = None
+    try:
+        while True:
+            resp = await es.search(
+                pit={"id": pit_id, "keep_alive": "5m"},
+                size=page_size,
+                query=query,
+                sort=[{"timestamp": "asc"}, {"_shard_doc": "asc"}],
+                search_after=search_after,
+            )
+            hits = resp["hits"]["hits"]
+            if not hits:
+                return
+            pit_id = resp.get("pit_id", pit_id)
+            search_after = hits[-1]["sort"]
+            reviewed = await reviewed_event_ids(es, [hit["_id"] for hit in hits], event_id_field)
+            for hit in hits:
+                yield hit["_id"], hit["_source"]["timestamp"], hit["_source"], hit["_id"] in reviewed
+    finally:
+        await es.close_point_in_time(id=pit_id)
+
+
+class Backfill:
+    """Bounded worker pool that reviews entries and tracks checkpoint progress."""
+
+    def __init__(
+        self,
+        es,
+        concurrency: int,
+        checkpoint_path: Path,
+        checkpoint_every: int,
+        event_id_field: str = "event_id",
+    ):
+        self.es = es
+        self.event_id_field = event_id_field
+        self.concurrency = max(1, concurrency)
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint = load_checkpoint(checkpoint_path)
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        # Timestamps of entries queued or in review; the watermark stays below them
+        self.outstanding: Counter = Counter()
+        self.last_scanned = self.checkpoint["watermark"]
+        self.previously_reviewed = self.checkpoint.get("reviewed", 0)
+        self.reviewed = 0
+        self.cache_hits = 0
+        self.failed = 0
+        self.skipped = 0
+        self.started = time.monotonic()
+
+    async def worker(self) -> None:
+        """Review queued entries until a None sentinel arrives."""
+        while True:
+            item = await self.queue.get()
+            if item is None:
+                return
+            event_id, timestamp, source = item
+            try:
+                result = await self.review(event_id, source)
+                completed = result.get("status") == "jury_completed"
+                if completed and result.get("successful_models_count"):
+                    self.reviewed += 1
+                    self.cache_hits += bool(result.get("cache_hit"))
+                    self.checkpoint["failed"].pop(event_id, None)
+                else:
+                    self.record_failure(event_id, result.get("error") or "All jury models failed")
+            except Exception as e:
+                self.record_failure(event_id, str(e))
+            finally:
+                if timestamp is not None:
+                    self.outstanding[timestamp] -= 1
+                    if not self.outstanding[timestamp]:
+                        del self.outstanding[timestamp]
+                self.on_done()
+
+    async def review(self, event_id: str, source: dict) -> dict:
+        """Run the jury on one stored entry, as the save path would."""
+        parsed = SymptomEntry.model_validate(source)
+        return await llm_jury_compare_notes(
+            event_id,
+            parsed.symptom_details.raw_notes,
+            parsed.model_dump(mode="json"),
+            None,
+            self.es,
+        )
+
+    def record_failure(self, event_id: str, error: str) -> None:
+        """Count a failed entry and keep it in the checkpoint for retry."""
+        self.failed += 1
+        self.checkpoint["failed"][event_id] = error
+
+    def on_done(self) -> None:
+        """Print progress and checkpoint every checkpoint_every finished entries."""
+        finished = self.reviewed + self.failed
+        if finished % self.checkpoint_every == 0:
+            self.write_checkpoint()
+            self.print_progress()
+
+    def write_checkpoint(self) -> None:
+        """Save the watermark, failed entries and running review total."""
+        # Everything below the oldest outstanding entry has been handled
+        self.checkpoint["watermark"] = (
+            min(self.outstanding) if self.outstanding else self.last_scanned
+        )
+        self.checkpoint["reviewed"] = self.previously_reviewed + self.reviewed
+        save_checkpoint(self.checkpoint_path, self.checkpoint)
+
+    def print_progress(self) -> None:
+        """Print review counts, throughput and the current watermark."""
+        elapsed = time.monotonic() - self.started
+        rate = (self.reviewed + self.failed) / elapsed * 60 if elapsed else 0.0
+        print(
+            f"   reviewed {self.reviewed} ({self.cache_hits} cached), failed {self.failed}, "
+            f"skipped {self.skipped} | {rate:.1f} entries/min | "
+            f"watermark {self.checkpoint['watermark'] or '-'}",
+            flush=True,
+        )
+
+    async def run(self, limit: int = 0, dry_run: bool = False) -> None:
+        """Scan for unreviewed entries and feed them to the worker pool."""
+        workers = [asyncio.create_task(self.worker()) for _ in range(self.concurrency)]
+        queued = 0
+        try:
+            # Retry failures from earlier runs first
+            retry_ids = list(self.checkpoint["failed"])
+            if retry_ids and not dry_run:
+                print(f"🔁 Retrying {len(retry_ids)} previously failed entries")
+                resp = await self.es.mget(index=ES_INDEX, ids=retry_ids)
+                for doc in resp["docs"]:
+                    if not doc.get("found"):
+                        self.checkpoint["failed"].pop(doc["_id"], None)
+                        continue
+                    if limit and queued >= limit:
+                        break
+                    await self.queue.put((doc["_id"], None, doc["_source"]))
+                    queued += 1
+
+            # aclosing closes the point in time when the scan stops early at the limit
+            async with aclosing(
+                scan_unreviewed(
+                    self.es, self.checkpoint["watermark"], event_id_field=self.event_id_field
+                )
+            ) as scan:
+                async for event_id, timestamp, source, reviewed in scan:
+                    if limit and queued >= limit:
+                        break
+                    if reviewed or event_id in self.checkpoint["failed"]:
+                        self.skipped += 1
+                        self.last_scanned = timestamp
+                        continue
+                    queued += 1
+                    if dry_run:
+                        continue
+                    self.outstanding[timestamp] += 1
+                    self.last_scanned = timestamp
+                    await self.queue.put((event_id, timestamp, source))
+        finally:
+            for _ in workers:
+                await self.queue.put(None)
+            await asyncio.gather(*workers)
+            await finish_late_jury_results()
+            if not dry_run:
+                self.write_checkpoint()
+
+        if dry_run:
+            print(f"📋 {queued} entries need a jury review ({self.skipped} already reviewed)")
+        else:
+            self.print_progress()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="Entries reviewed at once (default: 4)"
+    )
+    parser.add_argument("--limit", type=int, default=0, help="Stop after this many entries")
+    parser.add_argument(
+        "--checkpoint", type=Path, default=DEFAULT_CHECKPOINT, help="Checkpoint file path"
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=25,
+        help="Checkpoint and print progress every N entries (default: 25)",
+    )
+    parser.add_argument(
+        "--reset-checkpoint", action="store_true", help="Ignore and overwrite any checkpoint"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Only count entries that need a review"
+    )
+    args = parser.parse_args()
+
+    print("🧑‍⚖️  SymptomMinder Jury Backfill")
+    print("=" * 40)
+    if args.reset_checkpoint and args.checkpoint.exists():
+        args.checkpoint.unlink()
+
+    es = create_es_client()
+    try:
+        info = await es.info()
+        print(f"🔌 Connected to Elasticsearch {info['version']['number']}")
+        await ensure_jury_summary_index(es, JURY_SUMMARY_INDEX)
+        event_id_field = await exact_match_field(es, JURY_SUMMARY_INDEX, "event_id")
+        if event_id_field != "event_id":
+            print(f"ℹ️  {JURY_SUMMARY_INDEX} has a dynamic mapping; matching on {event_id_field}")
+
+        backfill = Backfill(
+            es, args.concurrency, args.checkpoint, args.checkpoint_every, event_id_field
+        )
+        if backfill.checkpoint["watermark"]:
+            print(f"⏩ Resuming from {backfill.checkpoint['watermark']}")
+        print(f"🚀 Reviewing {ES_INDEX} entries with {backfill.concurrency} workers")
+        await backfill.run(limit=args.limit, dry_run=args.dry_run)
+        if not args.dry_run:
+            print(f"✅ Backfill finished; checkpoint saved to {args.checkpoint}")
+        return 0
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return 1
+    finally:
+        await close_anthropic_client()
+        await es.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -28,6 +28,7 @@ async def main():
                 "timestamp": {"type": "date"},
                 "user_id": {"type": "keyword"},
                 "tags": {"type": "keyword"},
+                "coverage_score": {"type": "float"},
                 "symptom_details": {
                     "type": "object",
                     "properties": {
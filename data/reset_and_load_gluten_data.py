@@ -4,7 +4,8 @@ Reset Elasticsearch and load gluten intolerance symptom data.
 This script will:
 1. Delete all existing symptom entries
 2. Reset the jury counter
-3. Load the generated gluten intolerance symptoms
+3. Recreate the jury summary index with its explicit mapping
+4. Load the generated gluten intolerance symptoms
 """
 
 import asyncio
@@ -29,7 +30,7 @@ if not env_loaded:
 
 from elasticsearch import AsyncElasticsearch
 from elasticsearch.helpers import async_bulk
-from utils.es_utils import create_es_client
+from utils.es_utils import create_es_client, ensure_jury_summary_index
 
 
 async def clear_existing_data(es):
@@ -64,18 +65,15 @@ async def clear_existing_data(es):
     except Exception as e:
         print(f"   Error resetting jury counter: {e}")
 
-    # Clear jury summaries (optional)
+    # Recreate jury summaries with the explicit mapping
     try:
-        response = await es.delete_by_query(
-            index=JURY_SUMMARY_INDEX,
-            query={"match_all": {}},
-        )
-        print(f"   Deleted {response.get('deleted', 0)} jury summaries")
-    except Exception as e:
-        if "index_not_found_exception" in str(e):
-            print(f"   Index {JURY_SUMMARY_INDEX} doesn't exist yet (that's fine)")
+        await es.indices.delete(index=JURY_SUMMARY_INDEX, ignore_unavailable=True)
+        if await ensure_jury_summary_index(es, JURY_SUMMARY_INDEX):
+            print(f"   Recreated {JURY_SUMMARY_INDEX} with jury summary mapping")
         else:
-            print(f"   Error deleting jury summaries: {e}")
+            print(f"   Error creating {JURY_SUMMARY_INDEX}")
+    except Exception as e:
+        print(f"   Error recreating jury summaries: {e}")
 
 
 async def load_gluten_symptoms(es):
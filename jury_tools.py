@@ -1,16 +1,50 @@
 """LLM-based jury tool for comparing raw notes with structured symptom entries."""
 
 import asyncio
+import hashlib
 import json
 import os
+import time
+from datetime import datetime, timezone
+from typing import List, Optional, Set
 
 import anthropic
+import httpx
 from elasticsearch import AsyncElasticsearch
 from fastmcp import Context
 
+from utils.cache import TTLCache
+from utils.data_utils import DERIVED_FIELDS
+from utils.es_utils import get_es_response_id
+from utils.jury_parsing import parse_jury_report, render_jury_table, summarize_faithfulness
+from utils.prompt_utils import compact_entry, truncate_to_tokens
+from utils.rate_limiter import JuryRateLimiter
+
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY")
 JURY_SUMMARY_INDEX = os.environ.get("JURY_SUMMARY_INDEX", "event_summaries")
 
+# Connection pool for the shared Anthropic client
+ANTHROPIC_MAX_CONNECTIONS = int(os.environ.get("ANTHROPIC_MAX_CONNECTIONS", "20"))
+ANTHROPIC_MAX_KEEPALIVE = int(os.environ.get("ANTHROPIC_MAX_KEEPALIVE", "10"))
+ANTHROPIC_KEEPALIVE_EXPIRY = float(os.environ.get("ANTHROPIC_KEEPALIVE_EXPIRY", "60"))
+ANTHROPIC_MAX_RETRIES = int(os.environ.get("ANTHROPIC_MAX_RETRIES", "4"))
+
+# Server-wide jury call limits (rates are per model)
+JURY_MAX_CONCURRENCY = int(os.environ.get("JURY_MAX_CONCURRENCY", "6"))
+JURY_REQUESTS_PER_MINUTE = float(os.environ.get("JURY_REQUESTS_PER_MINUTE", "50"))
+JURY_TOKENS_PER_MINUTE = float(os.environ.get("JURY_TOKENS_PER_MINUTE", "40000"))
+
+# Per-model deadline and how many successful models a jury run waits for
+JURY_MODEL_TIMEOUT_S = float(os.environ.get("JURY_MODEL_TIMEOUT_S", "60"))
+JURY_QUORUM = int(os.environ.get("JURY_QUORUM", "0"))  # 0 waits for every model
+
+# Raw notes longer than this (estimated tokens) are truncated in the jury prompt
+JURY_NOTES_TOKEN_BUDGET = int(os.environ.get("JURY_NOTES_TOKEN_BUDGET", "1500"))
+
+# In-memory LRU of jury reports keyed by content hash (backed by JURY_SUMMARY_INDEX);
+# 0 disables jury memoization
+JURY_CACHE_SIZE = int(os.environ.get("JURY_CACHE_SIZE", "1000"))
+
 # Jury prompt templates
 JURY_COMPARISON_PROMPT_TEMPLATE = (
     "Compare the following raw user notes with the finalized structured symptom entry.\n"
@@ -18,7 +52,7 @@ JURY_COMPARISON_PROMPT_TEMPLATE = (
     "- Rate the faithfulness of the structured entry to the user's notes on a scale of 1-10.\n"
     "- Provide a brief summary of any discrepancies.\n\n"
     "Raw Notes:\n{raw_notes}\n\n"
-    "Structured Entry (JSON):\n{structured_entry}"
+    "Structured Entry (JSON, empty fields omitted):\n{structured_entry}"
 )
 
 JURY_AGGREGATION_PROMPT_TEMPLATE = (
@@ -38,6 +72,276 @@ JURY_MODELS = [
 ]
 AGGREGATION_MODEL = "claude-sonnet-4-20250514"
 
+# Build the summary table in-process by default; set to true to use AGGREGATION_MODEL
+JURY_LLM_AGGREGATION = os.environ.get("JURY_LLM_AGGREGATION", "false").lower() == "true"
+
+_jury_cache = TTLCache(maxsize=JURY_CACHE_SIZE) if JURY_CACHE_SIZE > 0 else None
+
+# Shared limiter so bursts of saves queue for model capacity instead of hitting 429s
+jury_rate_limiter = JuryRateLimiter(
+    max_concurrency=JURY_MAX_CONCURRENCY,
+    requests_per_minute=JURY_REQUESTS_PER_MINUTE,
+    tokens_per_minute=JURY_TOKENS_PER_MINUTE,
+)
+
+# Process-wide client, created on first use and closed on server shutdown
+_anthropic_client: Optional[anthropic.AsyncAnthropic] = None
+
+# Background tasks attaching model results that arrived after the quorum
+_late_result_tasks: Set[asyncio.Task] = set()
+
+
+def get_anthropic_client() -> anthropic.AsyncAnthropic:
+    """
+    Return the shared AsyncAnthropic client, creating it on first use.
+
+    Reusing one client keeps its HTTP connection pool warm, so jury runs
+    skip the TCP and TLS handshakes after the first call.
+
+    Returns:
+        Shared AsyncAnthropic client
+    """
+    global _anthropic_client
+    if _anthropic_client is None:
+        _anthropic_client = anthropic.AsyncAnthropic(
+            api_key=ANTHROPIC_API_KEY,
+            max_retries=ANTHROPIC_MAX_RETRIES,
+            http_client=anthropic.DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=ANTHROPIC_MAX_CONNECTIONS,
+                    max_keepalive_connections=ANTHROPIC_MAX_KEEPALIVE,
+                    keepalive_expiry=ANTHROPIC_KEEPALIVE_EXPIRY,
+                )
+            ),
+        )
+    return _anthropic_client
+
+
+async def close_anthropic_client() -> None:
+    """Close the shared AsyncAnthropic client and its connection pool."""
+    global _anthropic_client
+    if _anthropic_client is not None:
+        await _anthropic_client.close()
+        _anthropic_client = None
+
+
+async def finish_late_jury_results() -> None:
+    """
+    Wait for pending late jury results to be attached.
+
+    Each late call is bounded by JURY_MODEL_TIMEOUT_S from when it got its
+    rate limiter slot; time spent waiting for the slot is not bounded.
+    """
+    if _late_result_tasks:
+        await asyncio.gather(*list(_late_result_tasks), return_exceptions=True)
+
+
+async def report_jury_progress(
+    ctx: Optional[Context], completed: int, total: int, message: str
+) -> None:
+    """
+    Report jury progress and a log message to the MCP client.
+
+    Failures are ignored, so a client that has gone away (e.g. a late model
+    finishing after the quorum) never affects the jury.
+
+    Args:
+        ctx: FastMCP context (None when run from the background queue)
+        completed: Steps completed so far
+        total: Total steps (jury models plus aggregation)
+        message: Progress message logged at info level
+    """
+    if not ctx:
+        return
+    try:
+        await ctx.report_progress(progress=completed, total=total)
+        await ctx.info(message)
+    except Exception:
+        pass
+
+
+def estimate_tokens(prompt: str, max_tokens: int) -> int:
+    """
+    Roughly estimate the tokens a call will use, for rate limiting.
+
+    Args:
+        prompt: Prompt text (about 4 characters per token)
+        max_tokens: Maximum output tokens requested
+
+    Returns:
+        Estimated input plus output tokens
+    """
+    return len(prompt) // 4 + max_tokens
+
+
+def build_jury_prompt(raw_notes: Optional[str], structured_entry: dict) -> str:
+    """
+    Build the compact jury comparison prompt.
+
+    The entry is serialized without empty fields or indentation, and raw
+    notes are truncated to JURY_NOTES_TOKEN_BUDGET.
+
+    Args:
+        raw_notes: User's original notes/description
+        structured_entry: Parsed and structured symptom entry
+
+    Returns:
+        Prompt text for the jury models
+    """
+    return JURY_COMPARISON_PROMPT_TEMPLATE.format(
+        raw_notes=truncate_to_tokens(raw_notes, JURY_NOTES_TOKEN_BUDGET),
+        structured_entry=json.dumps(
+            compact_entry(structured_entry), separators=(",", ":"), ensure_ascii=False
+        ),
+    )
+
+
+def response_usage(response) -> dict:
+    """
+    Extract input and output token counts from a Messages API response.
+
+    Args:
+        response: Anthropic Messages API response
+
+    Returns:
+        Dict with input_tokens and output_tokens (None when not reported)
+    """
+    usage = getattr(response, "usage", None)
+    return {
+        "input_tokens": getattr(usage, "input_tokens", None),
+        "output_tokens": getattr(usage, "output_tokens", None),
+    }
+
+
+def jury_content_hash(raw_notes: Optional[str], structured_entry: dict) -> str:
+    """
+    Hash the jury inputs and configuration that determine a jury report.
+
+    Includes the prompt template and model lists, so changing the jury setup
+    never returns reports produced under a different configuration.
+
+    Args:
+        raw_notes: User's original notes/description
+        structured_entry: Parsed and structured symptom entry
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = {
+        "raw_notes": raw_notes,
+        "structured_entry": structured_entry,
+        "prompt_template": JURY_COMPARISON_PROMPT_TEMPLATE,
+        "notes_token_budget": JURY_NOTES_TOKEN_BUDGET,
+        "jury_models": [m[0] for m in JURY_MODELS],
+        "aggregation_model": AGGREGATION_MODEL if JURY_LLM_AGGREGATION else "local",
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode()
+    ).hexdigest()
+
+
+def summarize_jury_outputs(jury_outputs: List[dict]) -> dict:
+    """
+    Count model outcomes and summarize faithfulness ratings for a jury report.
+
+    Args:
+        jury_outputs: Per-model jury outputs (pending outputs have pending=True)
+
+    Returns:
+        Dict with successful/failed/pending model counts, total input and
+        output tokens across jury models, and faithfulness statistics
+    """
+    pending = sum(1 for o in jury_outputs if o.get("pending"))
+    successful = sum(1 for o in jury_outputs if o["success"])
+    return {
+        "successful_models_count": successful,
+        "failed_models_count": len(jury_outputs) - successful - pending,
+        "pending_models_count": pending,
+        "input_tokens": sum(o.get("input_tokens") or 0 for o in jury_outputs),
+        "output_tokens": sum(o.get("output_tokens") or 0 for o in jury_outputs),
+        **summarize_faithfulness(jury_outputs),
+    }
+
+
+async def attach_late_jury_results(
+    es: AsyncElasticsearch, summary_id: str, report: dict, tasks: List[asyncio.Task]
+) -> None:
+    """
+    Update a stored jury summary as model calls still running after the quorum finish.
+
+    Each late output replaces its pending placeholder, and the counts,
+    faithfulness statistics and (for local aggregation) the summary table are
+    recomputed. The per-model timeout bounds how long this runs.
+
+    Args:
+        es: Elasticsearch client
+        summary_id: Document ID of the stored summary in JURY_SUMMARY_INDEX
+        report: The stored summary document (updated in place)
+        tasks: Model call tasks, in JURY_MODELS order
+    """
+    for next_done in asyncio.as_completed([t for t in tasks if not t.done()]):
+        output = await next_done
+        report["jury_outputs"] = [
+            output if o["model_id"] == output["model_id"] else o for o in report["jury_outputs"]
+        ]
+        report.update(summarize_jury_outputs(report["jury_outputs"]))
+        if report["jury_aggregation_model"] == "local":
+            report["jury_aggregation"] = render_jury_table(report["jury_outputs"])
+        try:
+            await es.index(index=JURY_SUMMARY_INDEX, id=summary_id, document=report)
+        except Exception:
+            # Keep going; a later result rewrites the whole summary
+            continue
+    complete = not report["failed_models_count"] and not report["pending_models_count"]
+    if complete and _jury_cache is not None:
+        _jury_cache.set(report["content_hash"], report)
+
+
+async def find_cached_jury_report(
+    es: AsyncElasticsearch, content_hash: str
+) -> Optional[dict]:
+    """
+    Look up a fully successful jury report by content hash.
+
+    Checks the in-memory LRU first, then JURY_SUMMARY_INDEX. Always misses
+    when memoization is disabled (JURY_CACHE_SIZE=0).
+
+    Args:
+        es: Elasticsearch client
+        content_hash: Hash from jury_content_hash
+
+    Returns:
+        Stored jury report, or None if no complete report exists
+    """
+    if _jury_cache is None:
+        return None
+    report = _jury_cache.get(content_hash)
+    if report is not None:
+        return report
+    try:
+        resp = await es.search(
+            index=JURY_SUMMARY_INDEX,
+            size=1,
+            query={
+                "bool": {
+                    "filter": [
+                        {"term": {"content_hash": content_hash}},
+                        {"term": {"failed_models_count": 0}},
+                    ],
+                    "must_not": [{"range": {"pending_models_count": {"gt": 0}}}],
+                }
+            },
+        )
+    except Exception:
+        # Summary index missing or unreachable; fall through to a fresh jury run
+        return None
+    hits = resp["hits"]["hits"]
+    if not hits:
+        return None
+    report = hits[0]["_source"]
+    _jury_cache.set(content_hash, report)
+    return report
+
 
 # Jury tool function (to be referenced in server)
 async def llm_jury_compare_notes(
@@ -46,105 +350,256 @@ async def llm_jury_compare_notes(
     """
     Compares raw_notes to structured entry using LLM, saves report in Elasticsearch.
 
+    If a complete report already exists for the same notes and entry (matched
+    by content hash), it is stored for this event_id and returned without any
+    model calls.
+
+    Jury models are called with streaming responses. With a ctx, each model's
+    verdict is reported through progress notifications and info logs as soon
+    as it finishes, before the other models or the aggregation.
+
+    Each model call is bounded by JURY_MODEL_TIMEOUT_S, counted from when the
+    rate limiter grants it a slot. With JURY_QUORUM set,
+    the report is stored and returned once that many models have succeeded;
+    models still running are marked pending and their results are attached
+    to the stored summary in the background as they arrive.
+
     Args:
         event_id: Unique identifier for the event
         raw_notes: User's original notes/description
         structured_entry: Parsed and structured symptom entry
-        ctx: FastMCP context for logging
+        ctx: FastMCP context for logging (None when run from the background queue)
         es: Elasticsearch client for storing results
 
     Returns:
         dict: Jury comparison results including analysis from multiple models
     """
-    prompt = JURY_COMPARISON_PROMPT_TEMPLATE.format(
-        raw_notes=raw_notes,
-        structured_entry=json.dumps(structured_entry, indent=2)
-    )
+    # Server-computed fields (e.g. coverage_score) are not part of what the jury judges
+    structured_entry = {k: v for k, v in structured_entry.items() if k not in DERIVED_FIELDS}
+    prompt = build_jury_prompt(raw_notes, structured_entry)
 
+    jury_started = time.perf_counter()
     try:
-        client = anthropic.AsyncAnthropic(api_key=ANTHROPIC_API_KEY)
+        content_hash = jury_content_hash(raw_notes, structured_entry)
+        cached = await find_cached_jury_report(es, content_hash)
+        if cached is not None:
+            if cached.get("event_id") != event_id:
+                await es.index(
+                    index=JURY_SUMMARY_INDEX,
+                    document={
+                        **cached,
+                        "event_id": event_id,
+                        "cached_from_event_id": cached.get("event_id"),
+                        "reviewed_at": datetime.now(timezone.utc).isoformat(),
+                    },
+                )
+            return {
+                "status": "jury_completed",
+                "event_id": event_id,
+                "cache_hit": True,
+                "jury_outputs": cached["jury_outputs"],
+                "successful_models_count": cached["successful_models_count"],
+                "failed_models_count": cached["failed_models_count"],
+                "pending_models_count": 0,
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "faithfulness_mean": cached.get("faithfulness_mean"),
+                "faithfulness_disagreement": cached.get("faithfulness_disagreement"),
+                "jury_aggregation": cached["jury_aggregation"],
+                "jury_latency_ms": round((time.perf_counter() - jury_started) * 1000, 1),
+            }
+
+        client = get_anthropic_client()
 
         # Parallel execution helper for jury models
+        total_steps = len(JURY_MODELS) + 1  # each model, then the aggregation
+        completed_models = 0
+        first_verdict_ms = None
+
         async def call_jury_model(model_id: str, model_label: str) -> dict:
-            """Call a single jury model and track success/failure."""
+            """Stream a single jury model's report and track success/failure."""
+            nonlocal completed_models, first_verdict_ms
+            started = time.perf_counter()
+            first_token_ms = None
             try:
-                response = await client.messages.create(
-                    model=model_id,
-                    max_tokens=512,
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                jury_text = (
-                    response.content[0].text
-                    if hasattr(response, "content") and response.content
-                    else str(response)
-                )
-                return {
+                chunks = []
+                # The deadline starts once the limiter grants a slot: time queued
+                # behind other calls is pacing, not a slow model
+                async with jury_rate_limiter.acquire(model_id, estimate_tokens(prompt, 512)):
+                    async with asyncio.timeout(JURY_MODEL_TIMEOUT_S or None):
+                        async with client.messages.stream(
+                            model=model_id,
+                            max_tokens=512,
+                            messages=[{"role": "user", "content": prompt}]
+                        ) as stream:
+                            async for text in stream.text_stream:
+                                if first_token_ms is None:
+                                    first_token_ms = round(
+                                        (time.perf_counter() - started) * 1000, 1
+                                    )
+                                chunks.append(text)
+                            response = await stream.get_final_message()
+                jury_text = "".join(chunks)
+                output = {
                     "model_id": model_id,
                     "model_label": model_label,
                     "jury_report": jury_text,
                     "success": True,
-                    "error": None
+                    "error": None,
+                    "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+                    "first_token_ms": first_token_ms,
+                    **response_usage(response),
+                    **parse_jury_report(jury_text),
                 }
+                if first_verdict_ms is None:
+                    first_verdict_ms = round((time.perf_counter() - jury_started) * 1000, 1)
+                rating = output["faithfulness_rating"]
+                verdict = f"faithfulness {rating:g}/10" if rating is not None else "no rating"
+                completed_models += 1
+                await report_jury_progress(
+                    ctx,
+                    completed_models,
+                    total_steps,
+                    f"Jury model {model_label} finished: {verdict}",
+                )
+                return output
             except Exception as e:
-                error_msg = str(e)
-                ctx.error(f"Jury model {model_label} failed: {error_msg}")
+                if isinstance(e, TimeoutError):
+                    error_msg = f"Timed out after {JURY_MODEL_TIMEOUT_S:g}s"
+                else:
+                    error_msg = str(e)
+                if ctx:
+                    try:
+                        await ctx.error(f"Jury model {model_label} failed: {error_msg}")
+                    except Exception:
+                        # A client that has gone away must not replace the model error
+                        pass
+                completed_models += 1
+                await report_jury_progress(
+                    ctx, completed_models, total_steps, f"Jury model {model_label} failed"
+                )
                 return {
                     "model_id": model_id,
                     "model_label": model_label,
                     "jury_report": f"Error: {error_msg}",
                     "success": False,
-                    "error": error_msg
+                    "error": error_msg,
+                    "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+                    "first_token_ms": first_token_ms,
                 }
 
-        # Execute all jury models in parallel
-        jury_outputs = await asyncio.gather(
-            *[call_jury_model(model_id, model_label) for model_id, model_label in JURY_MODELS]
-        )
+        # Execute all jury models in parallel, returning once the quorum has answered
+        tasks = [
+            asyncio.create_task(call_jury_model(model_id, model_label))
+            for model_id, model_label in JURY_MODELS
+        ]
+        quorum = min(JURY_QUORUM, len(tasks)) if JURY_QUORUM > 0 else len(tasks)
+        pending = set(tasks)
+        successes = 0
+        while pending and successes < quorum:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            successes += sum(1 for task in done if task.result()["success"])
 
-        # Count successful and failed models
-        successful_models = [o for o in jury_outputs if o["success"]]
-        failed_models = [o for o in jury_outputs if not o["success"]]
-
-        # Compose aggregation prompt
-        jury_reports = "\n\n".join([
-            f"### {o['model_label']}\n\n{o['jury_report']}"
-            for o in jury_outputs
-        ])
-        table_prompt = JURY_AGGREGATION_PROMPT_TEMPLATE.format(jury_reports=jury_reports)
-
-        # Use aggregation model to compile results
-        agg_response = await client.messages.create(
-            model=AGGREGATION_MODEL,
-            max_tokens=700,
-            messages=[{"role": "user", "content": table_prompt}],
-        )
-        agg_text = (
-            agg_response.content[0].text
-            if hasattr(agg_response, "content") and agg_response.content
-            else str(agg_response)
+        jury_outputs = [
+            task.result()
+            if task.done()
+            else {
+                "model_id": model_id,
+                "model_label": model_label,
+                "jury_report": None,
+                "success": False,
+                "pending": True,
+                "error": None,
+                "latency_ms": None,
+            }
+            for task, (model_id, model_label) in zip(tasks, JURY_MODELS)
+        ]
+
+        if JURY_LLM_AGGREGATION:
+            # Compose aggregation prompt
+            jury_reports = "\n\n".join([
+                f"### {o['model_label']}\n\n{o['jury_report']}"
+                for o in jury_outputs
+                if not o.get("pending")
+            ])
+            table_prompt = JURY_AGGREGATION_PROMPT_TEMPLATE.format(jury_reports=jury_reports)
+
+            # Use aggregation model to compile results
+            agg_started = time.perf_counter()
+            async with jury_rate_limiter.acquire(
+                AGGREGATION_MODEL, estimate_tokens(table_prompt, 700)
+            ):
+                agg_response = await client.messages.create(
+                    model=AGGREGATION_MODEL,
+                    max_tokens=700,
+                    messages=[{"role": "user", "content": table_prompt}],
+                )
+            agg_text = (
+                agg_response.content[0].text
+                if hasattr(agg_response, "content") and agg_response.content
+                else str(agg_response)
+            )
+            aggregation_model = AGGREGATION_MODEL
+            aggregation_usage = response_usage(agg_response)
+        else:
+            # Render the same table locally from the parsed reports
+            agg_started = time.perf_counter()
+            agg_text = render_jury_table(jury_outputs)
+            aggregation_model = "local"
+            aggregation_usage = {"input_tokens": 0, "output_tokens": 0}
+        aggregation_latency_ms = round((time.perf_counter() - agg_started) * 1000, 1)
+        jury_latency_ms = round((time.perf_counter() - jury_started) * 1000, 1)
+        await report_jury_progress(
+            ctx, total_steps, total_steps, f"Jury aggregation finished ({aggregation_model})"
         )
 
         # Save all outputs and aggregation
         report = {
             "event_id": event_id,
+            "content_hash": content_hash,
+            "reviewed_at": datetime.now(timezone.utc).isoformat(),
             "jury_prompt": prompt,
             "jury_models": [m[0] for m in JURY_MODELS],
             "jury_outputs": jury_outputs,
-            "successful_models_count": len(successful_models),
-            "failed_models_count": len(failed_models),
-            "jury_aggregation_model": AGGREGATION_MODEL,
+            **summarize_jury_outputs(jury_outputs),
+            "jury_aggregation_model": aggregation_model,
             "jury_aggregation": agg_text,
+            "aggregation_latency_ms": aggregation_latency_ms,
+            "aggregation_input_tokens": aggregation_usage["input_tokens"],
+            "aggregation_output_tokens": aggregation_usage["output_tokens"],
+            "first_verdict_ms": first_verdict_ms,
+            "jury_latency_ms": jury_latency_ms,
         }
-        await es.index(index=JURY_SUMMARY_INDEX, document=report)
+        resp = await es.index(index=JURY_SUMMARY_INDEX, document=report)
+        complete = not report["failed_models_count"] and not report["pending_models_count"]
+        if complete and _jury_cache is not None:
+            _jury_cache.set(content_hash, report)
+
+        if pending:
+            # Attach the stragglers to the stored summary when they arrive
+            late_task = asyncio.create_task(
+                attach_late_jury_results(es, get_es_response_id(resp), report, tasks)
+            )
+            _late_result_tasks.add(late_task)
+            late_task.add_done_callback(_late_result_tasks.discard)
 
         return {
             "status": "jury_completed",
             "event_id": event_id,
+            "cache_hit": False,
             "jury_outputs": jury_outputs,
-            "successful_models_count": len(successful_models),
-            "failed_models_count": len(failed_models),
+            "successful_models_count": report["successful_models_count"],
+            "failed_models_count": report["failed_models_count"],
+            "pending_models_count": report["pending_models_count"],
+            "faithfulness_mean": report["faithfulness_mean"],
+            "faithfulness_disagreement": report["faithfulness_disagreement"],
+            "input_tokens": report["input_tokens"],
+            "output_tokens": report["output_tokens"],
             "jury_aggregation": agg_text,
+            "first_verdict_ms": first_verdict_ms,
+            "jury_latency_ms": jury_latency_ms,
         }
     except Exception as e:
-        ctx.error(f"Jury comparison failed: {e}")
+        if ctx:
+            await ctx.error(f"Jury comparison failed: {e}")
         return {"status": "error", "error": str(e)}
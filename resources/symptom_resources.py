@@ -1,8 +1,13 @@
 """Resources implementations for SymptomMinder MCP server."""
 
-from typing import List
+from typing import Any, Dict, List
 from elasticsearch import AsyncElasticsearch
 
+from utils.cache import SearchResultCache
+from utils.jury_policy import AdaptiveJuryPolicy
+from utils.jury_queue import JuryJobQueue
+from utils.rate_limiter import JuryRateLimiter
+
 
 async def list_symptom_entries_impl(
     es: AsyncElasticsearch, es_index: str, limit: int = 20
@@ -24,3 +29,46 @@ async def list_symptom_entries_impl(
     resp = await es.search(index=es_index, size=limit, sort="timestamp:desc")
     hits = resp["hits"]["hits"]
     return [hit["_source"] for hit in hits]
+
+
+async def jury_metrics_impl(
+    jury_queue: JuryJobQueue,
+    rate_limiter: JuryRateLimiter,
+    jury_policy: AdaptiveJuryPolicy = None,
+) -> Dict[str, Any]:
+    """
+    Implementation for reporting jury throughput metrics.
+
+    Args:
+        jury_queue: Background jury job queue
+        rate_limiter: Server-wide jury call limiter
+        jury_policy: Optional adaptive jury sampling policy
+
+    Returns:
+        Dict with background queue stats, model call limiter metrics
+        (queue depth, calls in flight, wait times) and, in adaptive mode,
+        sampling policy stats
+    """
+    metrics = {
+        "job_queue": jury_queue.stats(),
+        "model_calls": rate_limiter.metrics(),
+    }
+    if jury_policy is not None:
+        metrics["sampling_policy"] = jury_policy.stats()
+    return metrics
+
+
+async def search_cache_metrics_impl(search_cache: SearchResultCache = None) -> Dict[str, Any]:
+    """
+    Implementation for reporting flexible_search result cache counters.
+
+    Args:
+        search_cache: Search result cache (None when caching is disabled)
+
+    Returns:
+        Dict with enabled flag plus size, hits, misses, coalesced misses,
+        invalidations and hit rate when the cache is enabled
+    """
+    if search_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **search_cache.stats()}
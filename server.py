@@ -2,34 +2,69 @@
 
 import copy
 import os
+from contextlib import asynccontextmanager
 from typing import List, Optional
 
 from fastmcp import Context, FastMCP
 
-from jury_tools import llm_jury_compare_notes
+from jury_tools import (
+    JURY_SUMMARY_INDEX,
+    close_anthropic_client,
+    finish_late_jury_results,
+    jury_rate_limiter,
+    llm_jury_compare_notes,
+)
 from symptom_schema import SymptomEntry
-from utils.data_utils import clean_entry, ensure_raw_notes
+from utils.bulk_indexer import BulkIndexer
+from utils.cache import SearchResultCache, TTLCache
 from utils.es_utils import (
+    JuryCounterLease,
     create_es_client,
+    ensure_jury_summary_index,
+    exact_match_field,
     get_es_response_id,
     get_jury_counter,
     increment_jury_counter,
 )
+from utils.jury_policy import AdaptiveJuryPolicy
+from utils.jury_queue import JuryJobQueue
 from utils.prompt_utils import generate_review_prompt
+from utils.spool import EntrySpool
 from tools.symptom_tools import (
     review_symptom_entry_impl,
     confirm_and_save_symptom_entry_impl,
+    confirm_and_save_symptom_entries_impl,
+    confirm_symptom_entry_impl,
+    get_jury_status_impl,
+    run_jury_review_impl,
 )
 from tools.search_tools import (
+    flexible_search_batch_impl,
     flexible_search_impl,
+    flexible_search_page_impl,
     get_incomplete_symptoms_impl,
     update_symptom_entry_impl,
 )
-from resources.symptom_resources import list_symptom_entries_impl
+from resources.symptom_resources import (
+    jury_metrics_impl,
+    list_symptom_entries_impl,
+    search_cache_metrics_impl,
+)
 from prompts.followup_prompts import symptom_followup_guidance_impl
 
 # --- Elasticsearch Client ---
 ES_INDEX = os.environ.get("ES_INDEX", "symptom_entries")
+ES_BULK_FLUSH_MS = float(
+    os.environ.get("ES_BULK_FLUSH_MS", "0")
+)  # 0 disables write coalescing
+ES_BULK_MAX_BATCH = int(os.environ.get("ES_BULK_MAX_BATCH", "200"))
+IDEMPOTENT_SAVES = os.environ.get("IDEMPOTENT_SAVES", "false").lower() == "true"
+ES_SPOOL_PATH = os.environ.get("ES_SPOOL_PATH")  # unset disables the spool
+ES_SAVE_BUDGET_MS = float(os.environ.get("ES_SAVE_BUDGET_MS", "0"))  # 0 = no budget
+ES_SPOOL_REPLAY_INTERVAL = float(os.environ.get("ES_SPOOL_REPLAY_INTERVAL", "5"))
+SEARCH_CACHE_SIZE = int(os.environ.get("SEARCH_CACHE_SIZE", "500"))  # 0 disables
+SEARCH_CACHE_TTL = float(os.environ.get("SEARCH_CACHE_TTL", "60"))  # seconds
+SEARCH_PIT_KEEP_ALIVE = os.environ.get("SEARCH_PIT_KEEP_ALIVE", "2m")
 
 # Initialize Elasticsearch client using shared utility
 try:
@@ -37,18 +72,102 @@ try:
 except Exception as e:
     raise RuntimeError(f"Failed to initialize Elasticsearch client: {e}")
 
+# Coalesce concurrent saves into shared _bulk requests when enabled
+bulk_indexer = (
+    BulkIndexer(es, max_batch=ES_BULK_MAX_BATCH, flush_interval_ms=ES_BULK_FLUSH_MS)
+    if ES_BULK_FLUSH_MS > 0
+    else None
+)
+
+# Repeated flexible_search filters are served from memory until a write invalidates them
+search_cache = (
+    SearchResultCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+    if SEARCH_CACHE_SIZE > 0
+    else None
+)
+
+# Local write-ahead spool keeps saves lossless while Elasticsearch is down or slow
+spool = (
+    EntrySpool(
+        ES_SPOOL_PATH,
+        es,
+        latency_budget_ms=ES_SAVE_BUDGET_MS,
+        replay_interval=ES_SPOOL_REPLAY_INTERVAL,
+        search_cache=search_cache,
+    )
+    if ES_SPOOL_PATH
+    else None
+)
+
 # --- Anthropic API Configuration ---
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY")
 if not ANTHROPIC_API_KEY:
     raise RuntimeError("ANTHROPIC_API_KEY environment variable not set.")
 
+# --- Review Token Configuration ---
+REVIEW_TOKEN_TTL = int(os.environ.get("REVIEW_TOKEN_TTL", "900"))  # seconds
+REVIEW_CACHE_SIZE = int(os.environ.get("REVIEW_CACHE_SIZE", "1000"))
+
+# Validated entries from review_symptom_entry, keyed by review token
+review_cache = TTLCache(maxsize=REVIEW_CACHE_SIZE, ttl=REVIEW_TOKEN_TTL)
+
 # --- Jury Configuration ---
 JURY_MODE = os.environ.get(
     "JURY_MODE", "every_1"
-)  # 'none', or 'every_X' (e.g., 'every_5')
+)  # 'none', 'every_X' (e.g., 'every_5'), or 'adaptive_<rate>' (e.g., 'adaptive_0.2')
+JURY_WORKERS = int(os.environ.get("JURY_WORKERS", "2"))
+JURY_QUEUE_MAXSIZE = int(os.environ.get("JURY_QUEUE_MAXSIZE", "100"))
+JURY_DRAIN_TIMEOUT_S = float(
+    os.environ.get("JURY_DRAIN_TIMEOUT_S", "30")
+)  # seconds shutdown waits for pending jury reviews; 0 cancels them immediately
+JURY_COUNTER_MODE = os.environ.get(
+    "JURY_COUNTER_MODE", "atomic"
+)  # 'atomic' (one scripted update per save) or 'leased' (blocks kept in process)
+JURY_COUNTER_BLOCK_SIZE = int(os.environ.get("JURY_COUNTER_BLOCK_SIZE", "50"))
+JURY_PRECHECK_THRESHOLD = float(
+    os.environ.get("JURY_PRECHECK_THRESHOLD", "0")
+)  # entries with coverage_score at or above this skip the jury; 0 disables
+
+# Background queue so saves don't wait on jury model calls
+jury_queue = JuryJobQueue(workers=JURY_WORKERS, maxsize=JURY_QUEUE_MAXSIZE)
+
+# Leased counter blocks avoid an Elasticsearch round trip on most saves
+jury_counter = (
+    JuryCounterLease(block_size=JURY_COUNTER_BLOCK_SIZE)
+    if JURY_COUNTER_MODE == "leased"
+    else None
+)
 
 
-mcp = FastMCP("SymptomMinder")
+# Summary field holding event IDs; event_id.keyword on an older dynamic mapping
+jury_event_id_field = "event_id"
+# Entry field holding user IDs; the entry index is dynamically mapped, so user_id is text
+search_user_id_field = "user_id.keyword"
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Start background workers on startup and stop them on shutdown."""
+    global jury_event_id_field, search_user_id_field
+    await ensure_jury_summary_index(es, JURY_SUMMARY_INDEX)
+    jury_event_id_field = await exact_match_field(es, JURY_SUMMARY_INDEX, "event_id")
+    search_user_id_field = await exact_match_field(es, ES_INDEX, "user_id", dynamic=True)
+    jury_queue.start()
+    if spool is not None:
+        spool.start()
+    try:
+        yield
+    finally:
+        if spool is not None:
+            await spool.stop()
+        if bulk_indexer is not None:
+            await bulk_indexer.close()
+        await jury_queue.stop(drain=JURY_DRAIN_TIMEOUT_S > 0, timeout=JURY_DRAIN_TIMEOUT_S)
+        await finish_late_jury_results()
+        await close_anthropic_client()
+
+
+mcp = FastMCP("SymptomMinder", lifespan=lifespan)
 
 
 # --- MCP Tool: Review Symptom Entry ---
@@ -58,10 +177,11 @@ mcp = FastMCP("SymptomMinder")
         "Review a symptom entry before saving. Provide symptom details including: "
         "symptom (required), severity 1-10 (required), timestamp (required), "
         "optional: length_minutes, cause, mediation_attempt, on_medication, raw_notes. "
-        "Returns a human-readable summary for user confirmation."
+        "Returns a human-readable summary for user confirmation and a review_token "
+        "to pass to confirm_symptom_entry once the user confirms."
     ),
 )
-def review_symptom_entry(
+async def review_symptom_entry(
     symptom: str,
     severity: int,
     timestamp: str,
@@ -107,9 +227,9 @@ def review_symptom_entry(
         ctx: FastMCP context for logging
 
     Returns:
-        dict: Review status with prompt or error message
+        dict: Review status with prompt and review_token, or error message
     """
-    return review_symptom_entry_impl(
+    return await review_symptom_entry_impl(
         symptom=symptom,
         severity=severity,
         timestamp=timestamp,
@@ -128,6 +248,7 @@ def review_symptom_entry(
         activity_context=activity_context,
         tags=tags,
         user_id=user_id,
+        review_cache=review_cache,
         ctx=ctx,
     )
 
@@ -143,6 +264,14 @@ if JURY_MODE.startswith("every_"):
 elif JURY_MODE == "none":
     jury_trigger_modulo = 0
 
+# Risk-adaptive sampling picks which saves go to the jury at a target rate
+jury_policy = None
+if JURY_MODE.startswith("adaptive_"):
+    try:
+        jury_policy = AdaptiveJuryPolicy(target_rate=float(JURY_MODE.split("_")[1]))
+    except (ValueError, IndexError):
+        jury_policy = AdaptiveJuryPolicy(target_rate=0.2)
+
 
 @mcp.tool(
     name="confirm_and_save_symptom_entry",
@@ -197,7 +326,7 @@ async def confirm_and_save_symptom_entry(
         ctx: FastMCP context for logging
 
     Returns:
-        dict: Save status with entry details and optional jury results
+        dict: Save status with event_id, entry details and whether a jury review was queued
     """
     return await confirm_and_save_symptom_entry_impl(
         es=es,
@@ -221,10 +350,149 @@ async def confirm_and_save_symptom_entry(
         activity_context=activity_context,
         tags=tags,
         user_id=user_id,
+        jury_queue=jury_queue,
+        jury_counter=jury_counter,
+        bulk_indexer=bulk_indexer,
+        idempotent=IDEMPOTENT_SAVES,
+        spool=spool,
+        jury_policy=jury_policy,
+        precheck_threshold=JURY_PRECHECK_THRESHOLD,
+        search_cache=search_cache,
+        ctx=ctx,
+    )
+
+
+# --- MCP Tool: Batch Save Symptom Entries ---
+@mcp.tool(
+    name="confirm_and_save_symptom_entries",
+    description=(
+        "Save several confirmed symptom entries in one call, e.g. when the user "
+        "describes multiple symptoms at once. Pass a list of flat dicts, each using "
+        "the same keys as confirm_and_save_symptom_entry (symptom, severity and "
+        "timestamp required). Returns a per-entry result in input order."
+    ),
+)
+async def confirm_and_save_symptom_entries(
+    entries: list[dict], ctx: Context = None
+) -> dict:
+    """
+    Save multiple confirmed symptom entries with a single bulk request.
+
+    Args:
+        entries: List of flat entry dicts with confirm_and_save_symptom_entry keys
+        ctx: FastMCP context for logging
+
+    Returns:
+        dict: Overall status, saved/error counts and per-entry results
+    """
+    return await confirm_and_save_symptom_entries_impl(
+        es=es,
+        es_index=ES_INDEX,
+        jury_trigger_modulo=jury_trigger_modulo,
+        entries=entries,
+        jury_queue=jury_queue,
+        jury_counter=jury_counter,
+        idempotent=IDEMPOTENT_SAVES,
+        spool=spool,
+        jury_policy=jury_policy,
+        precheck_threshold=JURY_PRECHECK_THRESHOLD,
+        search_cache=search_cache,
+        ctx=ctx,
+    )
+
+
+# --- MCP Tool: Confirm Reviewed Entry ---
+@mcp.tool(
+    name="confirm_symptom_entry",
+    description=(
+        "Save a reviewed symptom entry after the user confirms it. Pass only the "
+        "review_token returned by review_symptom_entry; the reviewed entry is saved "
+        "exactly as shown. Tokens expire, so review again if the token is rejected."
+    ),
+)
+async def confirm_symptom_entry(review_token: str, ctx: Context = None) -> dict:
+    """
+    Save the entry cached under a review token to Elasticsearch.
+
+    Args:
+        review_token: Token returned by review_symptom_entry
+        ctx: FastMCP context for logging
+
+    Returns:
+        dict: Save status with event_id, entry details and whether a jury review was queued
+    """
+    return await confirm_symptom_entry_impl(
+        es=es,
+        es_index=ES_INDEX,
+        jury_trigger_modulo=jury_trigger_modulo,
+        review_cache=review_cache,
+        review_token=review_token,
+        jury_queue=jury_queue,
+        jury_counter=jury_counter,
+        bulk_indexer=bulk_indexer,
+        idempotent=IDEMPOTENT_SAVES,
+        spool=spool,
+        jury_policy=jury_policy,
+        precheck_threshold=JURY_PRECHECK_THRESHOLD,
+        search_cache=search_cache,
+        ctx=ctx,
+    )
+
+
+# --- MCP Tool: Jury Review Status ---
+@mcp.tool(
+    name="get_jury_status",
+    description=(
+        "Check the status of the background LLM jury review for a saved entry. "
+        "Pass the event_id returned by confirm_and_save_symptom_entry. "
+        "Status is one of: queued, running, completed, failed, rejected, not_found."
+    ),
+)
+async def get_jury_status(event_id: str, ctx: Context = None) -> dict:
+    """
+    Report the jury review job status for a saved symptom entry.
+
+    Args:
+        event_id: The Elasticsearch document ID of the saved entry
+        ctx: FastMCP context for logging
+
+    Returns:
+        dict: Job status with timing details when known
+    """
+    return await get_jury_status_impl(
+        es=es,
+        jury_queue=jury_queue,
+        event_id=event_id,
+        event_id_field=jury_event_id_field,
         ctx=ctx,
     )
 
 
+# --- MCP Tool: Run Jury Review ---
+@mcp.tool(
+    name="run_jury_review",
+    description=(
+        "Run the LLM jury review for a saved entry now and wait for the result. "
+        "Pass the event_id returned by confirm_and_save_symptom_entry. Each jury "
+        "model's verdict is streamed as a progress update as soon as it finishes."
+    ),
+)
+async def run_jury_review(event_id: str, ctx: Context = None) -> dict:
+    """
+    Run the jury on a saved symptom entry, streaming per-model progress.
+
+    Args:
+        event_id: The Elasticsearch document ID of the saved entry
+        ctx: FastMCP context for progress notifications and logging
+
+    Returns:
+        dict: Jury comparison results
+    """
+    return await run_jury_review_impl(
+        es=es, es_index=ES_INDEX, event_id=event_id, jury_policy=jury_policy, ctx=ctx
+    )
+
+
 # --- MCP Resource: Retrieve Symptom Entries ---
 @mcp.resource(
     uri="symptom://entries/{limit}",
@@ -244,6 +512,43 @@ async def list_symptom_entries(limit: int = 20) -> List[dict]:
     return await list_symptom_entries_impl(es=es, es_index=ES_INDEX, limit=limit)
 
 
+# --- MCP Resource: Jury Metrics ---
+@mcp.resource(
+    uri="symptom://jury/metrics",
+    name="jury_metrics",
+    description=(
+        "Jury job queue, model call limiter metrics (queue depth, wait times) "
+        "and adaptive sampling policy stats"
+    ),
+)
+async def jury_metrics() -> dict:
+    """
+    Report jury queue depth, calls in flight and rate limiter wait times.
+
+    Returns:
+        dict: Job queue stats and model call limiter metrics
+    """
+    return await jury_metrics_impl(
+        jury_queue=jury_queue, rate_limiter=jury_rate_limiter, jury_policy=jury_policy
+    )
+
+
+# --- MCP Resource: Search Cache Metrics ---
+@mcp.resource(
+    uri="symptom://search/cache",
+    name="search_cache_metrics",
+    description="flexible_search result cache size, hit/miss counters and invalidations",
+)
+async def search_cache_metrics() -> dict:
+    """
+    Report flexible_search result cache counters.
+
+    Returns:
+        dict: Cache size, hits, misses, coalesced misses and invalidations
+    """
+    return await search_cache_metrics_impl(search_cache=search_cache)
+
+
 # --- MCP Prompt: Follow-up Guidance ---
 @mcp.prompt(
     name="symptom_followup_guidance",
@@ -276,12 +581,15 @@ async def flexible_search(query: dict) -> List[dict]:
 
     Supported filter keys (all optional):
         - start_time: str (ISO8601 date/datetime, e.g., "2025-08-24" or "2025-08-24T10:00:00")
-        - end_time: str (ISO8601 date/datetime, e.g., "2025-09-01")
+        - end_time: str (ISO8601 date/datetime, e.g., "2025-09-01"; a date includes that whole day)
         - symptom: str (fuzzy match on symptom description, e.g., "headache")
         - on_medication: bool (true/false)
         - mediation_attempt: str (what was tried to relieve symptom, e.g., "advil")
         - notes_query: str (semantic search in raw_notes field)
+        - user_id: str (only entries recorded for this user)
         - limit: int (max results, default 20)
+        - fields: list[str] (return only these fields, e.g., ["timestamp", "symptom_details.symptom"])
+        - snippets: bool (return highlighted raw_notes fragments in "snippets" instead of full raw_notes)
 
     Example queries:
         # Date range search
@@ -293,13 +601,92 @@ async def flexible_search(query: dict) -> List[dict]:
         # Search notes for keywords
         {"notes_query": "gluten bread"}
 
+        # Compact results for scanning a long history
+        {"start_time": "2025-08-01", "fields": ["timestamp", "symptom_details.symptom"]}
+        {"notes_query": "bread", "snippets": true}
+
     Args:
         query: Dictionary containing simple filter key-value pairs (NOT nested ES query syntax)
 
     Returns:
         List of matching symptom entries, sorted by timestamp descending (most recent first)
     """
-    return await flexible_search_impl(es=es, es_index=ES_INDEX, query=query)
+    return await flexible_search_impl(
+        es=es,
+        es_index=ES_INDEX,
+        query=query,
+        search_cache=search_cache,
+        user_id_field=search_user_id_field,
+    )
+
+
+# --- MCP Tool: Batched Flexible Search ---
+@mcp.tool(
+    name="flexible_search_batch",
+    description=(
+        "Run several flexible_search queries in one call, e.g., to compare months. "
+        "Pass a list of the same flat filter dicts flexible_search takes, each with an optional "
+        "label. Returns results keyed by label (or by position when unlabeled). "
+        "Prefer this over calling flexible_search repeatedly."
+    ),
+)
+async def flexible_search_batch(queries: List[dict]) -> dict:
+    """
+    Run several flexible_search queries in a single Elasticsearch round trip.
+
+    Example:
+        [
+            {"label": "august", "symptom": "headache", "start_time": "2025-08-01", "end_time": "2025-08-31"},
+            {"label": "september", "symptom": "headache", "start_time": "2025-09-01", "end_time": "2025-09-30"}
+        ]
+
+    Args:
+        queries: Flat flexible_search filter dicts (up to 20), each with an optional "label"
+
+    Returns:
+        dict: results (label -> matching entries, most recent first) and errors (label -> message)
+    """
+    return await flexible_search_batch_impl(
+        es=es,
+        es_index=ES_INDEX,
+        queries=queries,
+        search_cache=search_cache,
+        user_id_field=search_user_id_field,
+    )
+
+
+# --- MCP Tool: Paged Flexible Search ---
+@mcp.tool(
+    name="flexible_search_page",
+    description=(
+        "Page through flexible_search results for long histories. "
+        "First call: pass the same flat filter dict as flexible_search, with limit as the page size. "
+        "Next calls: pass only the next_cursor from the previous response. "
+        "Stop when has_more is false."
+    ),
+)
+async def flexible_search_page(query: dict = None, cursor: str = None) -> dict:
+    """
+    Page through symptom entries matching flexible_search filters.
+
+    Pages are newest first and never overlap, even when entries are saved
+    between calls.
+
+    Args:
+        query: Flat flexible_search filter dict for the first page (limit = page size, default 20)
+        cursor: next_cursor returned by the previous page
+
+    Returns:
+        dict: results for this page, next_cursor (None after the last page) and has_more
+    """
+    return await flexible_search_page_impl(
+        es=es,
+        es_index=ES_INDEX,
+        query=query,
+        cursor=cursor,
+        keep_alive=SEARCH_PIT_KEEP_ALIVE,
+        user_id_field=search_user_id_field,
+    )
 
 
 # --- MCP Tool: Get Incomplete Symptoms ---
@@ -376,6 +763,7 @@ async def update_symptom_entry(
         relief_factors=relief_factors,
         severity=severity,
         tags=tags,
+        search_cache=search_cache,
         ctx=ctx,
     )
 
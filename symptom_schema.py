@@ -1,7 +1,15 @@
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+from utils.data_utils import is_null_value
+
+# Fields normalized to [] instead of None when the client sends a null-like value
+LIST_FIELDS = ("associated_symptoms",)
+
+# Client fields used to populate raw_notes when it is missing, in order of preference
+RAW_NOTES_FALLBACK_FIELDS = ("description", "notes", "summary", "context")
 
 
 class SymptomDetails(BaseModel):
@@ -32,6 +40,42 @@ class SymptomDetails(BaseModel):
         None, description="Factors that relieved or worsened the symptom"
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def normalize_client_values(cls, data: Any) -> Any:
+        """
+        Normalize client input in a single pass before field validation.
+
+        Converts null-like strings ("none", "n/a", ...) to None ([] for list
+        fields), wraps a bare associated_symptoms string in a list, and fills
+        raw_notes from description/notes/summary/context when missing.
+        Builds one shallow dict; the caller's input is never mutated.
+        """
+        if not isinstance(data, dict):
+            return data
+
+        normalized = {}
+        for key, value in data.items():
+            if is_null_value(value):
+                value = [] if key in LIST_FIELDS else None
+            normalized[key] = value
+
+        if "associated_symptoms" in normalized:
+            associated = normalized["associated_symptoms"]
+            if isinstance(associated, str):
+                normalized["associated_symptoms"] = [associated]
+            elif associated is None:
+                normalized["associated_symptoms"] = []
+
+        if not normalized.get("raw_notes"):
+            for field in RAW_NOTES_FALLBACK_FIELDS:
+                value = normalized.get(field)
+                if isinstance(value, str) and value.strip():
+                    normalized["raw_notes"] = value.strip()
+                    break
+
+        return normalized
+
 
 class EnvironmentalFactors(BaseModel):
     """Environmental and contextual factors present during a symptom event."""
@@ -53,3 +97,6 @@ class SymptomEntry(BaseModel):
         None, description="Environmental and contextual factors"
     )
     tags: Optional[List[str]] = Field(None, description="User or system tags for this entry")
+    coverage_score: Optional[float] = Field(
+        None, description="Share of raw_notes content words covered by the structured fields"
+    )
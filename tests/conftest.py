@@ -0,0 +1,11 @@
+"""Shared pytest setup for SymptomMinder tests."""
+
+import os
+import sys
+from pathlib import Path
+
+# Tests import modules the way server.py does, from the repository root
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# jury_tools reads its configuration at import time; no real API calls are made
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-key")
@@ -0,0 +1,432 @@
+"""In-process stand-ins for AsyncElasticsearch and AsyncAnthropic used by the tests."""
+
+import asyncio
+import copy
+import itertools
+import re
+import uuid
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+from elasticsearch import NotFoundError
+
+
+# What dynamic mapping gives a string field: analyzed text plus a keyword subfield
+DYNAMIC_STRING_MAPPING = {
+    "type": "text",
+    "fields": {"keyword": {"type": "keyword", "ignore_above": 256}},
+}
+
+
+class FakeApiError(Exception):
+    """Error carrying an HTTP status, like elasticsearch ApiError."""
+
+    def __init__(self, status_code: int, error_type: str, reason: str = ""):
+        self.status_code = status_code
+        self.error_type = error_type
+        super().__init__(f"{status_code} {error_type}: {reason}")
+
+
+def _get_path(doc: dict, path: str) -> Any:
+    value: Any = doc
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            # A .keyword subfield holds the same string as its text parent
+            return value if part == "keyword" and isinstance(value, str) else None
+        value = value.get(part)
+    return value
+
+
+def _text_fields(mapping: dict, prefix: str = "") -> frozenset:
+    """Dotted paths of the fields a mapping declares as analyzed text."""
+    fields = set()
+    for name, node in mapping.get("properties", {}).items():
+        if node.get("type") == "text":
+            fields.add(prefix + name)
+        fields |= _text_fields(node, f"{prefix}{name}.")
+    return frozenset(fields)
+
+
+def _term_matches(actual: Any, value: Any, analyzed: bool) -> bool:
+    if analyzed:
+        # Terms are not analyzed: they only match a lowercased token of the text
+        return isinstance(actual, str) and value in re.findall(r"\w+", actual.lower())
+    return value in actual if isinstance(actual, list) else actual == value
+
+
+def matches(doc: dict, query: Optional[dict], text_fields: frozenset = frozenset()) -> bool:
+    """Evaluate the subset of the query DSL the tools use against a document."""
+    if not query or "match_all" in query:
+        return True
+    if "bool" in query:
+        clause = query["bool"]
+        for key in ("must", "filter"):
+            items = clause.get(key, [])
+            items = items if isinstance(items, list) else [items]
+            if not all(matches(doc, q, text_fields) for q in items):
+                return False
+        must_not = clause.get("must_not", [])
+        must_not = must_not if isinstance(must_not, list) else [must_not]
+        if any(matches(doc, q, text_fields) for q in must_not):
+            return False
+        should = clause.get("should", [])
+        hits = sum(matches(doc, q, text_fields) for q in should)
+        if should and hits < clause.get("minimum_should_match", 1):
+            return False
+        return True
+    if "term" in query:
+        (field, value), = query["term"].items()
+        value = value.get("value") if isinstance(value, dict) else value
+        return _term_matches(_get_path(doc, field), value, field in text_fields)
+    if "terms" in query:
+        (field, values), = query["terms"].items()
+        actual = _get_path(doc, field)
+        return any(_term_matches(actual, v, field in text_fields) for v in values)
+    if "exists" in query:
+        return _get_path(doc, query["exists"]["field"]) is not None
+    if "match" in query:
+        (field, value), = query["match"].items()
+        value = value.get("query") if isinstance(value, dict) else value
+        actual = _get_path(doc, field)
+        return actual is not None and str(value).lower() in str(actual).lower()
+    if "range" in query:
+        (field, bounds), = query["range"].items()
+        actual = _get_path(doc, field)
+        if actual is None:
+            return False
+        for op, bound in bounds.items():
+            if isinstance(bound, str) and bound.endswith("||/d"):
+                # Whole-day rounding: compare on the date part only
+                bound, actual_cmp = bound[:-4], str(actual)[:10]
+            else:
+                actual_cmp = actual
+            if op == "gte" and not actual_cmp >= bound:
+                return False
+            if op == "gt" and not actual_cmp > bound:
+                return False
+            if op == "lte" and not actual_cmp <= bound:
+                return False
+            if op == "lt" and not actual_cmp < bound:
+                return False
+        return True
+    raise NotImplementedError(f"Fake Elasticsearch does not support query {query}")
+
+
+class FakeIndices:
+    """The indices namespace of FakeElasticsearch."""
+
+    def __init__(self, es: "FakeElasticsearch"):
+        self.es = es
+
+    async def exists(self, index: str) -> bool:
+        return index in self.es.mappings or index in self.es.aliases
+
+    async def create(self, index: str, mappings: Optional[dict] = None, **_: Any) -> dict:
+        if index in self.es.mappings or index in self.es.aliases:
+            raise FakeApiError(400, "resource_already_exists_exception", index)
+        self.es.mappings[index] = copy.deepcopy(mappings or {"properties": {}})
+        self.es.docs.setdefault(index, {})
+        return {"acknowledged": True}
+
+    async def delete(self, index: str, **_: Any) -> dict:
+        if index not in self.es.mappings:
+            raise FakeApiError(404, "index_not_found_exception", index)
+        del self.es.mappings[index]
+        self.es.docs.pop(index, None)
+        return {"acknowledged": True}
+
+    async def get_mapping(self, index: str) -> dict:
+        name = self.es.resolve(index)
+        return {name: {"mappings": self.es.mappings[name]}}
+
+    async def refresh(self, index: str = None, **_: Any) -> dict:
+        return {}
+
+
+class FakeElasticsearch:
+    """
+    In-memory AsyncElasticsearch covering the calls SymptomMinder makes.
+
+    Writes land immediately (as if refreshed). Hooks let tests slow writes
+    down or fail individual bulk items and searches.
+    """
+
+    def __init__(self):
+        self.docs: Dict[str, Dict[str, dict]] = {}
+        self.mappings: Dict[str, dict] = {}
+        self.aliases: Dict[str, str] = {}
+        self.indices = FakeIndices(self)
+        self.calls: Dict[str, int] = {}
+        self.index_delay = 0.0  # seconds each index() response is delayed after the write lands
+        self.bulk_item_error: Optional[Callable[[str, dict], Optional[FakeApiError]]] = None
+        self.fail_requests = False  # every request raises a connection error
+        self.search_error: Optional[Callable[[dict], Optional[FakeApiError]]] = None
+        self._pits: Dict[str, List[tuple]] = {}
+        self._seq = itertools.count()
+        self._seq_of: Dict[tuple, int] = {}
+
+    def options(self, **_: Any) -> "FakeElasticsearch":
+        return self
+
+    def resolve(self, index: str) -> str:
+        return self.aliases.get(index, index)
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if self.fail_requests:
+            raise ConnectionError("Elasticsearch unavailable")
+
+    def _write(self, index: str, doc_id: Optional[str], document: dict, op_type: str) -> dict:
+        index = self.resolve(index)
+        store = self.docs.setdefault(index, {})
+        self.mappings.setdefault(index, {"properties": {}})
+        doc_id = doc_id or uuid.uuid4().hex[:20]
+        if op_type == "create" and doc_id in store:
+            raise FakeApiError(409, "version_conflict_engine_exception", doc_id)
+        store[doc_id] = copy.deepcopy(document)
+        self._seq_of[(index, doc_id)] = next(self._seq)
+        return {"_index": index, "_id": doc_id, "result": "created", "status": 201}
+
+    def all_docs(self, index: str) -> List[dict]:
+        return list(self.docs.get(self.resolve(index), {}).values())
+
+    async def index(
+        self, index: str, document: dict, id: Optional[str] = None, op_type: str = "index", **_: Any
+    ) -> dict:
+        self._count("index")
+        result = self._write(index, id, document, op_type)
+        if self.index_delay:
+            # The document is already stored: a client timeout here still leaves it written
+            await asyncio.sleep(self.index_delay)
+        return result
+
+    async def get(self, index: str, id: str, **_: Any) -> dict:
+        self._count("get")
+        doc = self.docs.get(self.resolve(index), {}).get(id)
+        if doc is None:
+            raise FakeApiError(404, "not_found", id)
+        return {"_index": index, "_id": id, "found": True, "_source": copy.deepcopy(doc)}
+
+    async def mget(self, index: str, ids: List[str], **_: Any) -> dict:
+        self._count("mget")
+        store = self.docs.get(self.resolve(index), {})
+        return {
+            "docs": [
+                {"_id": i, "found": True, "_source": copy.deepcopy(store[i])}
+                if i in store
+                else {"_id": i, "found": False}
+                for i in ids
+            ]
+        }
+
+    async def update(self, index: str, id: str, script: dict, upsert: dict, **_: Any) -> dict:
+        self._count("update")
+        store = self.docs.setdefault(self.resolve(index), {})
+        if id in store:
+            store[id]["count"] += script["params"]["n"]
+        else:
+            store[id] = dict(upsert)
+        return {"_id": id, "get": {"_source": dict(store[id])}}
+
+    async def bulk(self, operations: List[dict], **_: Any) -> dict:
+        self._count("bulk")
+        items = []
+        for action, document in zip(operations[::2], operations[1::2]):
+            (op_type, meta), = action.items()
+            doc_id = meta.get("_id")
+            error = self.bulk_item_error(op_type, document) if self.bulk_item_error else None
+            try:
+                if error is not None:
+                    raise error
+                result = self._write(meta["_index"], doc_id, document, op_type)
+                items.append({op_type: result})
+            except FakeApiError as e:
+                items.append(
+                    {
+                        op_type: {
+                            "_index": meta["_index"],
+                            "_id": doc_id,
+                            "status": e.status_code,
+                            "error": {"type": e.error_type, "reason": str(e)},
+                        }
+                    }
+                )
+        return {"errors": any("error" in next(iter(i.values())) for i in items), "items": items}
+
+    def _hits(self, index: str, query: Optional[dict], snapshot: Optional[List[tuple]] = None):
+        name = self.resolve(index) if index else None
+        text_fields = _text_fields(self.mappings.get(name, {}))
+        rows = snapshot if snapshot is not None else [
+            (doc_id, doc, self._seq_of.get((name, doc_id), 0))
+            for doc_id, doc in self.docs.get(name, {}).items()
+        ]
+        return [
+            {"_id": doc_id, "_source": copy.deepcopy(doc), "sort": [doc.get("timestamp"), seq]}
+            for doc_id, doc, seq in rows
+            if matches(doc, query, text_fields)
+        ]
+
+    async def search(
+        self,
+        index: Optional[str] = None,
+        size: int = 10,
+        query: Optional[dict] = None,
+        sort: Any = None,
+        pit: Optional[dict] = None,
+        search_after: Optional[list] = None,
+        aggs: Optional[dict] = None,
+        **_: Any,
+    ) -> dict:
+        self._count("search")
+        error = self.search_error(query) if self.search_error else None
+        if error is not None:
+            raise error
+        if pit is not None:
+            if pit["id"] not in self._pits:
+                raise NotFoundError(
+                    "search_context_missing_exception", SimpleNamespace(status=404), {}
+                )
+            hits = self._hits(None, query, self._pits[pit["id"]])
+        else:
+            hits = self._hits(index, query)
+        descending = "desc" in str(sort) if sort else True
+        hits.sort(key=lambda h: (h["sort"][0] or "", h["sort"][1]), reverse=descending)
+        if search_after is not None:
+            after = (search_after[0] or "", search_after[1])
+            hits = [
+                h for h in hits
+                if ((h["sort"][0] or "", h["sort"][1]) < after if descending
+                    else (h["sort"][0] or "", h["sort"][1]) > after)
+            ]
+        body: Dict[str, Any] = {"hits": {"hits": hits[:size]}}
+        if aggs:
+            body["aggregations"] = {}
+            for name, agg in aggs.items():
+                field = agg["terms"]["field"]
+                self._check_aggregatable(index, field)
+                keys = sorted({_get_path(h["_source"], field) for h in hits})
+                body["aggregations"][name] = {"buckets": [{"key": k, "doc_count": 1} for k in keys]}
+        if pit is not None:
+            body["pit_id"] = pit["id"]
+        return body
+
+    def _check_aggregatable(self, index: str, field: str) -> None:
+        """Mirror Elasticsearch rejecting terms aggregations on text fields."""
+        properties = self.mappings.get(self.resolve(index), {}).get("properties", {})
+        node: Any = {"properties": properties}
+        for part in field.split("."):
+            node = node.get("properties", {}).get(part) or node.get("fields", {}).get(part)
+            if node is None:
+                return
+        if node.get("type") == "text":
+            raise FakeApiError(400, "illegal_argument_exception", "Fielddata is disabled on text fields")
+
+    async def msearch(self, index: str, searches: List[dict], **_: Any) -> dict:
+        self._count("msearch")
+        responses = []
+        for header, body in zip(searches[::2], searches[1::2]):
+            try:
+                resp = await self.search(
+                    index=header.get("index", index),
+                    size=body.get("size", 10),
+                    query=body.get("query"),
+                    sort=body.get("sort"),
+                )
+            except FakeApiError as e:
+                error = {"type": e.error_type, "reason": str(e)}
+                responses.append({"status": e.status_code, "error": error})
+                continue
+            responses.append({"status": 200, **resp})
+        return {"responses": responses}
+
+    async def open_point_in_time(self, index: str, keep_alive: str, **_: Any) -> dict:
+        self._count("open_point_in_time")
+        name = self.resolve(index)
+        pit_id = uuid.uuid4().hex
+        self._pits[pit_id] = [
+            (doc_id, copy.deepcopy(doc), self._seq_of.get((name, doc_id), 0))
+            for doc_id, doc in self.docs.get(name, {}).items()
+        ]
+        return {"id": pit_id}
+
+    async def close_point_in_time(self, id: str, **_: Any) -> dict:
+        self._count("close_point_in_time")
+        return {"succeeded": self._pits.pop(id, None) is not None}
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeStream:
+    """Async context manager mimicking client.messages.stream(...)."""
+
+    def __init__(self, text: str, latency: float, chunks: int = 4):
+        self.text = text
+        self.latency = latency
+        self.chunks = chunks
+
+    async def __aenter__(self) -> "FakeStream":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    @property
+    async def text_stream(self):
+        size = -(-len(self.text) // self.chunks)
+        for i in range(0, len(self.text), size):
+            await asyncio.sleep(self.latency / self.chunks)
+            yield self.text[i : i + size]
+
+    async def get_final_message(self):
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=self.text)],
+            usage=SimpleNamespace(input_tokens=100, output_tokens=len(self.text) // 4),
+        )
+
+
+class FakeAnthropic:
+    """
+    AsyncAnthropic stand-in whose models answer with a canned jury report.
+
+    Args:
+        latency: Seconds each model takes, or a dict of model_id -> seconds
+        rating: Faithfulness rating in the canned report
+    """
+
+    def __init__(self, latency: Any = 0.01, rating: int = 8):
+        self.latency = latency
+        self.rating = rating
+        self.started: List[str] = []
+        self.messages = SimpleNamespace(stream=self._stream)
+
+    def _stream(self, model: str, max_tokens: int, messages: List[dict]) -> FakeStream:
+        self.started.append(model)
+        latency = self.latency.get(model, 0.01) if isinstance(self.latency, dict) else self.latency
+        text = (
+            "## Missing/Misrepresented Information\n\n- None\n\n"
+            f"## Faithfulness Rating: {self.rating}/10\n\n"
+            "## Summary of Discrepancies\n\nThe entry matches the notes."
+        )
+        return FakeStream(text, latency)
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeContext:
+    """FastMCP Context stand-in whose logging methods are coroutines, as in fastmcp."""
+
+    def __init__(self):
+        self.errors: List[str] = []
+        self.infos: List[str] = []
+        self.progress: List[tuple] = []
+
+    async def error(self, message: str) -> None:
+        self.errors.append(message)
+
+    async def info(self, message: str) -> None:
+        self.infos.append(message)
+
+    async def report_progress(self, progress: float, total: float = None, message: str = None) -> None:
+        self.progress.append((progress, total, message))
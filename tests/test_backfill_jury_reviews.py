@@ -0,0 +1,58 @@
+"""Tests for the jury backfill's reviewed-entry lookup and scan."""
+
+import pytest
+
+from data import backfill_jury_reviews as backfill_module
+from data.backfill_jury_reviews import ES_INDEX, Backfill, reviewed_event_ids
+from jury_tools import JURY_SUMMARY_INDEX
+from tests.fakes import DYNAMIC_STRING_MAPPING, FakeApiError, FakeElasticsearch
+from utils.es_utils import ensure_jury_summary_index, exact_match_field
+
+EVENT_IDS = ["Xk2-Lq9bR", "pT7_zQe4w"]
+
+
+@pytest.fixture
+async def dynamic_es():
+    """Summary index created by dynamic mapping, before the explicit mapping existed."""
+    es = FakeElasticsearch()
+    await es.indices.create(
+        index=JURY_SUMMARY_INDEX, mappings={"properties": {"event_id": DYNAMIC_STRING_MAPPING}}
+    )
+    await es.index(index=JURY_SUMMARY_INDEX, document={"event_id": EVENT_IDS[0]})
+    return es
+
+
+async def test_reviewed_event_ids_with_explicit_mapping():
+    es = FakeElasticsearch()
+    await ensure_jury_summary_index(es, JURY_SUMMARY_INDEX)
+    await es.index(index=JURY_SUMMARY_INDEX, document={"event_id": EVENT_IDS[0]})
+    assert await reviewed_event_ids(es, EVENT_IDS) == {EVENT_IDS[0]}
+
+
+async def test_text_mapped_event_id_needs_keyword_subfield(dynamic_es):
+    with pytest.raises(FakeApiError):
+        await reviewed_event_ids(dynamic_es, EVENT_IDS)
+
+    field = await exact_match_field(dynamic_es, JURY_SUMMARY_INDEX, "event_id")
+    assert await reviewed_event_ids(dynamic_es, EVENT_IDS, field) == {EVENT_IDS[0]}
+
+
+async def test_limited_run_closes_its_point_in_time(tmp_path, monkeypatch):
+    es = FakeElasticsearch()
+    await ensure_jury_summary_index(es, JURY_SUMMARY_INDEX)
+    for day in range(1, 6):
+        await es.index(index=ES_INDEX, document={"timestamp": f"2025-09-0{day}T08:00:00Z"})
+
+    # Keep the scan referenced, so only an explicit close (not garbage collection) ends it
+    scans = []
+    scan_unreviewed = backfill_module.scan_unreviewed
+
+    def tracked_scan(*args, **kwargs):
+        scans.append(scan_unreviewed(*args, **kwargs))
+        return scans[-1]
+
+    monkeypatch.setattr(backfill_module, "scan_unreviewed", tracked_scan)
+    backfill = Backfill(es, 1, tmp_path / "checkpoint.json", 25)
+    await backfill.run(limit=2, dry_run=True)
+    assert scans[0].ag_frame is None
+    assert not es._pits
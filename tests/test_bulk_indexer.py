@@ -0,0 +1,89 @@
+"""Tests for the write-coalescing bulk indexer against the fake Elasticsearch."""
+
+import asyncio
+
+from tests.fakes import FakeApiError, FakeElasticsearch
+from tools.symptom_tools import build_entry_dict, parse_entry, save_symptom_entry
+from utils.bulk_indexer import BulkIndexer, BulkItemError
+
+INDEX = "symptom_entries"
+
+
+def doc(n: int) -> dict:
+    return {"timestamp": "2025-09-01T08:00:00Z", "symptom_details": {"symptom": f"s{n}"}}
+
+
+async def test_concurrent_writes_share_one_bulk_request():
+    es = FakeElasticsearch()
+    indexer = BulkIndexer(es, max_batch=100, flush_interval_ms=5)
+    results = await asyncio.gather(
+        *(indexer.index(index=INDEX, document=doc(n)) for n in range(10))
+    )
+
+    assert es.calls["bulk"] == 1
+    assert len({r["_id"] for r in results}) == 10
+    assert indexer.documents_written == 10
+    for n, result in enumerate(results):
+        assert es.docs[INDEX][result["_id"]] == doc(n)
+
+
+async def test_full_buffer_flushes_without_waiting():
+    es = FakeElasticsearch()
+    indexer = BulkIndexer(es, max_batch=2, flush_interval_ms=10_000)
+    await asyncio.wait_for(
+        asyncio.gather(*(indexer.index(index=INDEX, document=doc(n)) for n in range(4))), 1
+    )
+    assert es.calls["bulk"] == 2
+
+
+async def test_item_failure_only_fails_its_caller():
+    es = FakeElasticsearch()
+    es.bulk_item_error = lambda op_type, document: (
+        FakeApiError(400, "mapper_parsing_exception") if document == doc(1) else None
+    )
+    indexer = BulkIndexer(es)
+    results = await asyncio.gather(
+        *(indexer.index(index=INDEX, document=doc(n)) for n in range(3)), return_exceptions=True
+    )
+
+    assert isinstance(results[1], BulkItemError)
+    assert results[1].status_code == 400
+    assert results[0]["result"] == results[2]["result"] == "created"
+
+
+async def test_request_failure_fails_every_caller():
+    es = FakeElasticsearch()
+    es.fail_requests = True
+    indexer = BulkIndexer(es)
+    results = await asyncio.gather(
+        *(indexer.index(index=INDEX, document=doc(n)) for n in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(r, ConnectionError) for r in results)
+
+
+async def test_close_flushes_buffered_documents():
+    es = FakeElasticsearch()
+    indexer = BulkIndexer(es, flush_interval_ms=10_000)
+    write = asyncio.create_task(indexer.index(index=INDEX, document=doc(0)))
+    await asyncio.sleep(0)
+    await indexer.close()
+    assert (await write)["status"] == 201
+
+
+async def test_idempotent_saves_through_the_indexer_are_deduplicated():
+    es = FakeElasticsearch()
+    indexer = BulkIndexer(es)
+    parsed = parse_entry(
+        build_entry_dict(symptom="headache", severity=5, timestamp="2025-09-01T08:00:00Z")
+    )
+    results = await asyncio.gather(
+        *(
+            save_symptom_entry(es, INDEX, parsed, 0, bulk_indexer=indexer, idempotent=True)
+            for _ in range(3)
+        )
+    )
+
+    assert es.calls["bulk"] == 1
+    assert sorted(r["duplicate"] for r in results) == [False, True, True]
+    assert len({r["event_id"] for r in results}) == 1
+    assert len(es.all_docs(INDEX)) == 1
@@ -0,0 +1,69 @@
+"""Tests for the local field-coverage pre-check."""
+
+from tools.symptom_tools import build_entry_dict, parse_entry
+from utils.coverage import content_tokens, coverage_score, covered_enough
+
+
+def entry(raw_notes, **fields):
+    fields.setdefault("symptom", "headache")
+    return parse_entry(
+        build_entry_dict(severity=5, timestamp="2025-09-01T08:00:00Z", raw_notes=raw_notes, **fields)
+    )
+
+
+def test_content_tokens_drop_filler_and_stem_words():
+    assert content_tokens("I had headaches and felt bloated today") == {"headach", "bloat"}
+
+
+def test_content_tokens_keep_negations():
+    assert {"no", "not", "nor"} <= content_tokens("no nausea, not dizzy, nor tired")
+
+
+def test_fully_captured_notes_score_one():
+    parsed = entry("Headache after pasta, advil", cause="pasta", mediation_attempt="advil")
+    assert parsed.coverage_score == 1.0
+
+
+def test_uncaptured_words_lower_the_score():
+    parsed = entry("headache after pasta with nausea and dizziness")
+    assert parsed.coverage_score == round(1 / 4, 3)
+
+
+def test_structured_fields_count_but_metadata_does_not():
+    parsed = entry(
+        "headache at the office, user42",
+        location="office",
+        user_id="user42",
+    )
+    assert parsed.coverage_score == round(2 / 3, 3)
+
+
+def test_no_notes_has_no_score():
+    assert entry(None).coverage_score is None
+    assert coverage_score(entry("   ")) is None
+
+
+def test_covered_enough_respects_threshold():
+    parsed = entry("headache after pasta", cause="pasta")
+    assert covered_enough(parsed, 0.9)
+    assert not covered_enough(parsed, 0)
+    assert not covered_enough(entry(None), 0.9)
+    assert not covered_enough(entry("headache after pasta with nausea"), 0.9)
+
+
+def test_contradicted_entry_goes_to_the_jury():
+    # The summary records nausea; the notes say there was none
+    parsed = entry("headache, no nausea", associated_symptoms=["nausea"])
+    assert parsed.coverage_score < 1.0
+    assert not covered_enough(parsed, 0.5)
+
+
+def test_negation_captured_in_fields_can_skip_the_jury():
+    parsed = entry("headache, no nausea", relief_factors="no nausea")
+    assert parsed.coverage_score == 1.0
+    assert covered_enough(parsed, 0.9)
+
+
+def test_contractions_count_as_negations():
+    parsed = entry("headache, advil didn't help", mediation_attempt="advil helped")
+    assert not covered_enough(parsed, 0.1)
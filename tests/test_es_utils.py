@@ -0,0 +1,49 @@
+"""Tests for Elasticsearch helpers against the fake client."""
+
+from elasticsearch import TransportError
+
+from jury_tools import JURY_SUMMARY_INDEX
+from tests.fakes import DYNAMIC_STRING_MAPPING, FakeApiError, FakeElasticsearch
+from utils.es_utils import ensure_jury_summary_index, exact_match_field, is_retryable_error
+
+
+async def test_exact_match_field_uses_explicit_keyword_mapping():
+    es = FakeElasticsearch()
+    await ensure_jury_summary_index(es, JURY_SUMMARY_INDEX)
+    assert await exact_match_field(es, JURY_SUMMARY_INDEX, "event_id") == "event_id"
+
+
+async def test_exact_match_field_falls_back_to_keyword_subfield():
+    es = FakeElasticsearch()
+    await es.indices.create(
+        index="summaries_v1", mappings={"properties": {"event_id": DYNAMIC_STRING_MAPPING}}
+    )
+    es.aliases[JURY_SUMMARY_INDEX] = "summaries_v1"
+    assert await exact_match_field(es, JURY_SUMMARY_INDEX, "event_id") == "event_id.keyword"
+
+
+async def test_exact_match_field_on_missing_index():
+    assert await exact_match_field(FakeElasticsearch(), "missing", "event_id") == "event_id"
+
+
+async def test_exact_match_field_on_dynamic_index_before_first_write():
+    es = FakeElasticsearch()
+    # Dynamic mapping will map the field as text with a .keyword subfield
+    assert await exact_match_field(es, "missing", "user_id", dynamic=True) == "user_id.keyword"
+    await es.indices.create(index="entries")
+    assert await exact_match_field(es, "entries", "user_id", dynamic=True) == "user_id.keyword"
+    await es.indices.create(index="explicit", mappings={"properties": {"user_id": {"type": "keyword"}}})
+    assert await exact_match_field(es, "explicit", "user_id", dynamic=True) == "user_id"
+
+
+def test_retryable_errors():
+    assert is_retryable_error(ConnectionError("down"))
+    assert is_retryable_error(TransportError("connection reset"))
+    assert is_retryable_error(TimeoutError())
+    assert is_retryable_error(FakeApiError(429, "es_rejected_execution_exception"))
+    assert is_retryable_error(FakeApiError(503, "unavailable_shards_exception"))
+    assert not is_retryable_error(FakeApiError(400, "mapper_parsing_exception"))
+    assert not is_retryable_error(FakeApiError(409, "version_conflict_engine_exception"))
+    # Bugs and bad input are not retried just because they carry no status
+    assert not is_retryable_error(ValueError("bad document"))
+    assert not is_retryable_error(TypeError("not serializable"))
@@ -0,0 +1,77 @@
+"""Tests for parsing jury model reports."""
+
+import pytest
+
+from utils.jury_parsing import parse_faithfulness_rating, parse_jury_report, summarize_faithfulness
+
+
+@pytest.mark.parametrize(
+    "text, rating",
+    [
+        ("## Faithfulness Rating: 8/10", 8.0),
+        ("**Faithfulness:** 7 out of 10", 7.0),
+        ("Faithfulness Rating: 8.5/10", 8.5),
+        ("Faithfulness Rating (1-10): 8", 8.0),
+        ("Faithfulness (scale of 1-10): 7", 7.0),
+        ("I rate faithfulness on a 1-10 scale at 6", 6.0),
+        ("Overall faithfulness is 9.", 9.0),
+        ("**Faithfulness Rating: 9**", 9.0),
+        ("## Faithfulness Rating\n\n**8**", 8.0),
+        ("## Faithfulness Rating (1-10)\n\n7/10 - mostly accurate", 7.0),
+    ],
+)
+def test_rating_formats(text, rating):
+    assert parse_faithfulness_rating(text) == rating
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        # Scores that are not the faithfulness rating
+        "The notes report severity 9/10 and the entry says 6/10.",
+        "Severity: 9/10. No faithfulness score given.",
+        # Out of range or missing
+        "Faithfulness Rating: 0/10",
+        "## Faithfulness\nThe entry has 3 issues",
+        "",
+        None,
+    ],
+)
+def test_no_rating(text):
+    assert parse_faithfulness_rating(text) is None
+
+
+def test_other_scores_do_not_shadow_the_rating():
+    assert parse_faithfulness_rating("Severity 9/10 noted.\n\nFaithfulness: 6") == 6.0
+    assert parse_faithfulness_rating("Faithfulness: 7. Severity was 3/10") == 7.0
+
+
+def test_parse_jury_report_sections():
+    report = (
+        "## Missing/Misrepresented Information\n\n"
+        "**Missing:**\n- Onset after lunch\n- **Nausea** not recorded\n\n"
+        "**Correctly captured:**\n- Severity\n\n"
+        "## Faithfulness Rating: 7/10\n\n"
+        "## Summary of Discrepancies\n\nThe entry omits the trigger meal."
+    )
+    assert parse_jury_report(report) == {
+        "faithfulness_rating": 7.0,
+        "missing_info": ["Onset after lunch", "Nausea not recorded"],
+        "discrepancy_summary": "The entry omits the trigger meal.",
+    }
+
+
+def test_summarize_faithfulness_ignores_failed_and_unrated_models():
+    outputs = [
+        {"success": True, "faithfulness_rating": 6.0},
+        {"success": True, "faithfulness_rating": 9.0},
+        {"success": True, "faithfulness_rating": None},
+        {"success": False, "faithfulness_rating": 1.0},
+    ]
+    assert summarize_faithfulness(outputs) == {
+        "faithfulness_min": 6.0,
+        "faithfulness_max": 9.0,
+        "faithfulness_mean": 7.5,
+        "faithfulness_disagreement": 3.0,
+        "faithfulness_ratings_count": 2,
+    }
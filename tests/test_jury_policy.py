@@ -0,0 +1,49 @@
+"""Tests for the adaptive jury sampling policy."""
+
+import random
+
+import pytest
+
+from symptom_schema import SymptomEntry
+from utils.jury_policy import AdaptiveJuryPolicy
+
+
+def make_entry(severity: int, notes: str = "ate bread at lunch") -> SymptomEntry:
+    return SymptomEntry.model_validate(
+        {
+            "timestamp": "2025-09-01T12:00:00Z",
+            "symptom_details": {"symptom": "bloating", "severity": severity, "raw_notes": notes},
+        }
+    )
+
+
+@pytest.mark.parametrize("severities", [[5, 6], [7], list(range(1, 11))])
+def test_observed_rate_converges_to_risk_rate_with_tied_scores(severities):
+    policy = AdaptiveJuryPolicy(target_rate=0.2, explore_share=0.0, seed=1)
+    rng = random.Random(2)
+    selected = sum(
+        policy.should_review(make_entry(rng.choice(severities))) for _ in range(5000)
+    )
+    assert selected / 5000 == pytest.approx(policy.risk_rate, abs=0.02)
+
+
+def test_observed_rate_matches_target_with_exploration():
+    policy = AdaptiveJuryPolicy(target_rate=0.2, seed=3)
+    rng = random.Random(4)
+    for _ in range(5000):
+        policy.should_review(make_entry(rng.choice([4, 5, 6])))
+    assert policy.stats()["observed_rate"] == pytest.approx(0.2, abs=0.025)
+
+
+def test_riskier_entries_are_preferred():
+    policy = AdaptiveJuryPolicy(target_rate=0.2, explore_share=0.0, seed=5)
+    rng = random.Random(6)
+    low = high = 0
+    for _ in range(3000):
+        severity = rng.choice([1, 10])
+        if policy.should_review(make_entry(severity)):
+            if severity == 10:
+                high += 1
+            else:
+                low += 1
+    assert high > 10 * max(low, 1)
@@ -0,0 +1,35 @@
+"""Tests for the background jury job queue."""
+
+import asyncio
+
+from utils.jury_queue import JuryJobQueue
+
+
+def job(seconds: float):
+    async def run():
+        await asyncio.sleep(seconds)
+        return {"status": "jury_completed"}
+
+    return lambda: run()
+
+
+async def test_stop_drains_pending_jobs():
+    queue = JuryJobQueue(workers=1)
+    queue.submit("a", job(0.01))
+    queue.submit("b", job(0.01))
+    await queue.stop(drain=True, timeout=1)
+    assert queue.get_status("a")["status"] == "completed"
+    assert queue.get_status("b")["status"] == "completed"
+
+
+async def test_drain_timeout_fails_unfinished_jobs():
+    queue = JuryJobQueue(workers=1)
+    queue.submit("slow", job(5))
+    queue.submit("waiting", job(0.01))
+    await queue.stop(drain=True, timeout=0.05)
+    slow = queue.get_status("slow")
+    assert (slow["status"], slow["error"]) == ("failed", "Cancelled")
+    waiting = queue.get_status("waiting")
+    assert waiting["status"] == "failed"
+    assert waiting["finished_at"] is not None
+    assert queue.stats()["pending"] == 0
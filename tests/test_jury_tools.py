@@ -0,0 +1,131 @@
+"""Tests for the LLM jury pipeline, using fake Elasticsearch and Anthropic clients."""
+
+import time
+
+import pytest
+
+import jury_tools
+from tests.fakes import FakeAnthropic, FakeContext, FakeElasticsearch
+from utils.rate_limiter import JuryRateLimiter
+
+
+@pytest.fixture
+def jury(monkeypatch):
+    """Point jury_tools at fakes with a fresh cache and limiter."""
+    client = FakeAnthropic()
+    monkeypatch.setattr(jury_tools, "_anthropic_client", client)
+    monkeypatch.setattr(jury_tools, "_jury_cache", jury_tools.TTLCache(maxsize=100))
+    monkeypatch.setattr(
+        jury_tools,
+        "jury_rate_limiter",
+        JuryRateLimiter(max_concurrency=6, requests_per_minute=1e6, tokens_per_minute=1e9),
+    )
+    return client
+
+
+async def run_jury(es, notes="headache after lunch", event_id="event-1"):
+    return await jury_tools.llm_jury_compare_notes(
+        event_id, notes, {"symptom_details": {"symptom": "headache", "severity": 5}}, None, es
+    )
+
+
+async def test_limiter_wait_does_not_count_against_model_timeout(jury, monkeypatch):
+    # One call at a time: the third model queues for two model latencies,
+    # longer than the per-model deadline, but each call itself is fast enough
+    jury.latency = 0.15
+    monkeypatch.setattr(jury_tools, "JURY_MODEL_TIMEOUT_S", 0.25)
+    monkeypatch.setattr(
+        jury_tools,
+        "jury_rate_limiter",
+        JuryRateLimiter(max_concurrency=1, requests_per_minute=1e6, tokens_per_minute=1e9),
+    )
+    result = await run_jury(FakeElasticsearch())
+
+    assert result["status"] == "jury_completed"
+    assert result["successful_models_count"] == len(jury_tools.JURY_MODELS)
+    assert result["failed_models_count"] == 0
+
+
+async def test_slow_model_still_times_out(jury, monkeypatch):
+    slow_model = jury_tools.JURY_MODELS[0][0]
+    jury.latency = {slow_model: 1.0}
+    monkeypatch.setattr(jury_tools, "JURY_MODEL_TIMEOUT_S", 0.1)
+    result = await run_jury(FakeElasticsearch())
+
+    failed = [o for o in result["jury_outputs"] if not o["success"]]
+    assert [o["model_id"] for o in failed] == [slow_model]
+    assert failed[0]["error"].startswith("Timed out")
+
+
+async def test_failing_context_does_not_replace_the_model_error(jury, monkeypatch):
+    class GoneContext(FakeContext):
+        async def error(self, message):
+            raise RuntimeError("client disconnected")
+
+    slow_model = jury_tools.JURY_MODELS[0][0]
+    jury.latency = {slow_model: 1.0}
+    monkeypatch.setattr(jury_tools, "JURY_MODEL_TIMEOUT_S", 0.1)
+    result = await jury_tools.llm_jury_compare_notes(
+        "event-1", "headache after lunch", {"symptom_details": {"symptom": "headache"}},
+        GoneContext(), FakeElasticsearch(),
+    )
+
+    [failed] = [o for o in result["jury_outputs"] if not o["success"]]
+    assert failed["model_id"] == slow_model
+    assert failed["error"].startswith("Timed out")
+
+
+async def test_identical_entry_reuses_memoized_report(jury):
+    es = FakeElasticsearch()
+    first = await run_jury(es, event_id="event-1")
+    second = await run_jury(es, event_id="event-2")
+
+    assert second["cache_hit"] is True
+    assert len(jury.started) == len(jury_tools.JURY_MODELS)
+    assert second["jury_outputs"] == first["jury_outputs"]
+
+
+async def test_cache_size_zero_disables_memoization(jury, monkeypatch):
+    monkeypatch.setattr(jury_tools, "_jury_cache", None)
+    es = FakeElasticsearch()
+    await run_jury(es, event_id="event-1")
+    second = await run_jury(es, event_id="event-2")
+
+    assert not second.get("cache_hit")
+    assert len(jury.started) == 2 * len(jury_tools.JURY_MODELS)
+
+
+async def test_quorum_returns_early_and_attaches_late_results(jury, monkeypatch):
+    slow_model = jury_tools.JURY_MODELS[0][0]
+    jury.latency = {slow_model: 0.3}
+    monkeypatch.setattr(jury_tools, "JURY_QUORUM", 2)
+    es = FakeElasticsearch()
+
+    started = time.perf_counter()
+    result = await run_jury(es)
+    assert time.perf_counter() - started < 0.2
+    assert result["successful_models_count"] == 2
+    assert result["pending_models_count"] == 1
+    (stored,) = es.all_docs(jury_tools.JURY_SUMMARY_INDEX)
+    assert stored["pending_models_count"] == 1
+
+    await jury_tools.finish_late_jury_results()
+    (stored,) = es.all_docs(jury_tools.JURY_SUMMARY_INDEX)
+    assert stored["pending_models_count"] == 0
+    assert stored["successful_models_count"] == len(jury_tools.JURY_MODELS)
+    late = next(o for o in stored["jury_outputs"] if o["model_id"] == slow_model)
+    assert late["success"] and late["faithfulness_rating"] == 8
+    # Only a complete report is memoized
+    assert jury_tools._jury_cache.get(stored["content_hash"]) is not None
+
+
+async def test_incomplete_report_is_not_memoized(jury, monkeypatch):
+    slow_model = jury_tools.JURY_MODELS[0][0]
+    jury.latency = {slow_model: 1.0}
+    monkeypatch.setattr(jury_tools, "JURY_MODEL_TIMEOUT_S", 0.1)
+    es = FakeElasticsearch()
+    await run_jury(es, event_id="event-1")
+    second = await run_jury(es, event_id="event-2")
+
+    assert not second.get("cache_hit")
+    assert jury.started.count(slow_model) == 2
@@ -0,0 +1,68 @@
+"""Tests for jury prompt compaction and notes truncation."""
+
+import json
+
+import jury_tools
+from symptom_schema import SymptomEntry
+from utils.prompt_utils import compact_entry, truncate_to_tokens
+
+
+def test_compact_entry_drops_empty_fields_recursively():
+    entry = {
+        "user_id": None,
+        "tags": [],
+        "symptom_details": {
+            "symptom": "headache",
+            "cause": "",
+            "associated_symptoms": ["nausea", "", None],
+            "on_medication": False,
+            "length_minutes": 0,
+        },
+        "environmental": {"location": None, "environmental_factors": {}},
+    }
+    assert compact_entry(entry) == {
+        "symptom_details": {
+            "symptom": "headache",
+            "associated_symptoms": ["nausea"],
+            "on_medication": False,
+            "length_minutes": 0,
+        }
+    }
+
+
+def test_jury_prompt_is_smaller_than_the_full_entry():
+    entry = SymptomEntry.model_validate(
+        {
+            "timestamp": "2025-09-01T08:00:00Z",
+            "symptom_details": {"symptom": "headache", "severity": 5, "raw_notes": "after lunch"},
+        }
+    ).model_dump(mode="json")
+    prompt = jury_tools.build_jury_prompt("after lunch", entry)
+    full = jury_tools.JURY_COMPARISON_PROMPT_TEMPLATE.format(
+        raw_notes="after lunch", structured_entry=json.dumps(entry, indent=2)
+    )
+    assert len(prompt) < len(full)
+    assert "null" not in prompt
+    assert '"severity":5' in prompt
+
+
+def test_short_text_is_not_truncated():
+    assert truncate_to_tokens("a" * 40, 10) == "a" * 40
+    assert truncate_to_tokens("a" * 400, 0) == "a" * 400
+    assert truncate_to_tokens(None, 10) is None
+
+
+def test_truncation_keeps_the_start_and_end_within_budget():
+    text = "".join(chr(ord("a") + n % 26) for n in range(1000))
+    truncated = truncate_to_tokens(text, 30)
+    # 30 tokens = 120 characters: two thirds from the start, the rest from the end
+    head, tail = truncated.split(" [... 880 characters truncated ...] ")
+    assert head == text[:80]
+    assert tail == text[-40:]
+
+
+def test_truncation_boundary():
+    assert truncate_to_tokens("x" * 120, 30) == "x" * 120
+    assert truncate_to_tokens("x" * 121, 30) == (
+        "x" * 80 + " [... 1 characters truncated ...] " + "x" * 40
+    )
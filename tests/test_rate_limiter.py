@@ -0,0 +1,70 @@
+"""Tests for the jury concurrency and rate limiter."""
+
+import asyncio
+import time
+
+from utils import rate_limiter
+from utils.rate_limiter import JuryRateLimiter, TokenBucket
+
+
+def test_token_bucket_refills_at_the_per_minute_rate(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: now[0])
+    bucket = TokenBucket(per_minute=60)
+
+    assert bucket.wait_time(60) == 0
+    bucket.consume(60)
+    assert bucket.wait_time(1) == 1.0
+    now[0] += 0.5
+    assert bucket.wait_time(1) == 0.5
+    # Requests larger than a minute's budget wait for a full bucket, not forever
+    assert bucket.wait_time(1000) == 59.5
+
+
+async def test_zero_per_minute_limits_mean_unlimited():
+    bucket = TokenBucket(per_minute=0)
+    bucket.consume(100)
+    assert bucket.wait_time(100) == 0
+
+    limiter = JuryRateLimiter(max_concurrency=2, requests_per_minute=0, tokens_per_minute=-1)
+    for _ in range(5):
+        async with limiter.acquire("model", 1000):
+            pass
+    assert limiter.metrics()["calls_started"] == 5
+
+
+async def test_concurrency_cap_across_models():
+    limiter = JuryRateLimiter(max_concurrency=2, requests_per_minute=1e6, tokens_per_minute=1e9)
+    active = peak = 0
+
+    async def call(model):
+        nonlocal active, peak
+        async with limiter.acquire(model, 10):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(call(f"model-{n % 3}") for n in range(9)))
+    assert peak == 2
+    assert limiter.metrics()["calls_started"] == 9
+    assert limiter.metrics()["in_flight"] == 0
+
+
+async def test_token_budget_paces_calls_per_model():
+    limiter = JuryRateLimiter(max_concurrency=6, requests_per_minute=1e6, tokens_per_minute=600)
+    async with limiter.acquire("model-a", 600):
+        pass
+
+    # Another model has its own budget
+    started = time.monotonic()
+    async with limiter.acquire("model-b", 600):
+        pass
+    assert time.monotonic() - started < 0.05
+
+    # model-a refills 10 tokens per second
+    started = time.monotonic()
+    async with limiter.acquire("model-a", 3):
+        pass
+    assert time.monotonic() - started >= 0.25
+    assert limiter.metrics()["max_wait_ms"] >= 250
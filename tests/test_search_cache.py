@@ -0,0 +1,127 @@
+"""Tests for the flexible_search result cache and its write-driven invalidation."""
+
+import asyncio
+
+import pytest
+
+from tests.fakes import FakeElasticsearch
+from tools.search_tools import flexible_search_impl, update_symptom_entry_impl
+from tools.symptom_tools import build_entry_dict, parse_entry, save_symptom_entry
+from utils.cache import SearchResultCache
+from utils.spool import EntrySpool
+
+INDEX = "symptom_entries"
+
+
+def entry(user_id="alice", symptom="headache", timestamp="2025-09-01T08:00:00Z"):
+    return build_entry_dict(symptom=symptom, severity=5, timestamp=timestamp, user_id=user_id)
+
+
+@pytest.fixture
+def es():
+    return FakeElasticsearch()
+
+
+@pytest.fixture
+def cache():
+    # No settle window, so results loaded right after a write are cached
+    return SearchResultCache(maxsize=100, ttl=60, settle_seconds=0)
+
+
+async def test_equivalent_queries_share_a_cache_entry(es, cache):
+    await es.index(index=INDEX, document=entry())
+    first = await flexible_search_impl(es, INDEX, {"symptom": "headache"}, cache)
+    second = await flexible_search_impl(
+        es, INDEX, {"symptom": " headache ", "limit": 20, "cause": "", "tags": []}, cache
+    )
+
+    assert second == first
+    assert es.calls["search"] == 1
+    assert cache.stats()["hits"] == 1
+
+
+async def test_save_invalidates_cached_searches(es, cache):
+    assert await flexible_search_impl(es, INDEX, {"user_id": "alice"}, cache) == []
+
+    saved = await save_symptom_entry(es, INDEX, parse_entry(entry()), 0, search_cache=cache)
+    assert saved["status"] == "saved"
+    results = await flexible_search_impl(es, INDEX, {"user_id": "alice"}, cache)
+
+    assert [r["user_id"] for r in results] == ["alice"]
+    assert es.calls["search"] == 2
+
+
+async def test_invalidation_keeps_other_users_searches(es, cache):
+    await flexible_search_impl(es, INDEX, {"user_id": "alice"}, cache)
+    await flexible_search_impl(es, INDEX, {"user_id": "bob"}, cache)
+    await flexible_search_impl(es, INDEX, {}, cache)
+
+    assert cache.invalidate(INDEX, user_id="alice") == 2
+    await flexible_search_impl(es, INDEX, {"user_id": "bob"}, cache)
+    assert es.calls["search"] == 3
+
+
+async def test_update_invalidates_cached_searches(es, cache):
+    doc_id = (await es.index(index=INDEX, document=entry()))["_id"]
+    await flexible_search_impl(es, INDEX, {"user_id": "alice"}, cache)
+
+    result = await update_symptom_entry_impl(es, INDEX, doc_id, severity=8, search_cache=cache)
+    assert result["status"] == "updated"
+    results = await flexible_search_impl(es, INDEX, {"user_id": "alice"}, cache)
+    assert [r["symptom_details"]["severity"] for r in results] == [8]
+
+
+async def test_load_racing_a_write_is_not_cached(es, cache):
+    await es.index(index=INDEX, document=entry())
+
+    async def load():
+        # A save lands while this search is in flight
+        cache.invalidate(INDEX, "alice")
+        return ["stale"]
+
+    assert await cache.get_or_load(INDEX, {"user_id": "alice"}, load) == ["stale"]
+    assert cache.get(INDEX, {"user_id": "alice"}) is None
+
+
+async def test_results_are_not_stored_while_the_index_settles(es):
+    cache = SearchResultCache(maxsize=100, ttl=60, settle_seconds=60)
+    cache.invalidate(INDEX, "alice")
+    await flexible_search_impl(es, INDEX, {"user_id": "alice"}, cache)
+    await flexible_search_impl(es, INDEX, {"user_id": "alice"}, cache)
+    assert es.calls["search"] == 2
+
+
+async def test_concurrent_misses_share_one_search(es, cache):
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [{"event_id": "a"}]
+
+    results = await asyncio.gather(*(cache.get_or_load(INDEX, {}, load) for _ in range(5)))
+    assert calls == 1
+    assert all(r == [{"event_id": "a"}] for r in results)
+    assert cache.stats()["coalesced"] == 4
+
+
+async def test_failed_search_is_not_cached(es, cache):
+    es.fail_requests = True
+    with pytest.raises(ConnectionError):
+        await flexible_search_impl(es, INDEX, {}, cache)
+    es.fail_requests = False
+    assert await flexible_search_impl(es, INDEX, {}, cache) == []
+    assert cache.stats()["size"] == 1
+
+
+async def test_spool_replay_invalidates_cached_searches(es, cache, tmp_path):
+    spool = EntrySpool(str(tmp_path / "spool.log"), es, search_cache=cache)
+    es.fail_requests = True
+    result = await save_symptom_entry(es, INDEX, parse_entry(entry()), 0, spool=spool)
+    assert result["status"] == "spooled"
+    es.fail_requests = False
+    assert await flexible_search_impl(es, INDEX, {"user_id": "alice"}, cache) == []
+
+    await spool.replay_once()
+    assert len(await flexible_search_impl(es, INDEX, {"user_id": "alice"}, cache)) == 1
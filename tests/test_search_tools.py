@@ -0,0 +1,299 @@
+"""Tests for flexible_search paging and batching against the fake Elasticsearch."""
+
+import pytest
+
+from tests.fakes import DYNAMIC_STRING_MAPPING, FakeApiError, FakeElasticsearch
+from tools.search_tools import (
+    MAX_BATCH_QUERIES,
+    RAW_NOTES_FIELD,
+    SEARCH_FILTER_PATH,
+    _encode_cursor,
+    _msearch_body,
+    build_search_query,
+    flexible_search_batch_impl,
+    flexible_search_impl,
+    flexible_search_page_impl,
+    get_incomplete_symptoms_impl,
+    hit_to_entry,
+    round_date_bound,
+    search_response_options,
+)
+from utils.cache import MAX_SEARCH_LIMIT, SearchResultCache, normalize_search_query
+from utils.es_utils import exact_match_field
+
+INDEX = "symptom_entries"
+
+
+def entry(day: int, symptom="headache", user_id="alice"):
+    return {
+        "timestamp": f"2025-09-{day:02d}T08:00:00Z",
+        "user_id": user_id,
+        "symptom_details": {"symptom": symptom, "severity": 5},
+    }
+
+
+@pytest.fixture
+async def es():
+    es = FakeElasticsearch()
+    for day in range(1, 6):
+        await es.index(index=INDEX, document=entry(day))
+    return es
+
+
+def days(results):
+    return [int(r["timestamp"][8:10]) for r in results]
+
+
+async def test_pages_cover_results_newest_first_without_overlap(es):
+    page = await flexible_search_page_impl(es, INDEX, query={"limit": 2})
+    seen = [days(page["results"])]
+    while page["has_more"]:
+        page = await flexible_search_page_impl(es, INDEX, cursor=page["next_cursor"])
+        seen.append(days(page["results"]))
+
+    assert seen == [[5, 4], [3, 2], [1]]
+    assert page["next_cursor"] is None
+    assert es.calls["open_point_in_time"] == 1
+    assert es.calls["close_point_in_time"] == 1
+
+
+async def test_entries_saved_while_paging_do_not_shift_pages(es):
+    page = await flexible_search_page_impl(es, INDEX, query={"limit": 2})
+    await es.index(index=INDEX, document=entry(30))
+    page = await flexible_search_page_impl(es, INDEX, cursor=page["next_cursor"])
+    assert days(page["results"]) == [3, 2]
+
+
+async def test_cursor_keeps_the_first_page_filters(es):
+    await es.index(index=INDEX, document=entry(6, symptom="bloating"))
+    page = await flexible_search_page_impl(es, INDEX, query={"symptom": "headache", "limit": 4})
+    page = await flexible_search_page_impl(es, INDEX, cursor=page["next_cursor"])
+    assert days(page["results"]) == [1]
+    assert not page["has_more"]
+
+
+async def test_expired_cursor(es):
+    page = await flexible_search_page_impl(es, INDEX, query={"limit": 2})
+    # The point in time outlived its keep_alive
+    es._pits.clear()
+    with pytest.raises(ValueError, match="expired"):
+        await flexible_search_page_impl(es, INDEX, cursor=page["next_cursor"])
+
+
+async def test_invalid_cursor(es):
+    with pytest.raises(ValueError, match="Invalid search cursor"):
+        await flexible_search_page_impl(es, INDEX, cursor="not-a-cursor")
+    with pytest.raises(ValueError, match="Invalid search cursor"):
+        await flexible_search_page_impl(es, INDEX, cursor=_encode_cursor({"pit_id": "x"}))
+    with pytest.raises(ValueError):
+        await flexible_search_page_impl(es, INDEX)
+
+
+@pytest.mark.parametrize("limit, expected", [(0, 1), (-5, 1), ("3", 3), (3.0, 3), (10**6, MAX_SEARCH_LIMIT)])
+def test_search_limit_is_clamped(limit, expected):
+    assert normalize_search_query({"limit": limit})["limit"] == expected
+
+
+@pytest.mark.parametrize("limit", ["ten", 2.5, True, [5]])
+async def test_bad_search_limit_is_rejected(es, limit):
+    with pytest.raises(ValueError, match="limit must be a whole number"):
+        await flexible_search_impl(es, INDEX, {"limit": limit})
+    with pytest.raises(ValueError, match="limit must be a whole number"):
+        await flexible_search_page_impl(es, INDEX, query={"limit": limit})
+    assert not es._pits
+
+
+async def test_zero_limit_page_returns_one_entry(es):
+    page = await flexible_search_page_impl(es, INDEX, query={"limit": 0})
+    assert days(page["results"]) == [5]
+    page = await flexible_search_page_impl(es, INDEX, cursor=page["next_cursor"])
+    assert days(page["results"]) == [4]
+
+
+async def test_batch_runs_queries_in_one_msearch(es):
+    await es.index(index=INDEX, document=entry(6, symptom="bloating"))
+    resp = await flexible_search_batch_impl(
+        es,
+        INDEX,
+        [{"label": "headaches", "symptom": "headache", "limit": 2}, {"symptom": "bloating"}],
+    )
+
+    assert list(resp["results"]) == ["headaches", "1"]
+    assert days(resp["results"]["headaches"]) == [5, 4]
+    assert days(resp["results"]["1"]) == [6]
+    assert resp["errors"] == {}
+    assert es.calls["msearch"] == 1
+
+
+async def test_batch_matches_single_searches(es):
+    queries = [{"symptom": "headache", "start_time": "2025-09-02", "end_time": "2025-09-04"}]
+    resp = await flexible_search_batch_impl(es, INDEX, queries)
+    assert resp["results"]["0"] == await flexible_search_impl(es, INDEX, queries[0])
+
+
+async def test_batch_reports_failed_queries_by_label(es):
+    def reject_bloating(query):
+        if "bloating" in str(query):
+            return FakeApiError(400, "search_phase_execution_exception", "bad query")
+        return None
+
+    es.search_error = reject_bloating
+    resp = await flexible_search_batch_impl(
+        es, INDEX, [{"label": "ok", "symptom": "headache"}, {"label": "bad", "symptom": "bloating"}]
+    )
+    assert len(resp["results"]["ok"]) == 5
+    assert "bad query" in resp["errors"]["bad"]
+
+
+async def test_batch_uses_and_fills_the_search_cache(es):
+    cache = SearchResultCache(settle_seconds=0)
+    await flexible_search_impl(es, INDEX, {"symptom": "headache"}, cache)
+    resp = await flexible_search_batch_impl(
+        es, INDEX, [{"symptom": "headache"}, {"user_id": "alice"}], cache
+    )
+    assert len(resp["results"]["0"]) == len(resp["results"]["1"]) == 5
+    assert es.calls["msearch"] == 1
+
+    await flexible_search_batch_impl(es, INDEX, [{"symptom": "headache"}, {"user_id": "alice"}], cache)
+    assert es.calls["msearch"] == 1
+
+
+async def test_batch_rejects_bad_requests(es):
+    with pytest.raises(ValueError):
+        await flexible_search_batch_impl(es, INDEX, [])
+    with pytest.raises(ValueError):
+        await flexible_search_batch_impl(es, INDEX, [{}] * (MAX_BATCH_QUERIES + 1))
+    with pytest.raises(ValueError, match="Duplicate"):
+        await flexible_search_batch_impl(es, INDEX, [{"label": "a"}, {"label": "a"}])
+
+
+async def test_user_id_filter_on_dynamic_mapping():
+    es = FakeElasticsearch()
+    await es.indices.create(index=INDEX, mappings={"properties": {"user_id": DYNAMIC_STRING_MAPPING}})
+    await es.index(index=INDEX, document=entry(1, user_id="Alice-42"))
+    query = {"user_id": "Alice-42"}
+
+    # A term on the analyzed text field misses the mixed-case ID
+    assert await flexible_search_impl(es, INDEX, query) == []
+    field = await exact_match_field(es, INDEX, "user_id", dynamic=True)
+    assert field == "user_id.keyword"
+    assert days(await flexible_search_impl(es, INDEX, query, user_id_field=field)) == [1]
+    batch = await flexible_search_batch_impl(es, INDEX, [query], user_id_field=field)
+    assert days(batch["results"]["0"]) == [1]
+    page = await flexible_search_page_impl(es, INDEX, query=query, user_id_field=field)
+    assert days(page["results"]) == [1]
+
+
+def test_response_options_always_filter_the_response():
+    assert search_response_options(normalize_search_query({})) == {"filter_path": SEARCH_FILTER_PATH}
+
+
+def test_fields_limit_the_source():
+    query = normalize_search_query({"fields": "timestamp, symptom_details.symptom"})
+    options = search_response_options(query)
+    assert options["source_includes"] == ["symptom_details.symptom", "timestamp"]
+    assert "highlight" not in options
+
+
+def test_snippets_replace_raw_notes_with_highlights():
+    query = normalize_search_query({"notes_query": "bread", "snippets": True})
+    options = search_response_options(query)
+    assert options["source_excludes"] == [RAW_NOTES_FIELD]
+    highlight = options["highlight"]["fields"][RAW_NOTES_FIELD]
+    # no_match_size returns the opening of the notes when nothing matched
+    assert highlight["no_match_size"] == highlight["fragment_size"]
+
+    def hit():
+        return {
+            "_source": {"symptom_details": {"symptom": "bloating"}},
+            "highlight": {RAW_NOTES_FIELD: ["ate **bread** at lunch"]},
+        }
+
+    assert hit_to_entry(hit(), query)["snippets"] == ["ate **bread** at lunch"]
+    assert hit_to_entry({"_source": {}}, query)["snippets"] == []
+    assert "snippets" not in hit_to_entry(hit(), normalize_search_query({}))
+
+
+def test_msearch_body_carries_the_same_options():
+    query = normalize_search_query({"fields": ["timestamp"], "snippets": True, "limit": 5})
+    body = _msearch_body(query)
+    options = search_response_options(query)
+    assert body["size"] == 5
+    assert body["_source"] == {"includes": ["timestamp"], "excludes": [RAW_NOTES_FIELD]}
+    assert body["highlight"] == options["highlight"]
+
+
+async def test_search_sends_the_response_options(es):
+    sent = []
+    search = es.search
+
+    async def recording_search(**kwargs):
+        sent.append(kwargs)
+        return await search(**kwargs)
+
+    es.search = recording_search
+    await flexible_search_impl(es, INDEX, {"fields": ["timestamp"], "snippets": True})
+    [kwargs] = sent
+    assert kwargs["filter_path"] == SEARCH_FILTER_PATH
+    assert kwargs["source_includes"] == ["timestamp"]
+    assert kwargs["source_excludes"] == [RAW_NOTES_FIELD]
+    assert RAW_NOTES_FIELD in kwargs["highlight"]["fields"]
+
+
+def test_exact_conditions_are_filters_and_text_matches_are_scored():
+    query = build_search_query(
+        {
+            "symptom": "headache",
+            "notes_query": "bread",
+            "on_medication": False,
+            "user_id": "alice",
+            "start_time": "2025-08-01",
+            "end_time": "2025-08-31T12:00:00Z",
+        }
+    )
+    assert [list(clause["match"]) for clause in query["bool"]["must"]] == [
+        ["symptom_details.symptom"],
+        ["symptom_details.raw_notes"],
+    ]
+    assert query["bool"]["filter"] == [
+        {"term": {"symptom_details.on_medication": False}},
+        {"term": {"user_id": "alice"}},
+        {"range": {"timestamp": {"gte": "2025-08-01||/d", "lte": "2025-08-31T12:00:00Z"}}},
+    ]
+
+
+def test_filter_only_query_is_not_scored():
+    query = build_search_query({"user_id": "alice", "end_time": "2025-08-31"})
+    assert "must" not in query["bool"]
+    assert query["bool"]["filter"][1] == {"range": {"timestamp": {"lte": "2025-08-31||/d"}}}
+    assert build_search_query({"limit": 20}) == {"match_all": {}}
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2025-08-31", "2025-08-31||/d"),
+        ("2025-08-31T23:00:00Z", "2025-08-31T23:00:00Z"),
+        ("now-7d", "now-7d"),
+        ("2025-8-31", "2025-8-31"),
+        (1756598400000, 1756598400000),
+    ],
+)
+def test_round_date_bound(value, expected):
+    assert round_date_bound(value) == expected
+
+
+async def test_incomplete_symptoms_filter_rounds_days_back():
+    es = FakeElasticsearch()
+    sent = []
+    search = es.search
+
+    async def recording_search(**kwargs):
+        sent.append(kwargs["query"])
+        return await search(**kwargs)
+
+    es.search = recording_search
+    await get_incomplete_symptoms_impl(es, INDEX, days_back=7)
+    [query] = sent
+    assert list(query["bool"]) == ["filter"]
+    assert query["bool"]["filter"][-1] == {"range": {"timestamp": {"gte": "now-7d/d"}}}
@@ -0,0 +1,79 @@
+"""Tests for the local write-ahead spool and its replay."""
+
+import pytest
+
+from tests.fakes import FakeApiError, FakeElasticsearch
+from utils.spool import EntrySpool, read_records
+
+INDEX = "symptom_entries"
+
+
+def doc(n: int) -> dict:
+    return {"user_id": "alice", "symptom_details": {"symptom": f"s{n}"}}
+
+
+@pytest.fixture
+def es():
+    return FakeElasticsearch()
+
+
+async def test_torn_tail_is_dropped_on_open(es, tmp_path):
+    path = tmp_path / "spool.log"
+    spool = EntrySpool(str(path), es)
+    await spool.append(INDEX, "a", doc(0))
+    with open(path, "ab") as f:
+        f.write(b"\x00\x00\x01\x00partial")
+
+    spool = EntrySpool(str(path), es)
+    await spool.append(INDEX, "b", doc(1))
+    records, _ = read_records(path)
+    assert [r["id"] for r in records] == ["a", "b"]
+
+
+async def test_outage_during_replay_keeps_records(es, tmp_path):
+    spool = EntrySpool(str(tmp_path / "spool.log"), es)
+    await spool.append(INDEX, "a", doc(0))
+    es.fail_requests = True
+    with pytest.raises(ConnectionError):
+        await spool.replay_once()
+    # Saves keep spooling into a fresh file while the rotated one waits
+    await spool.append(INDEX, "b", doc(1))
+
+    es.fail_requests = False
+    assert await spool.replay_once() == 1
+    assert await spool.replay_once() == 1
+    assert sorted(es.docs[INDEX]) == ["a", "b"]
+    assert spool.stats()["pending_bytes"] == 0
+
+
+async def test_failed_records_are_spooled_again(es, tmp_path):
+    spool = EntrySpool(str(tmp_path / "spool.log"), es)
+    await spool.append(INDEX, "a", doc(0))
+    await spool.append(INDEX, "b", doc(1))
+    es.bulk_item_error = lambda op_type, document: (
+        FakeApiError(429, "es_rejected_execution_exception") if document == doc(1) else None
+    )
+
+    assert await spool.replay_once() == 1
+    es.bulk_item_error = None
+    assert await spool.replay_once() == 1
+    assert sorted(es.docs[INDEX]) == ["a", "b"]
+    assert spool.replayed == 2
+
+
+async def test_permanent_failures_move_to_the_dead_letter_file(es, tmp_path, caplog):
+    spool = EntrySpool(str(tmp_path / "spool.log"), es)
+    await spool.append(INDEX, "a", doc(0))
+    await spool.append(INDEX, "b", doc(1))
+    es.bulk_item_error = lambda op_type, document: (
+        FakeApiError(400, "mapper_parsing_exception", "bad field") if document == doc(1) else None
+    )
+
+    assert await spool.replay_once() == 1
+    assert await spool.replay_once() == 0
+    (dead,) = read_records(spool.dead_letter_path)[0]
+    assert dead["id"] == "b"
+    assert "mapper_parsing_exception" in dead["error"]
+    assert spool.stats()["dead_lettered"] == 1
+    assert spool.stats()["pending_bytes"] == 0
+    assert "Moving spooled entry b" in caplog.text
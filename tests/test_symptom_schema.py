@@ -0,0 +1,68 @@
+"""Tests for SymptomDetails client-value normalization."""
+
+import pytest
+from pydantic import ValidationError
+
+from symptom_schema import SymptomDetails
+
+
+def details(**fields):
+    return SymptomDetails.model_validate({"symptom": "headache", "severity": 5, **fields})
+
+
+@pytest.mark.parametrize("value", ["none", " N/A ", "null", ""])
+def test_null_like_strings_become_none(value):
+    parsed = details(cause=value, onset_type=value)
+    assert parsed.cause is None
+    assert parsed.onset_type is None
+
+
+@pytest.mark.parametrize("value", ["none", None])
+def test_null_like_associated_symptoms_become_an_empty_list(value):
+    assert details(associated_symptoms=value).associated_symptoms == []
+
+
+def test_bare_associated_symptom_is_wrapped_in_a_list():
+    assert details(associated_symptoms="nausea").associated_symptoms == ["nausea"]
+
+
+def test_real_values_are_kept():
+    parsed = details(cause="gluten", associated_symptoms=["nausea", "fatigue"])
+    assert parsed.cause == "gluten"
+    assert parsed.associated_symptoms == ["nausea", "fatigue"]
+
+
+@pytest.mark.parametrize(
+    "fields, expected",
+    [
+        ({"description": "  Throbbing after lunch "}, "Throbbing after lunch"),
+        ({"notes": "from notes", "summary": "from summary"}, "from notes"),
+        ({"description": "   ", "context": "from context"}, "from context"),
+        ({"raw_notes": "n/a", "summary": "from summary"}, "from summary"),
+        ({"raw_notes": "own notes", "description": "ignored"}, "own notes"),
+        ({}, None),
+    ],
+)
+def test_raw_notes_fallback(fields, expected):
+    assert details(**fields).raw_notes == expected
+
+
+def test_string_values_are_coerced_to_field_types():
+    parsed = details(severity="7", length_minutes="45", on_medication="true", event_complete="no")
+    assert parsed.severity == 7
+    assert parsed.length_minutes == 45
+    assert parsed.on_medication is True
+    assert parsed.event_complete is False
+
+
+def test_invalid_values_still_fail_validation():
+    with pytest.raises(ValidationError):
+        details(severity="eleven")
+    with pytest.raises(ValidationError):
+        details(severity=11)
+
+
+def test_caller_input_is_not_mutated():
+    data = {"symptom": "headache", "severity": 5, "cause": "none", "notes": "from notes"}
+    SymptomDetails.model_validate(data)
+    assert data == {"symptom": "headache", "severity": 5, "cause": "none", "notes": "from notes"}
@@ -0,0 +1,266 @@
+"""Save-path tests: idempotent IDs, spooling and replay against the fake Elasticsearch."""
+
+import pytest
+
+from jury_tools import JURY_SUMMARY_INDEX
+from utils import cache as cache_module
+from tests.fakes import DYNAMIC_STRING_MAPPING, FakeApiError, FakeContext, FakeElasticsearch
+from tools.symptom_tools import (
+    build_entry_dict,
+    confirm_and_save_symptom_entries_impl,
+    confirm_symptom_entry_impl,
+    get_jury_status_impl,
+    parse_entry,
+    review_symptom_entry_impl,
+    save_symptom_entry,
+)
+from utils.cache import TTLCache
+from utils.es_utils import exact_match_field, get_jury_counter
+from utils.spool import EntrySpool
+
+INDEX = "symptom_entries"
+
+
+def entry(symptom="headache", severity=5, **extra):
+    return {"symptom": symptom, "severity": severity, "timestamp": "2025-09-01T08:00:00Z", **extra}
+
+
+@pytest.fixture
+def es():
+    return FakeElasticsearch()
+
+
+@pytest.fixture
+def spool(tmp_path, es):
+    return EntrySpool(str(tmp_path / "spool.log"), es, latency_budget_ms=50)
+
+
+async def test_idempotent_save_is_a_noop_on_retry(es):
+    parsed = parse_entry(build_entry_dict(**entry()))
+    first = await save_symptom_entry(es, INDEX, parsed, 0, idempotent=True)
+    second = await save_symptom_entry(es, INDEX, parsed, 0, idempotent=True)
+    assert first["status"] == second["status"] == "saved"
+    assert second["duplicate"] is True
+    assert second["event_id"] == first["event_id"]
+    assert len(es.all_docs(INDEX)) == 1
+
+
+async def test_timed_out_write_is_not_duplicated_on_replay(es, spool):
+    # The write lands in Elasticsearch but answers after the latency budget
+    es.index_delay = 0.2
+    parsed = parse_entry(build_entry_dict(**entry()))
+    result = await save_symptom_entry(es, INDEX, parsed, 0, idempotent=False, spool=spool)
+    assert result["status"] == "spooled"
+    assert len(es.all_docs(INDEX)) == 1
+
+    assert await spool.replay_once() == 1
+    assert len(es.all_docs(INDEX)) == 1
+    assert list(es.docs[INDEX]) == [result["event_id"]]
+
+
+async def test_spooled_save_replays_once_elasticsearch_recovers(es, spool):
+    es.fail_requests = True
+    parsed = parse_entry(build_entry_dict(**entry()))
+    result = await save_symptom_entry(es, INDEX, parsed, 0, spool=spool)
+    assert result["status"] == "spooled"
+
+    es.fail_requests = False
+    assert await spool.replay_once() == 1
+    assert await spool.replay_once() == 0
+    assert list(es.docs[INDEX]) == [result["event_id"]]
+
+
+async def test_mapping_error_is_not_spooled(es, spool):
+    parsed = parse_entry(build_entry_dict(**entry()))
+
+    async def reject(*_, **__):
+        raise FakeApiError(400, "mapper_parsing_exception", "bad field")
+
+    es.index = reject
+    ctx = FakeContext()
+    result = await save_symptom_entry(es, INDEX, parsed, 0, spool=spool, ctx=ctx)
+    assert result["status"] == "error"
+    assert spool.spooled == 0
+    assert ctx.errors == [f"Failed to save entry: {result['error']}"]
+
+
+async def test_bulk_save_spools_rejected_items(es, spool):
+    def reject_bloating(op_type, document):
+        if document["symptom_details"]["symptom"] == "bloating":
+            return FakeApiError(429, "es_rejected_execution_exception", "queue full")
+        return None
+
+    es.bulk_item_error = reject_bloating
+    result = await confirm_and_save_symptom_entries_impl(
+        es, INDEX, 0, [entry(), entry("bloating", 6)], spool=spool
+    )
+    saved, rejected = result["results"]
+    assert saved["status"] == "saved"
+    assert rejected["status"] == "spooled"
+    assert len(es.all_docs(INDEX)) == 1
+
+    es.bulk_item_error = None
+    assert await spool.replay_once() == 1
+    assert sorted(es.docs[INDEX]) == sorted([saved["event_id"], rejected["event_id"]])
+
+
+async def test_bulk_save_does_not_spool_invalid_items(es, spool):
+    es.bulk_item_error = lambda op_type, document: FakeApiError(400, "mapper_parsing_exception")
+    result = await confirm_and_save_symptom_entries_impl(es, INDEX, 0, [entry()], spool=spool)
+    assert result["results"][0]["status"] == "error"
+    assert spool.spooled == 0
+
+
+async def test_spooled_save_logs_to_context(es, spool):
+    es.fail_requests = True
+    ctx = FakeContext()
+    parsed = parse_entry(build_entry_dict(**entry()))
+    result = await save_symptom_entry(es, INDEX, parsed, 0, spool=spool, ctx=ctx)
+    assert ctx.errors == [f"Spooled entry {result['event_id']} for replay: {result['error']}"]
+
+
+class RecordingQueue:
+    """Jury queue stand-in that records which entries were submitted."""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, event_id, job):
+        self.submitted.append(event_id)
+        return True
+
+
+async def test_bulk_save_writes_the_batch_in_one_request(es):
+    entries = [entry(symptom) for symptom in ("headache", "bloating", "nausea")]
+    result = await confirm_and_save_symptom_entries_impl(es, INDEX, 0, entries)
+    assert result["status"] == "saved"
+    assert result["saved_count"] == 3
+    assert es.calls["bulk"] == 1
+    assert "index" not in es.calls
+    assert len(es.all_docs(INDEX)) == 3
+
+
+async def test_bulk_save_reports_item_failures_in_input_order(es):
+    es.bulk_item_error = lambda op_type, document: (
+        FakeApiError(400, "mapper_parsing_exception", "bad field")
+        if document["symptom_details"]["symptom"] == "bloating"
+        else None
+    )
+    entries = [entry(), entry("fatigue", 42), entry("bloating", 6), entry("nausea", 3)]
+    result = await confirm_and_save_symptom_entries_impl(es, INDEX, 0, entries)
+
+    assert result["status"] == "partial"
+    assert (result["saved_count"], result["error_count"]) == (2, 2)
+    assert [r["index"] for r in result["results"]] == [0, 1, 2, 3]
+    assert [r["status"] for r in result["results"]] == ["saved", "error", "error", "saved"]
+    assert "severity" in result["results"][1]["error"]
+    assert "bad field" in result["results"][2]["error"]
+    # The invalid entry never reached Elasticsearch
+    assert len(es.all_docs(INDEX)) == 2
+
+
+async def test_bulk_save_advances_the_jury_counter_by_the_saved_count(es):
+    es.bulk_item_error = lambda op_type, document: (
+        FakeApiError(400, "mapper_parsing_exception")
+        if document["symptom_details"]["symptom"] == "bloating"
+        else None
+    )
+    queue = RecordingQueue()
+    entries = [entry(), entry("bloating", 6), entry("nausea", 3), entry("fatigue", 4)]
+    result = await confirm_and_save_symptom_entries_impl(
+        es, INDEX, 2, entries, jury_queue=queue
+    )
+
+    assert await get_jury_counter(es) == 3
+    assert es.calls["update"] == 1
+    # Saved entries take counter positions 1..3 in input order; position 2 is due
+    assert queue.submitted == [result["results"][2]["event_id"]]
+    assert result["results"][2]["jury_queued"] is True
+
+
+async def test_invalid_review_logs_to_context():
+    ctx = FakeContext()
+    result = await review_symptom_entry_impl("headache", 42, "2025-09-01T08:00:00Z", ctx=ctx)
+    assert result["status"] == "error"
+    assert len(ctx.errors) == 1
+
+
+async def review(review_cache, **fields):
+    fields = {**entry(raw_notes="Headache after lunch"), **fields}
+    return await review_symptom_entry_impl(review_cache=review_cache, **fields)
+
+
+async def test_review_token_saves_the_reviewed_entry(es):
+    review_cache = TTLCache(ttl=60)
+    reviewed = await review(review_cache)
+    token = reviewed["review_token"]
+    assert review_cache.get(token).model_dump() == reviewed["entry"]
+
+    result = await confirm_symptom_entry_impl(es, INDEX, 0, review_cache, token)
+    assert result["status"] == "saved"
+    [doc] = es.all_docs(INDEX)
+    assert doc["symptom_details"]["raw_notes"] == "Headache after lunch"
+
+
+async def test_review_without_a_cache_issues_no_token():
+    reviewed = await review(None)
+    assert reviewed["status"] == "review"
+    assert "review_token" not in reviewed
+
+
+async def test_review_token_cannot_be_reused(es):
+    review_cache = TTLCache(ttl=60)
+    token = (await review(review_cache))["review_token"]
+    assert (await confirm_symptom_entry_impl(es, INDEX, 0, review_cache, token))["status"] == "saved"
+
+    ctx = FakeContext()
+    again = await confirm_symptom_entry_impl(es, INDEX, 0, review_cache, token, ctx=ctx)
+    assert again["status"] == "error"
+    assert "review_token" in again["error"]
+    assert ctx.errors == [again["error"]]
+    assert len(es.all_docs(INDEX)) == 1
+
+
+async def test_expired_review_token_is_rejected(es, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    review_cache = TTLCache(ttl=60)
+    token = (await review(review_cache))["review_token"]
+
+    now[0] += 61
+    result = await confirm_symptom_entry_impl(es, INDEX, 0, review_cache, token)
+    assert result["status"] == "error"
+    assert es.all_docs(INDEX) == []
+
+
+async def test_unknown_review_token_is_rejected(es):
+    result = await confirm_symptom_entry_impl(es, INDEX, 0, TTLCache(ttl=60), "not-a-token")
+    assert result == {
+        "status": "error",
+        "error": "Unknown or expired review_token; review the entry again",
+    }
+
+
+async def test_failed_confirm_keeps_the_token_for_a_retry(es):
+    review_cache = TTLCache(ttl=60)
+    token = (await review(review_cache))["review_token"]
+
+    async def reject(*_, **__):
+        raise FakeApiError(400, "mapper_parsing_exception", "bad field")
+
+    es.index = reject
+    assert (await confirm_symptom_entry_impl(es, INDEX, 0, review_cache, token))["status"] == "error"
+    assert review_cache.get(token) is not None
+
+
+async def test_jury_status_on_dynamic_summary_mapping(es):
+    await es.indices.create(
+        index=JURY_SUMMARY_INDEX, mappings={"properties": {"event_id": DYNAMIC_STRING_MAPPING}}
+    )
+    await es.index(index=JURY_SUMMARY_INDEX, document={"event_id": "Xk2-Lq9bR"})
+
+    missed = await get_jury_status_impl(es, None, "Xk2-Lq9bR")
+    assert missed["status"] == "not_found"
+    field = await exact_match_field(es, JURY_SUMMARY_INDEX, "event_id")
+    found = await get_jury_status_impl(es, None, "Xk2-Lq9bR", event_id_field=field)
+    assert found["status"] == "completed"
@@ -1,48 +1,143 @@
 """Search and retrieval tools for SymptomMinder MCP server."""
 
-from typing import Dict, Any, List
+import base64
+import json
+import re
+from typing import Dict, Any, List, Optional
 from fastmcp import Context
-from elasticsearch import AsyncElasticsearch
+from elasticsearch import AsyncElasticsearch, NotFoundError
+
+from utils.cache import SearchResultCache, normalize_search_query
+
+RAW_NOTES_FIELD = "symptom_details.raw_notes"
+DATE_ONLY_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+MAX_BATCH_QUERIES = 20  # queries accepted by one flexible_search_batch call
+SNIPPET_FRAGMENT_SIZE = 150  # characters per highlighted raw_notes fragment
+SNIPPET_FRAGMENTS = 3
+
+# Only the parts of a search response the tools read
+SEARCH_FILTER_PATH = [
+    "hits.hits._id",
+    "hits.hits._source",
+    "hits.hits.highlight",
+    "hits.hits.sort",
+    "pit_id",
+]
+# Each response keeps its status so empty results stay aligned with their query
+MSEARCH_FILTER_PATH = [
+    "responses.status",
+    "responses.hits.hits._id",
+    "responses.hits.hits._source",
+    "responses.hits.hits.highlight",
+    "responses.error.reason",
+    "responses.error.type",
+]
 
 
 async def flexible_search_impl(
-    es: AsyncElasticsearch, es_index: str, query: dict
+    es: AsyncElasticsearch,
+    es_index: str,
+    query: dict,
+    search_cache: SearchResultCache = None,
+    user_id_field: str = "user_id",
 ) -> List[dict]:
     """
     Implementation for flexible search of symptom entries.
 
     Accepts a query dict with search filters and returns matching entries.
+    When a search_cache is given, results are cached under the normalized
+    query and repeated searches skip Elasticsearch until a write to the index
+    invalidates them or they expire.
+
+    Args:
+        es: Elasticsearch client
+        es_index: Index name to search
+        query: Flat filter dict (see the flexible_search tool)
+        search_cache: Optional search result cache
+        user_id_field: Field to match user_id on (see exact_match_field)
+
+    Returns:
+        List of matching entries, most recent first
 
     Raises:
+        ValueError: If limit is not a whole number
         Exception: If Elasticsearch query fails
     """
+    query = normalize_search_query(query)
+    if search_cache is None:
+        return await _search_entries(es, es_index, query, user_id_field)
+    return await search_cache.get_or_load(
+        es_index, query, lambda: _search_entries(es, es_index, query, user_id_field)
+    )
+
+
+def round_date_bound(value: str) -> str:
+    """
+    Round a date-only range bound to whole days with date math.
+
+    "2025-08-31" becomes "2025-08-31||/d", which Elasticsearch rounds down to
+    the start of the day for gte and up to its end for lte, so an end date
+    includes that whole day and repeated date ranges produce identical,
+    reusable filter-cache entries. Values with a time part are kept as given.
+
+    Args:
+        value: Range bound from a flexible_search query
+
+    Returns:
+        Bound to send to Elasticsearch
+    """
+    if isinstance(value, str) and DATE_ONLY_PATTERN.match(value):
+        return f"{value}||/d"
+    return value
+
+
+def build_search_query(query: dict, user_id_field: str = "user_id") -> dict:
+    """
+    Translate a flat flexible_search filter dict into an Elasticsearch query.
+
+    Exact conditions (on_medication, user_id, the timestamp range) go in
+    filter context, where Elasticsearch skips scoring and caches them across
+    queries. Text matches stay in the scored must clause. A query with only
+    exact conditions is a pure filter and is not scored at all.
+
+    Args:
+        query: Normalized flexible_search filter dict
+        user_id_field: Field to match user_id on; user_id.keyword when the
+            index maps user_id as text (see exact_match_field)
+
+    Returns:
+        Elasticsearch query clause
+    """
     must_clauses = []
+    filter_clauses = []
     symptom = query.get("symptom")
     on_medication = query.get("on_medication")
     mediation_attempt = query.get("mediation_attempt")
     start_time = query.get("start_time")
     end_time = query.get("end_time")
     notes_query = query.get("notes_query")
-    limit = query.get("limit", 20)
+    user_id = query.get("user_id")
 
     # Use correct nested field paths
     if symptom:
         must_clauses.append({"match": {"symptom_details.symptom": symptom}})
     if on_medication is not None:
-        must_clauses.append(
+        filter_clauses.append(
             {"term": {"symptom_details.on_medication": on_medication}}
         )
     if mediation_attempt:
         must_clauses.append(
             {"match": {"symptom_details.mediation_attempt": mediation_attempt}}
         )
+    if user_id:
+        filter_clauses.append({"term": {user_id_field: user_id}})
     if start_time or end_time:
         range_query = {}
         if start_time:
-            range_query["gte"] = start_time
+            range_query["gte"] = round_date_bound(start_time)
         if end_time:
-            range_query["lte"] = end_time
-        must_clauses.append({"range": {"timestamp": range_query}})
+            range_query["lte"] = round_date_bound(end_time)
+        filter_clauses.append({"range": {"timestamp": range_query}})
     if notes_query:
         must_clauses.append(
             {
@@ -55,17 +150,284 @@ async def flexible_search_impl(
             }
         )
 
-    es_query = (
-        {"bool": {"must": must_clauses}} if must_clauses else {"match_all": {}}
-    )
+    if not must_clauses and not filter_clauses:
+        return {"match_all": {}}
+    bool_query = {}
+    if must_clauses:
+        bool_query["must"] = must_clauses
+    if filter_clauses:
+        bool_query["filter"] = filter_clauses
+    return {"bool": bool_query}
+
+
+def search_response_options(query: dict) -> Dict[str, Any]:
+    """
+    Build the es.search arguments that shape each hit for a flexible_search query.
+
+    A "fields" list limits _source to those field paths. "snippets" replaces
+    the full raw_notes with highlighted fragments (the opening of the notes
+    when nothing in them matched). Response metadata the tools don't read is
+    dropped with filter_path.
+
+    Args:
+        query: Normalized flexible_search filter dict
+
+    Returns:
+        Keyword arguments for es.search
+    """
+    options: Dict[str, Any] = {"filter_path": SEARCH_FILTER_PATH}
+    if query.get("fields"):
+        options["source_includes"] = query["fields"]
+    if query.get("snippets"):
+        options["source_excludes"] = [RAW_NOTES_FIELD]
+        options["highlight"] = {
+            "fields": {
+                RAW_NOTES_FIELD: {
+                    "fragment_size": SNIPPET_FRAGMENT_SIZE,
+                    "number_of_fragments": SNIPPET_FRAGMENTS,
+                    "no_match_size": SNIPPET_FRAGMENT_SIZE,
+                }
+            },
+            "pre_tags": ["**"],
+            "post_tags": ["**"],
+        }
+    return options
+
+
+def search_hits(resp: Any) -> List[dict]:
+    """Return the hits of a search response, which filter_path omits when empty."""
+    body = resp.body if hasattr(resp, "body") else resp
+    return body.get("hits", {}).get("hits", [])
+
+
+def hit_to_entry(hit: dict, query: dict) -> dict:
+    """
+    Build a flexible_search result from a search hit.
+
+    Args:
+        hit: Search hit
+        query: Normalized flexible_search filter dict
+
+    Returns:
+        The hit's (possibly projected) _source, plus raw_notes snippets in snippets mode
+    """
+    entry = hit.get("_source", {})
+    if query.get("snippets"):
+        entry["snippets"] = hit.get("highlight", {}).get(RAW_NOTES_FIELD, [])
+    return entry
+
+
+async def _search_entries(
+    es: AsyncElasticsearch, es_index: str, query: dict, user_id_field: str = "user_id"
+) -> List[dict]:
+    """Run a normalized flexible_search query against Elasticsearch."""
     resp = await es.search(
         index=es_index,
-        size=limit,
-        query=es_query,
+        size=query.get("limit", 20),
+        query=build_search_query(query, user_id_field),
         sort=[{"timestamp": {"order": "desc"}}],
+        **search_response_options(query),
     )
-    hits = resp["hits"]["hits"]
-    return [hit["_source"] for hit in hits]
+    return [hit_to_entry(hit, query) for hit in search_hits(resp)]
+
+
+def _msearch_body(query: dict, user_id_field: str = "user_id") -> Dict[str, Any]:
+    """Build the _msearch request body for a normalized flexible_search query."""
+    options = search_response_options(query)
+    body: Dict[str, Any] = {
+        "query": build_search_query(query, user_id_field),
+        "size": query.get("limit", 20),
+        "sort": [{"timestamp": {"order": "desc"}}],
+    }
+    source = {}
+    if "source_includes" in options:
+        source["includes"] = options["source_includes"]
+    if "source_excludes" in options:
+        source["excludes"] = options["source_excludes"]
+    if source:
+        body["_source"] = source
+    if "highlight" in options:
+        body["highlight"] = options["highlight"]
+    return body
+
+
+async def flexible_search_batch_impl(
+    es: AsyncElasticsearch,
+    es_index: str,
+    queries: List[dict],
+    search_cache: SearchResultCache = None,
+    user_id_field: str = "user_id",
+) -> Dict[str, Any]:
+    """
+    Implementation for running several flexible_search queries in one round trip.
+
+    Each query is the same flat filter dict flexible_search takes, plus an
+    optional "label" naming its results (default: its position, "0", "1",
+    ...). Queries answered by the search_cache skip Elasticsearch; the rest
+    are sent together in a single _msearch request and cached.
+
+    Args:
+        es: Elasticsearch client
+        es_index: Index name to search
+        queries: Flat filter dicts, each with an optional "label"
+        search_cache: Optional search result cache
+        user_id_field: Field to match user_id on (see exact_match_field)
+
+    Returns:
+        Dict with results (label -> list of matching entries, most recent
+        first) and errors (label -> error message for queries that failed)
+
+    Raises:
+        ValueError: If queries is empty, too long, has duplicate labels, or a
+            limit is not a whole number
+        Exception: If the _msearch request fails
+    """
+    if not queries:
+        raise ValueError("Provide at least one query")
+    if len(queries) > MAX_BATCH_QUERIES:
+        raise ValueError(f"At most {MAX_BATCH_QUERIES} queries can be batched")
+
+    labelled = {}
+    for position, item in enumerate(queries):
+        item = dict(item)
+        label = str(item.pop("label", position))
+        if label in labelled:
+            raise ValueError(f"Duplicate query label: {label}")
+        labelled[label] = normalize_search_query(item)
+
+    results: Dict[str, List[dict]] = {}
+    errors: Dict[str, str] = {}
+    misses = []
+    for label, query in labelled.items():
+        cached = search_cache.get(es_index, query) if search_cache is not None else None
+        if cached is not None:
+            results[label] = cached
+        else:
+            misses.append(label)
+
+    if misses:
+        generation = search_cache.generation(es_index) if search_cache is not None else 0
+        searches = []
+        for label in misses:
+            searches.append({})
+            searches.append(_msearch_body(labelled[label], user_id_field))
+        resp = await es.msearch(
+            index=es_index, searches=searches, filter_path=MSEARCH_FILTER_PATH
+        )
+        body = resp.body if hasattr(resp, "body") else resp
+        for label, item in zip(misses, body.get("responses", [])):
+            if "error" in item:
+                error = item["error"]
+                errors[label] = error.get("reason") or error.get("type") or str(error)
+                continue
+            query = labelled[label]
+            entries = [hit_to_entry(hit, query) for hit in search_hits(item)]
+            results[label] = entries
+            if search_cache is not None:
+                search_cache.put(es_index, query, entries, generation)
+
+    # Keep results in request order
+    return {
+        "results": {label: results[label] for label in labelled if label in results},
+        "errors": errors,
+    }
+
+
+def _encode_cursor(state: dict) -> str:
+    """Encode paging state as an opaque URL-safe cursor string."""
+    data = json.dumps(state, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> dict:
+    """Decode a cursor produced by _encode_cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded))
+        if not {"pit_id", "search_after", "query"} <= state.keys():
+            raise ValueError("missing fields")
+        state["query"] = normalize_search_query(state["query"])
+        return state
+    except Exception as e:
+        raise ValueError(f"Invalid search cursor: {e}") from e
+
+
+async def flexible_search_page_impl(
+    es: AsyncElasticsearch,
+    es_index: str,
+    query: dict = None,
+    cursor: str = None,
+    keep_alive: str = "2m",
+    user_id_field: str = "user_id",
+) -> Dict[str, Any]:
+    """
+    Implementation for paging through flexible_search results with a cursor.
+
+    The first call opens a point in time on the index and returns the first
+    page of the query, newest first. Each response carries an opaque
+    next_cursor that resumes with search_after on (timestamp, _shard_doc), so
+    every page costs the same however deep it is and pages never overlap or
+    skip entries saved in between. The point in time is closed after the last
+    page; an abandoned one expires after keep_alive.
+
+    Args:
+        es: Elasticsearch client
+        es_index: Index name to search
+        query: Flat filter dict for the first page; "limit" sets the page size
+        cursor: next_cursor from the previous page (the query is then taken from the cursor)
+        keep_alive: How long the point in time stays open between pages
+        user_id_field: Field to match user_id on (see exact_match_field)
+
+    Returns:
+        Dict with results, next_cursor (None after the last page) and has_more
+
+    Raises:
+        ValueError: If neither query nor cursor is given, limit is not a whole
+            number, the cursor is invalid, or it has expired
+        Exception: If Elasticsearch query fails
+    """
+    if cursor:
+        state = _decode_cursor(cursor)
+    elif query is not None:
+        query = normalize_search_query(query)
+        pit = await es.open_point_in_time(index=es_index, keep_alive=keep_alive)
+        state = {"pit_id": pit["id"], "search_after": None, "query": query}
+    else:
+        raise ValueError("Provide a query for the first page or a cursor for the next one")
+
+    page_size = state["query"].get("limit", 20)
+    try:
+        # One extra hit tells us whether another page exists without a second request
+        resp = await es.search(
+            pit={"id": state["pit_id"], "keep_alive": keep_alive},
+            size=page_size + 1,
+            query=build_search_query(state["query"], user_id_field),
+            sort=[{"timestamp": {"order": "desc"}}, {"_shard_doc": "desc"}],
+            search_after=state["search_after"],
+            **search_response_options(state["query"]),
+        )
+    except NotFoundError as e:
+        raise ValueError(
+            "Search cursor has expired; start again with the query"
+        ) from e
+
+    hits = search_hits(resp)
+    body = resp.body if hasattr(resp, "body") else resp
+    pit_id = body.get("pit_id", state["pit_id"])
+    has_more = len(hits) > page_size
+    hits = hits[:page_size]
+    next_cursor = None
+    if has_more and hits:
+        next_cursor = _encode_cursor(
+            {**state, "pit_id": pit_id, "search_after": hits[-1]["sort"]}
+        )
+    else:
+        await es.options(ignore_status=404).close_point_in_time(id=pit_id)
+    return {
+        "results": [hit_to_entry(hit, state["query"]) for hit in hits],
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+    }
 
 
 async def get_incomplete_symptoms_impl(
@@ -93,30 +455,28 @@ async def get_incomplete_symptoms_impl(
     """
     # Query for incomplete symptoms (false or null)
     # Should match where event_complete is NOT explicitly true
-    query = {
-        "bool": {
-            "should": [
-                {"term": {"symptom_details.event_complete": False}},
-                {
-                    "bool": {
-                        "must_not": {
-                            "exists": {"field": "symptom_details.event_complete"}
+    filter_clauses = [
+        {
+            "bool": {
+                "should": [
+                    {"term": {"symptom_details.event_complete": False}},
+                    {
+                        "bool": {
+                            "must_not": {
+                                "exists": {"field": "symptom_details.event_complete"}
+                            }
                         }
-                    }
-                },
-            ],
-            "minimum_should_match": 1,
+                    },
+                ],
+                "minimum_should_match": 1,
+            }
         }
-    }
+    ]
 
-    # Add time range if specified
+    # Add time range if specified, rounded to whole days so the filter is cacheable
     if days_back is not None:
-        from datetime import datetime, timedelta, timezone
-
-        cutoff_time = datetime.now(timezone.utc) - timedelta(days=days_back)
-        cutoff_iso = cutoff_time.isoformat()
-
-        query["bool"]["must"] = [{"range": {"timestamp": {"gte": cutoff_iso}}}]
+        filter_clauses.append({"range": {"timestamp": {"gte": f"now-{days_back}d/d"}}})
+    query = {"bool": {"filter": filter_clauses}}
 
     try:
         resp = await es.search(
@@ -136,7 +496,7 @@ async def get_incomplete_symptoms_impl(
         return results
     except Exception as e:
         if ctx:
-            ctx.error(f"Failed to get incomplete symptoms: {e}")
+            await ctx.error(f"Failed to get incomplete symptoms: {e}")
         raise
 
 
@@ -150,6 +510,7 @@ async def update_symptom_entry_impl(
     relief_factors: str = None,
     severity: int = None,
     tags: list[str] = None,
+    search_cache: SearchResultCache = None,
     ctx: Context = None,
 ) -> Dict[str, Any]:
     """
@@ -165,6 +526,7 @@ async def update_symptom_entry_impl(
         relief_factors: What helped relieve the symptom
         severity: Updated severity
         tags: Updated tags
+        search_cache: Optional search result cache, invalidated for the entry's index and user
         ctx: FastMCP context for logging
 
     Returns:
@@ -206,6 +568,8 @@ async def update_symptom_entry_impl(
 
         # Update the document in Elasticsearch
         resp = await es.index(index=es_index, id=event_id, document=doc)
+        if search_cache is not None:
+            search_cache.invalidate(es_index, doc.get("user_id"))
 
         return {
             "status": "updated",
@@ -222,5 +586,5 @@ async def update_symptom_entry_impl(
         }
     except Exception as e:
         if ctx:
-            ctx.error(f"Failed to update symptom entry: {e}")
+            await ctx.error(f"Failed to update symptom entry: {e}")
         raise
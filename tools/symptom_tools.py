@@ -1,17 +1,31 @@
 """Symptom entry tools for SymptomMinder MCP server."""
 
+import asyncio
+import secrets
 from typing import Dict, Any, List
 from fastmcp import Context
 from elasticsearch import AsyncElasticsearch
 
 from symptom_schema import SymptomEntry
-from utils.data_utils import clean_entry, ensure_raw_notes
-from utils.es_utils import get_es_response_id, increment_jury_counter
+from utils.bulk_indexer import BulkIndexer, BulkItemError, parse_bulk_item
+from utils.cache import SearchResultCache, TTLCache
+from utils.coverage import coverage_score, covered_enough
+from utils.data_utils import derive_entry_id
+from utils.es_utils import (
+    JuryCounterLease,
+    get_es_response_id,
+    increment_jury_counter,
+    is_conflict_error,
+    is_retryable_error,
+)
+from utils.jury_policy import AdaptiveJuryPolicy
+from utils.jury_queue import JuryJobQueue
 from utils.prompt_utils import generate_review_prompt
-from jury_tools import llm_jury_compare_notes
+from utils.spool import EntrySpool
+from jury_tools import JURY_SUMMARY_INDEX, llm_jury_compare_notes
 
 
-def review_symptom_entry_impl(
+def build_entry_dict(
     symptom: str,
     severity: int,
     timestamp: str,
@@ -30,54 +44,328 @@ def review_symptom_entry_impl(
     activity_context: str = None,
     tags: list[str] = None,
     user_id: str = None,
+) -> Dict[str, Any]:
+    """
+    Build a raw entry dict in SymptomEntry shape from flat tool parameters.
+
+    Returns:
+        Entry dict ready for cleaning and validation
+    """
+    entry = {
+        "timestamp": timestamp,
+        "user_id": user_id,
+        "symptom_details": {
+            "symptom": symptom,
+            "severity": severity,
+            "length_minutes": length_minutes,
+            "cause": cause,
+            "mediation_attempt": mediation_attempt,
+            "on_medication": on_medication,
+            "raw_notes": raw_notes,
+            "event_complete": event_complete,
+            "onset_type": onset_type,
+            "intensity_pattern": intensity_pattern,
+            "associated_symptoms": associated_symptoms,
+            "relief_factors": relief_factors,
+        },
+        "tags": tags,
+    }
+
+    # Add environmental if any environmental fields provided
+    if location or environmental_factors or activity_context:
+        entry["environmental"] = {
+            "location": location,
+            "environmental_factors": environmental_factors,
+            "activity_context": activity_context,
+        }
+    return entry
+
+
+def parse_entry(entry: Dict[str, Any]) -> SymptomEntry:
+    """
+    Normalize and validate a raw entry dict in a single pass.
+
+    Normalization happens in the SymptomDetails model validator, so the entry
+    is never deep-copied before validation. The entry's coverage_score is
+    computed from its raw notes and structured fields.
+
+    Args:
+        entry: Raw entry dict as built by build_entry_dict
+
+    Returns:
+        Validated SymptomEntry
+
+    Raises:
+        pydantic.ValidationError: If the entry is invalid
+    """
+    parsed = SymptomEntry.model_validate(entry)
+    parsed.coverage_score = coverage_score(parsed)
+    return parsed
+
+
+async def review_symptom_entry_impl(
+    symptom: str,
+    severity: int,
+    timestamp: str,
+    length_minutes: int = None,
+    cause: str = None,
+    mediation_attempt: str = None,
+    on_medication: bool = None,
+    raw_notes: str = None,
+    event_complete: bool = None,
+    onset_type: str = None,
+    intensity_pattern: str = None,
+    associated_symptoms: list[str] = None,
+    relief_factors: str = None,
+    location: str = None,
+    environmental_factors: dict = None,
+    activity_context: str = None,
+    tags: list[str] = None,
+    user_id: str = None,
+    review_cache: TTLCache = None,
     ctx: Context = None,
 ) -> Dict[str, Any]:
     """
     Implementation for reviewing a symptom entry before saving.
 
     Returns a review prompt for the symptom entry, do not save yet.
+    When a review_cache is given, the validated entry is cached and a short-lived
+    review_token is returned for use with confirm_symptom_entry_impl.
     """
     try:
-        # Build entry dict from parameters
-        entry = {
-            "timestamp": timestamp,
-            "user_id": user_id,
-            "symptom_details": {
-                "symptom": symptom,
-                "severity": severity,
-                "length_minutes": length_minutes,
-                "cause": cause,
-                "mediation_attempt": mediation_attempt,
-                "on_medication": on_medication,
-                "raw_notes": raw_notes,
-                "event_complete": event_complete,
-                "onset_type": onset_type,
-                "intensity_pattern": intensity_pattern,
-                "associated_symptoms": associated_symptoms,
-                "relief_factors": relief_factors,
-            },
-            "tags": tags,
+        entry = build_entry_dict(
+            symptom=symptom,
+            severity=severity,
+            timestamp=timestamp,
+            length_minutes=length_minutes,
+            cause=cause,
+            mediation_attempt=mediation_attempt,
+            on_medication=on_medication,
+            raw_notes=raw_notes,
+            event_complete=event_complete,
+            onset_type=onset_type,
+            intensity_pattern=intensity_pattern,
+            associated_symptoms=associated_symptoms,
+            relief_factors=relief_factors,
+            location=location,
+            environmental_factors=environmental_factors,
+            activity_context=activity_context,
+            tags=tags,
+            user_id=user_id,
+        )
+        parsed = parse_entry(entry)
+        prompt = generate_review_prompt(parsed)
+        result = {
+            "status": "review",
+            "review_prompt": prompt,
+            "entry": parsed.model_dump(),
         }
+        if review_cache is not None:
+            token = secrets.token_urlsafe(8)
+            review_cache.set(token, parsed)
+            result["review_token"] = token
+        return result
+    except Exception as e:
+        if ctx:
+            await ctx.error(f"Failed to generate review: {e}")
+        return {"status": "error", "error": str(e)}
+
+
+async def trigger_jury_review(
+    es: AsyncElasticsearch,
+    event_id: str,
+    parsed: SymptomEntry,
+    jury_queue: JuryJobQueue = None,
+    jury_policy: AdaptiveJuryPolicy = None,
+    ctx: Context = None,
+) -> Dict[str, bool]:
+    """
+    Queue (or run inline, without a queue) the jury review for a saved entry.
+
+    Jury failures are logged and never fail the save.
+
+    Args:
+        es: Elasticsearch client
+        event_id: Elasticsearch document ID of the saved entry
+        parsed: The saved entry
+        jury_queue: Optional background jury job queue
+        jury_policy: Optional adaptive policy that learns from the jury's ratings
+        ctx: FastMCP context for logging
+
+    Returns:
+        Dict with jury_reviewed and jury_queued flags
+    """
+    jury_reviewed = False
+    jury_queued = False
+    try:
+        if event_id:
+            raw_notes_val = (
+                parsed.symptom_details.raw_notes
+                if hasattr(parsed.symptom_details, "raw_notes")
+                else None
+            )
+            # Use mode='json' to serialize datetime objects to ISO format strings
+            structured_entry = parsed.model_dump(mode="json")
+
+            async def run_jury(jury_ctx: Context = None) -> dict:
+                result = await llm_jury_compare_notes(
+                    event_id, raw_notes_val, structured_entry, jury_ctx, es
+                )
+                if jury_policy is not None and result.get("status") == "jury_completed":
+                    jury_policy.record_faithfulness(
+                        parsed.user_id, result.get("faithfulness_mean")
+                    )
+                return result
+
+            if jury_queue is not None:
+                # Run jury review in background - results saved to ES.
+                # The request context is not passed since it ends with this call.
+                jury_queued = jury_queue.submit(event_id, run_jury)
+                if not jury_queued and ctx:
+                    await ctx.error(f"Jury queue full, skipped review for {event_id}")
+            else:
+                await run_jury(ctx)
+                jury_reviewed = True
+    except Exception as e:
+        jury_error = f"Failed to trigger jury tool: {str(e)}"
+        if ctx:
+            await ctx.error(jury_error)
+        # Don't fail the save if jury fails
+        jury_reviewed = False
+    return {"jury_reviewed": jury_reviewed, "jury_queued": jury_queued}
+
+
+async def save_symptom_entry(
+    es: AsyncElasticsearch,
+    es_index: str,
+    parsed: SymptomEntry,
+    jury_trigger_modulo: int,
+    jury_queue: JuryJobQueue = None,
+    jury_counter: JuryCounterLease = None,
+    bulk_indexer: BulkIndexer = None,
+    idempotent: bool = False,
+    spool: EntrySpool = None,
+    jury_policy: AdaptiveJuryPolicy = None,
+    precheck_threshold: float = 0,
+    search_cache: SearchResultCache = None,
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """
+    Save a validated symptom entry to Elasticsearch and trigger jury per modulo.
+
+    When a jury_queue is given, the jury review is queued and the save returns
+    as soon as the entry is indexed. Without one, the jury runs inline.
+    When a jury_counter lease is given, counter values come from leased blocks
+    instead of one atomic Elasticsearch update per save.
+    When a bulk_indexer is given, concurrent saves are coalesced into shared
+    _bulk requests; each caller still gets its own document ID or error.
+    When idempotent is True, the document ID is derived from the entry content
+    and written with create semantics, so a retried save is a no-op that
+    neither duplicates the document nor bumps the jury counter.
+    When a spool is given, a write that fails with a retryable error or
+    exceeds the spool's latency budget is appended to the local spool and
+    replayed later under its content-derived ID (status "spooled"); spooled
+    entries skip the jury. The live write then uses the same ID, so a write
+    that timed out but still reached Elasticsearch is not duplicated on replay.
+    When a jury_policy is given, it decides which saves go to the jury
+    instead of the counter modulo. Selected entries whose coverage_score meets
+    precheck_threshold skip the jury (jury_skipped "precheck").
+
+    Args:
+        es: Elasticsearch client
+        es_index: Index name
+        parsed: Validated symptom entry
+        jury_trigger_modulo: Run the jury on every Nth save (0 disables)
+        jury_queue: Optional background jury job queue
+        jury_counter: Optional leased jury counter
+        bulk_indexer: Optional write-coalescing bulk indexer
+        idempotent: Derive the document ID from content and use create semantics
+        spool: Optional local write-ahead spool for failed or slow writes
+        jury_policy: Optional adaptive jury policy used instead of the modulo
+        precheck_threshold: Skip the jury for entries with at least this coverage_score (0 disables)
+        search_cache: Optional search result cache, invalidated for the entry's index and user
+        ctx: FastMCP context for logging
 
-        # Add environmental if any environmental fields provided
-        if location or environmental_factors or activity_context:
-            entry["environmental"] = {
-                "location": location,
-                "environmental_factors": environmental_factors,
-                "activity_context": activity_context,
+    Returns:
+        Dict with save status, event_id and jury trigger details
+    """
+    try:
+        document = parsed.model_dump()
+        json_document = parsed.model_dump(mode="json")
+        # A spooled copy is replayed under the derived ID, so the live write must use it too
+        doc_id = derive_entry_id(json_document) if idempotent or spool is not None else None
+        op_type = "create" if idempotent else "index"
+        try:
+            if bulk_indexer is not None:
+                write = bulk_indexer.index(
+                    index=es_index, document=document, id=doc_id, op_type=op_type
+                )
+            else:
+                write = es.index(
+                    index=es_index, document=document, id=doc_id, op_type=op_type
+                )
+            if spool is not None and spool.latency_budget:
+                resp = await asyncio.wait_for(write, spool.latency_budget)
+            else:
+                resp = await write
+        except Exception as e:
+            if idempotent and is_conflict_error(e):
+                # Retried save of an entry that already exists
+                return {
+                    "status": "saved",
+                    "event_id": doc_id,
+                    "duplicate": True,
+                    "jury_reviewed": False,
+                    "jury_queued": False,
+                }
+            if spool is None or not is_retryable_error(e):
+                raise
+            # Elasticsearch failed or was over budget: keep a durable copy for replay
+            error = str(e) or "Elasticsearch write exceeded latency budget"
+            await spool.append(es_index, doc_id, json_document)
+            if ctx:
+                await ctx.error(f"Spooled entry {doc_id} for replay: {error}")
+            return {
+                "status": "spooled",
+                "event_id": doc_id,
+                "duplicate": False,
+                "jury_reviewed": False,
+                "jury_queued": False,
+                "error": error,
             }
 
-        entry = clean_entry(entry)
-        parsed = SymptomEntry(**entry)
-        prompt = generate_review_prompt(parsed)
+        if search_cache is not None:
+            search_cache.invalidate(es_index, parsed.user_id)
+
+        # Jury trigger logic with persistent counter
+        if jury_counter is not None:
+            jury_trigger_count = await jury_counter.increment(es)
+        else:
+            jury_trigger_count = await increment_jury_counter(es)
+        event_id = get_es_response_id(resp)
+        jury = {"jury_reviewed": False, "jury_queued": False}
+
+        if jury_policy is not None:
+            run_jury = jury_policy.should_review(parsed)
+        else:
+            run_jury = jury_trigger_modulo and jury_trigger_count % jury_trigger_modulo == 0
+        if run_jury and covered_enough(parsed, precheck_threshold):
+            jury["jury_skipped"] = "precheck"
+        elif run_jury:
+            jury = await trigger_jury_review(
+                es, event_id, parsed, jury_queue, jury_policy, ctx
+            )
+
         return {
-            "status": "review",
-            "review_prompt": prompt,
-            "entry": parsed.model_dump(),
+            "status": "saved",
+            "event_id": event_id,
+            "duplicate": False,
+            "entry": resp.body if hasattr(resp, "body") else resp,
+            **jury,
         }
     except Exception as e:
         if ctx:
-            ctx.error(f"Failed to generate review: {e}")
+            await ctx.error(f"Failed to save entry: {e}")
         return {"status": "error", "error": str(e)}
 
 
@@ -103,81 +391,353 @@ async def confirm_and_save_symptom_entry_impl(
     activity_context: str = None,
     tags: list[str] = None,
     user_id: str = None,
+    jury_queue: JuryJobQueue = None,
+    jury_counter: JuryCounterLease = None,
+    bulk_indexer: BulkIndexer = None,
+    idempotent: bool = False,
+    spool: EntrySpool = None,
+    jury_policy: AdaptiveJuryPolicy = None,
+    precheck_threshold: float = 0,
+    search_cache: SearchResultCache = None,
     ctx: Context = None,
 ) -> Dict[str, Any]:
     """
     Implementation for saving a confirmed symptom entry to Elasticsearch.
+
+    Builds and validates the entry from flat parameters, then saves it with
+    save_symptom_entry.
     """
     try:
-        # Build entry dict from parameters
-        entry = {
-            "timestamp": timestamp,
-            "user_id": user_id,
-            "symptom_details": {
-                "symptom": symptom,
-                "severity": severity,
-                "length_minutes": length_minutes,
-                "cause": cause,
-                "mediation_attempt": mediation_attempt,
-                "on_medication": on_medication,
-                "raw_notes": raw_notes,
-                "event_complete": event_complete,
-                "onset_type": onset_type,
-                "intensity_pattern": intensity_pattern,
-                "associated_symptoms": associated_symptoms,
-                "relief_factors": relief_factors,
-            },
-            "tags": tags,
-        }
+        entry = build_entry_dict(
+            symptom=symptom,
+            severity=severity,
+            timestamp=timestamp,
+            length_minutes=length_minutes,
+            cause=cause,
+            mediation_attempt=mediation_attempt,
+            on_medication=on_medication,
+            raw_notes=raw_notes,
+            event_complete=event_complete,
+            onset_type=onset_type,
+            intensity_pattern=intensity_pattern,
+            associated_symptoms=associated_symptoms,
+            relief_factors=relief_factors,
+            location=location,
+            environmental_factors=environmental_factors,
+            activity_context=activity_context,
+            tags=tags,
+            user_id=user_id,
+        )
+        parsed = parse_entry(entry)
+    except Exception as e:
+        if ctx:
+            await ctx.error(f"Failed to save entry: {e}")
+        return {"status": "error", "error": str(e)}
 
-        # Add environmental if any environmental fields provided
-        if location or environmental_factors or activity_context:
-            entry["environmental"] = {
-                "location": location,
-                "environmental_factors": environmental_factors,
-                "activity_context": activity_context,
-            }
+    return await save_symptom_entry(
+        es=es,
+        es_index=es_index,
+        parsed=parsed,
+        jury_trigger_modulo=jury_trigger_modulo,
+        jury_queue=jury_queue,
+        jury_counter=jury_counter,
+        bulk_indexer=bulk_indexer,
+        idempotent=idempotent,
+        spool=spool,
+        jury_policy=jury_policy,
+        precheck_threshold=precheck_threshold,
+        search_cache=search_cache,
+        ctx=ctx,
+    )
 
-        entry = clean_entry(entry)
-        entry = ensure_raw_notes(entry)
-        parsed = SymptomEntry(**entry)
-        resp = await es.index(index=es_index, document=parsed.model_dump())
 
-        # Jury trigger logic with persistent counter
-        jury_trigger_count = await increment_jury_counter(es)
-        jury_reviewed = False
+async def confirm_and_save_symptom_entries_impl(
+    es: AsyncElasticsearch,
+    es_index: str,
+    jury_trigger_modulo: int,
+    entries: List[Dict[str, Any]],
+    jury_queue: JuryJobQueue = None,
+    jury_counter: JuryCounterLease = None,
+    idempotent: bool = False,
+    spool: EntrySpool = None,
+    jury_policy: AdaptiveJuryPolicy = None,
+    precheck_threshold: float = 0,
+    search_cache: SearchResultCache = None,
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """
+    Implementation for saving several confirmed symptom entries in one call.
 
-        if jury_trigger_modulo and (jury_trigger_count % jury_trigger_modulo == 0):
-            try:
-                # Extract event_id from Elasticsearch response
-                event_id = get_es_response_id(resp)
+    Validates every entry, writes the valid ones with a single _bulk request,
+    increments the jury counter once for the whole batch and triggers the jury
+    for each saved entry whose counter position matches the modulo (or that
+    the jury_policy selects). When a spool is given, document IDs are derived
+    from content, and the valid entries are spooled if the _bulk request fails;
+    items rejected with a retryable error (e.g. 429 es_rejected_execution_exception)
+    are spooled individually.
 
-                if event_id:
-                    raw_notes_val = (
-                        parsed.symptom_details.raw_notes
-                        if hasattr(parsed.symptom_details, "raw_notes")
-                        else None
-                    )
-                    # Use mode='json' to serialize datetime objects to ISO format strings
-                    structured_entry = parsed.model_dump(mode="json")
-                    # Run jury review in background - results saved to ES
-                    await llm_jury_compare_notes(
-                        event_id, raw_notes_val, structured_entry, ctx, es
+    Args:
+        es: Elasticsearch client
+        es_index: Index name
+        jury_trigger_modulo: Run the jury on every Nth save (0 disables)
+        entries: Flat entry dicts using the confirm_and_save_symptom_entry parameters
+        jury_queue: Optional background jury job queue
+        jury_counter: Optional leased jury counter
+        idempotent: Derive document IDs from content and use create semantics
+        spool: Optional local write-ahead spool for failed _bulk requests and retryable item failures
+        jury_policy: Optional adaptive jury policy used instead of the modulo
+        precheck_threshold: Skip the jury for entries with at least this coverage_score (0 disables)
+        search_cache: Optional search result cache, invalidated for the entry's index and user
+        ctx: FastMCP context for logging
+
+    Returns:
+        Dict with overall status, saved/error counts and per-item results in input order
+    """
+    results: List[Dict[str, Any]] = []
+    pending = []  # (result, parsed) for entries that passed validation
+    operations = []
+    op_type = "create" if idempotent else "index"
+
+    for i, item in enumerate(entries):
+        result = {"index": i, "status": "error", "event_id": None}
+        results.append(result)
+        try:
+            parsed = parse_entry(build_entry_dict(**item))
+        except Exception as e:
+            result["error"] = str(e)
+            continue
+        action = {"_index": es_index}
+        if idempotent or spool is not None:
+            action["_id"] = derive_entry_id(parsed.model_dump(mode="json"))
+        operations.append({op_type: action})
+        operations.append(parsed.model_dump())
+        pending.append((result, parsed))
+
+    saved = []  # (result, parsed) for newly written entries
+    if pending:
+        try:
+            resp = await es.bulk(operations=operations)
+            for (result, parsed), item in zip(pending, resp["items"]):
+                try:
+                    item_result = parse_bulk_item(item)
+                    result.update(status="saved", event_id=item_result.get("_id"), duplicate=False)
+                    saved.append((result, parsed))
+                except BulkItemError as e:
+                    if idempotent and is_conflict_error(e):
+                        # Retried save of an entry that already exists
+                        result.update(status="saved", event_id=e.doc_id, duplicate=True)
+                        continue
+                    result["error"] = str(e)
+                    if spool is not None and is_retryable_error(e):
+                        json_document = parsed.model_dump(mode="json")
+                        spool_id = derive_entry_id(json_document)
+                        await spool.append(es_index, spool_id, json_document)
+                        result.update(status="spooled", event_id=spool_id)
+        except Exception as e:
+            if ctx:
+                await ctx.error(f"Failed to save entries: {e}")
+            for result, parsed in pending:
+                result["error"] = str(e)
+                if spool is not None and is_retryable_error(e):
+                    json_document = parsed.model_dump(mode="json")
+                    spool_id = derive_entry_id(json_document)
+                    await spool.append(es_index, spool_id, json_document)
+                    result.update(status="spooled", event_id=spool_id)
+
+    if saved and search_cache is not None:
+        for user_id in {parsed.user_id for _, parsed in saved}:
+            search_cache.invalidate(es_index, user_id)
+
+    # One counter increment for the whole batch; item k gets position end - n + k + 1
+    if saved:
+        if jury_counter is not None:
+            end = await jury_counter.increment(es, by=len(saved))
+        else:
+            end = await increment_jury_counter(es, by=len(saved))
+        first = end - len(saved) + 1
+        for offset, (result, parsed) in enumerate(saved):
+            if jury_policy is not None:
+                run_jury = jury_policy.should_review(parsed)
+            else:
+                run_jury = (
+                    end and jury_trigger_modulo and (first + offset) % jury_trigger_modulo == 0
+                )
+            if run_jury and covered_enough(parsed, precheck_threshold):
+                result["jury_skipped"] = "precheck"
+            elif run_jury:
+                result.update(
+                    await trigger_jury_review(
+                        es, result["event_id"], parsed, jury_queue, jury_policy, ctx
                     )
-                    jury_reviewed = True
-            except Exception as e:
-                jury_error = f"Failed to trigger jury tool: {str(e)}"
-                if ctx:
-                    ctx.error(jury_error)
-                # Don't fail the save if jury fails
-                jury_reviewed = False
+                )
 
-        return {
-            "status": "saved",
-            "entry": resp.body if hasattr(resp, "body") else resp,
-            "jury_reviewed": jury_reviewed,
-        }
+    saved_count = sum(1 for r in results if r["status"] in ("saved", "spooled"))
+    error_count = len(results) - saved_count
+    if error_count == 0:
+        status = "saved"
+    elif saved_count:
+        status = "partial"
+    else:
+        status = "error"
+    return {
+        "status": status,
+        "saved_count": saved_count,
+        "error_count": error_count,
+        "results": results,
+    }
+
+
+async def confirm_symptom_entry_impl(
+    es: AsyncElasticsearch,
+    es_index: str,
+    jury_trigger_modulo: int,
+    review_cache: TTLCache,
+    review_token: str,
+    jury_queue: JuryJobQueue = None,
+    jury_counter: JuryCounterLease = None,
+    bulk_indexer: BulkIndexer = None,
+    idempotent: bool = False,
+    spool: EntrySpool = None,
+    jury_policy: AdaptiveJuryPolicy = None,
+    precheck_threshold: float = 0,
+    search_cache: SearchResultCache = None,
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """
+    Implementation for saving an entry previously validated by review.
+
+    Saves the cached SymptomEntry for review_token directly, without rebuilding
+    or revalidating it. The token is discarded once the save succeeds, so a
+    failed save can be retried with the same token until it expires.
+
+    Args:
+        es: Elasticsearch client
+        es_index: Index name
+        jury_trigger_modulo: Run the jury on every Nth save (0 disables)
+        review_cache: Cache of reviewed entries keyed by review token
+        review_token: Token returned by review_symptom_entry_impl
+        jury_queue: Optional background jury job queue
+        jury_counter: Optional leased jury counter
+        bulk_indexer: Optional write-coalescing bulk indexer
+        idempotent: Derive the document ID from content and use create semantics
+        spool: Optional local write-ahead spool for failed or slow writes
+        jury_policy: Optional adaptive jury policy used instead of the modulo
+        precheck_threshold: Skip the jury for entries with at least this coverage_score (0 disables)
+        search_cache: Optional search result cache, invalidated for the entry's index and user
+        ctx: FastMCP context for logging
+
+    Returns:
+        Dict with save status, event_id and jury trigger details
+    """
+    parsed = review_cache.get(review_token)
+    if parsed is None:
+        error = "Unknown or expired review_token; review the entry again"
+        if ctx:
+            await ctx.error(error)
+        return {"status": "error", "error": error}
+
+    result = await save_symptom_entry(
+        es=es,
+        es_index=es_index,
+        parsed=parsed,
+        jury_trigger_modulo=jury_trigger_modulo,
+        jury_queue=jury_queue,
+        jury_counter=jury_counter,
+        bulk_indexer=bulk_indexer,
+        idempotent=idempotent,
+        spool=spool,
+        jury_policy=jury_policy,
+        precheck_threshold=precheck_threshold,
+        search_cache=search_cache,
+        ctx=ctx,
+    )
+    if result["status"] in ("saved", "spooled"):
+        review_cache.pop(review_token)
+    return result
+
+
+async def get_jury_status_impl(
+    es: AsyncElasticsearch,
+    jury_queue: JuryJobQueue,
+    event_id: str,
+    event_id_field: str = "event_id",
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """
+    Implementation for reporting the jury review status of a saved entry.
+
+    Checks the in-memory job queue first, then falls back to looking for a
+    stored jury summary (e.g. for reviews finished before a server restart).
+
+    Args:
+        es: Elasticsearch client
+        jury_queue: Background jury job queue
+        event_id: Elasticsearch document ID of the saved entry
+        event_id_field: Summary field to match event_id on (see exact_match_field)
+        ctx: FastMCP context for logging
+
+    Returns:
+        Dict with event_id, status and job timing details when known
+    """
+    record = jury_queue.get_status(event_id) if jury_queue is not None else None
+    if record:
+        return record
+
+    try:
+        resp = await es.search(
+            index=JURY_SUMMARY_INDEX,
+            size=1,
+            query={"term": {event_id_field: event_id}},
+        )
+        if resp["hits"]["hits"]:
+            return {"event_id": event_id, "status": "completed"}
+    except Exception as e:
+        if ctx:
+            await ctx.error(f"Failed to look up jury summary: {e}")
+        return {"event_id": event_id, "status": "error", "error": str(e)}
+
+    return {"event_id": event_id, "status": "not_found"}
+
+
+async def run_jury_review_impl(
+    es: AsyncElasticsearch,
+    es_index: str,
+    event_id: str,
+    jury_policy: AdaptiveJuryPolicy = None,
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """
+    Implementation for running the jury inline on a saved entry.
+
+    Unlike the background queue, the request context is passed to the jury,
+    so each model's verdict reaches the client as a progress update as soon
+    as that model finishes.
+
+    Args:
+        es: Elasticsearch client
+        es_index: Index name
+        event_id: Elasticsearch document ID of the saved entry
+        jury_policy: Optional adaptive jury policy to feed the resulting rating
+        ctx: FastMCP context for progress and logging
+
+    Returns:
+        Dict with jury comparison results, or status "error"
+    """
+    try:
+        resp = await es.get(index=es_index, id=event_id)
+        parsed = SymptomEntry.model_validate(resp["_source"])
     except Exception as e:
         if ctx:
-            ctx.error(f"Failed to save entry: {e}")
+            await ctx.error(f"Failed to load entry {event_id}: {e}")
         return {"status": "error", "error": str(e)}
+
+    result = await llm_jury_compare_notes(
+        event_id,
+        parsed.symptom_details.raw_notes,
+        parsed.model_dump(mode="json"),
+        ctx,
+        es,
+    )
+    if jury_policy is not None and result.get("status") == "jury_completed":
+        jury_policy.record_faithfulness(parsed.user_id, result.get("faithfulness_mean"))
+    return result
@@ -0,0 +1,147 @@
+"""Write-coalescing bulk indexer for SymptomMinder."""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+from elasticsearch import AsyncElasticsearch
+
+
+class BulkItemError(Exception):
+    """Raised for a single document that failed inside a _bulk request."""
+
+    def __init__(self, status_code: int, error: Any, doc_id: Optional[str] = None):
+        self.status_code = status_code
+        self.error = error
+        self.doc_id = doc_id
+        super().__init__(f"Bulk item failed with status {status_code}: {error}")
+
+
+def parse_bulk_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract the per-document result from a _bulk response item.
+
+    Args:
+        item: One entry of the _bulk response "items" list, e.g. {"index": {...}}
+
+    Returns:
+        The inner result dict with _id, _index, result and status
+
+    Raises:
+        BulkItemError: If the item reports an error
+    """
+    result = next(iter(item.values()))
+    status = result.get("status", 200)
+    if result.get("error") or status >= 300:
+        raise BulkItemError(status, result.get("error"), result.get("_id"))
+    return result
+
+
+class BulkIndexer:
+    """
+    Write-behind buffer that merges concurrent index calls into one _bulk request.
+
+    The buffer is flushed when it reaches max_batch documents or flush_interval_ms
+    after the first buffered document, whichever comes first. Each caller awaits
+    its own per-document result (or error).
+
+    Examples:
+        indexer = BulkIndexer(es, max_batch=200, flush_interval_ms=5)
+        resp = await indexer.index(index="symptom_entries", document=doc)
+        event_id = resp["_id"]
+    """
+
+    def __init__(
+        self, es: AsyncElasticsearch, max_batch: int = 200, flush_interval_ms: float = 5
+    ):
+        """
+        Args:
+            es: Elasticsearch client
+            max_batch: Flush as soon as this many documents are buffered
+            flush_interval_ms: Maximum time a document waits in the buffer
+        """
+        self.es = es
+        self.max_batch = max(1, max_batch)
+        self.flush_interval = flush_interval_ms / 1000
+        self.requests_sent = 0
+        self.documents_written = 0
+        self._buffer: List[Tuple[dict, dict, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: set = set()
+
+    async def index(
+        self,
+        index: str,
+        document: dict,
+        id: Optional[str] = None,
+        op_type: str = "index",
+    ) -> Dict[str, Any]:
+        """
+        Buffer a document and wait for the _bulk request that writes it.
+
+        Args:
+            index: Target index name
+            document: Document source
+            id: Optional document ID
+            op_type: Bulk action, "index" or "create"
+
+        Returns:
+            Per-document result dict with _id, _index, result and status
+
+        Raises:
+            BulkItemError: If this document failed inside the bulk request
+            Exception: If the bulk request itself failed
+        """
+        loop = asyncio.get_running_loop()
+        action = {"_index": index}
+        if id is not None:
+            action["_id"] = id
+        future = loop.create_future()
+        self._buffer.append(({op_type: action}, document, future))
+
+        if len(self._buffer) >= self.max_batch:
+            self._flush_now()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.flush_interval, self._flush_now)
+        return await future
+
+    async def close(self) -> None:
+        """Flush any buffered documents and wait for in-flight requests."""
+        self._flush_now()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def _flush_now(self) -> None:
+        """Hand the current buffer to a background flush task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        task = asyncio.get_running_loop().create_task(self._flush(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: List[Tuple[dict, dict, asyncio.Future]]) -> None:
+        """Send one _bulk request and resolve each caller's future."""
+        operations = []
+        for action, document, _ in batch:
+            operations.append(action)
+            operations.append(document)
+
+        try:
+            resp = await self.es.bulk(operations=operations)
+            self.requests_sent += 1
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), item in zip(batch, resp["items"]):
+            if future.done():
+                continue
+            try:
+                future.set_result(parse_bulk_item(item))
+                self.documents_written += 1
+            except BulkItemError as e:
+                future.set_exception(e)
@@ -0,0 +1,346 @@
+"""In-memory caching utilities for SymptomMinder."""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+MAX_SEARCH_LIMIT = 1000  # largest limit (or page size) a flexible_search query may ask for
+
+
+class TTLCache:
+    """
+    Size-bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    Examples:
+        cache = TTLCache(maxsize=1000, ttl=900)
+        cache.set("token", value)
+        cache.get("token")  # value, or None once expired or evicted
+    """
+
+    def __init__(self, maxsize: int = 1000, ttl: Optional[float] = None):
+        """
+        Args:
+            maxsize: Maximum number of entries before the least recently used is evicted
+            ttl: Seconds before an entry expires (None to never expire)
+        """
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up a live entry and mark it as recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            Cached value or default
+        """
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires_at, value = item
+        if expires_at and expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove and return a live entry.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            Cached value or default
+        """
+        value = self.get(key, default)
+        self._data.pop(key, None)
+        return value
+
+    def keys(self) -> List[Hashable]:
+        """Return the keys currently stored, including ones that have expired."""
+        return list(self._data)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+
+def normalize_search_query(query: dict, default_limit: int = 20) -> dict:
+    """
+    Normalize a flexible_search filter dict so equivalent queries compare equal.
+
+    Drops None and blank values, strips surrounding whitespace from strings,
+    turns a fields projection into a sorted list, fills in the default limit
+    and clamps the limit to 1..MAX_SEARCH_LIMIT.
+
+    Args:
+        query: Flat flexible_search filter dict
+        default_limit: Limit used when the query does not set one
+
+    Returns:
+        Normalized copy of the query
+
+    Raises:
+        ValueError: If limit is not a whole number
+    """
+    normalized = {}
+    for key, value in query.items():
+        if isinstance(value, str):
+            value = value.strip()
+        if key == "fields" and value:
+            if isinstance(value, str):
+                value = value.split(",")
+            value = sorted({field.strip() for field in value if field.strip()})
+        if value is None or value == "" or value == []:
+            continue
+        normalized[key] = value
+    normalized["limit"] = _search_limit(normalized.get("limit", default_limit))
+    return normalized
+
+
+def _search_limit(value: Any) -> int:
+    """Parse a flexible_search limit and clamp it to 1..MAX_SEARCH_LIMIT."""
+    if isinstance(value, str) and value.lstrip("-").isdigit():
+        value = int(value)
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"limit must be a whole number, got {value!r}")
+    return min(max(value, 1), MAX_SEARCH_LIMIT)
+
+
+class SearchResultCache:
+    """
+    TTL/LRU cache of flexible_search results with write-driven invalidation.
+
+    Results are keyed by index and normalized query. Concurrent misses for the
+    same key share one Elasticsearch request. Writes call invalidate() for the
+    index (and user, when known); queries filtered to a different user_id keep
+    their cached results.
+
+    Elasticsearch only makes a write searchable after its next refresh, so for
+    settle_seconds after an invalidation results for that index are returned
+    but not stored, rather than caching a pre-refresh result for a full TTL.
+
+    Cached result lists are shared between callers and must not be mutated.
+
+    Examples:
+        search_cache = SearchResultCache(maxsize=500, ttl=60)
+        results = await search_cache.get_or_load(es_index, query, load)
+        search_cache.invalidate(es_index, user_id="alice")
+    """
+
+    def __init__(self, maxsize: int = 500, ttl: float = 60, settle_seconds: float = 1.0):
+        """
+        Args:
+            maxsize: Maximum number of cached queries before the least recently used is evicted
+            ttl: Seconds before a cached result expires
+            settle_seconds: Seconds after an invalidation during which results are not stored
+                (the index refresh interval)
+        """
+        self.settle_seconds = settle_seconds
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._in_flight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._generations: Dict[str, int] = {}
+        self._settle_until: Dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key(es_index: str, query: dict) -> Tuple[str, str]:
+        """
+        Build the cache key for a query.
+
+        Args:
+            es_index: Index name
+            query: Normalized flexible_search filter dict
+
+        Returns:
+            Tuple of index name and canonical JSON of the query
+        """
+        return es_index, json.dumps(query, sort_keys=True, default=str)
+
+    async def get_or_load(
+        self,
+        es_index: str,
+        query: dict,
+        load: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return a cached result, or load it once for all concurrent callers.
+
+        Args:
+            es_index: Index name
+            query: Normalized flexible_search filter dict
+            load: Coroutine function that runs the search on a miss
+
+        Returns:
+            Search results
+
+        Raises:
+            Exception: Whatever load raises; failures are not cached
+        """
+        cached = self.get(es_index, query)
+        if cached is not None:
+            return cached
+        key = self.key(es_index, query)
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise
+                # The caller running the search was cancelled; search directly
+                return await load()
+
+        generation = self.generation(es_index)
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await load()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an uncontested failure doesn't log "never retrieved"
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            self.put(es_index, query, result, generation)
+            return result
+        finally:
+            self._in_flight.pop(key, None)
+
+    def get(self, es_index: str, query: dict) -> Any:
+        """
+        Look up a cached result, counting the hit or miss.
+
+        Callers that load on a miss store the result with put().
+
+        Args:
+            es_index: Index name
+            query: Normalized flexible_search filter dict
+
+        Returns:
+            Cached search results, or None
+        """
+        cached = self._cache.get(self.key(es_index, query))
+        if cached is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return cached
+
+    def generation(self, es_index: str) -> int:
+        """
+        Return the write generation of an index, to pass to put() after a load.
+
+        Args:
+            es_index: Index name
+
+        Returns:
+            Number of invalidations of es_index so far
+        """
+        return self._generations.get(es_index, 0)
+
+    def put(self, es_index: str, query: dict, result: Any, generation: int) -> bool:
+        """
+        Store a loaded result unless the index was written to since the load began.
+
+        Args:
+            es_index: Index name
+            query: Normalized flexible_search filter dict
+            result: Search results
+            generation: generation(es_index) captured before the load
+
+        Returns:
+            True if the result was stored
+        """
+        if not self._storable(es_index, generation):
+            return False
+        self._cache.set(self.key(es_index, query), result)
+        return True
+
+    def invalidate(self, es_index: str, user_id: Optional[str] = None) -> int:
+        """
+        Drop cached results a write to es_index may have changed.
+
+        Args:
+            es_index: Index that was written to
+            user_id: User the written entry belongs to (None drops every query on the index)
+
+        Returns:
+            Number of cached queries dropped
+        """
+        self.invalidations += 1
+        self._generations[es_index] = self._generations.get(es_index, 0) + 1
+        self._settle_until[es_index] = time.monotonic() + self.settle_seconds
+        dropped = 0
+        for key in self._cache.keys():
+            index, query_json = key
+            if index != es_index:
+                continue
+            if user_id is not None:
+                query_user = json.loads(query_json).get("user_id")
+                if query_user is not None and query_user != user_id:
+                    continue
+            self._cache.pop(key)
+            dropped += 1
+        return dropped
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report cache counters.
+
+        Returns:
+            Dict with size, hits, misses (of which coalesced shared another
+            caller's request), invalidations and hit rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def _storable(self, es_index: str, generation: int) -> bool:
+        """Check that no write to es_index happened during or just before a load."""
+        return (
+            self._generations.get(es_index, 0) == generation
+            and time.monotonic() >= self._settle_until.get(es_index, 0)
+        )
@@ -0,0 +1,151 @@
+"""Local field-coverage pre-check of raw notes against a structured entry."""
+
+import re
+from typing import Any, Iterable, Optional, Set
+
+from pydantic import BaseModel
+
+from symptom_schema import SymptomEntry
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Function words and filler that carry no symptom information. Negations are
+# kept: "no nausea" is not covered by a summary that says "nausea"
+STOPWORDS = frozenset(
+    """
+    a about after again all also am an and any are around as at be been before
+    being but by can could did do does doing down during each few for from had
+    has have having he her here hers him his how i if in into is it its just
+    like me more most my now of off on once only or other our out
+    over own really same she should so some still such than that the their
+    them then there these they this those through to too under until up very
+    was we were what when where which while who why will with would you your
+    today yesterday got get feel feeling felt bit kind sort little pretty
+    """.split()
+)
+
+# Negation words (and the stems of n't contractions) that flip a note's meaning
+NEGATIONS = frozenset(
+    """
+    no not nor never none neither without cannot cant didn doesn don isn wasn
+    weren aren haven hasn hadn won wouldn couldn shouldn
+    """.split()
+)
+
+# Fields that describe the entry rather than its content
+NON_CONTENT_FIELDS = frozenset({"timestamp", "user_id", "coverage_score", "raw_notes"})
+
+# Suffixes stripped so "headaches"/"headache" and "bloated"/"bloating" match
+SUFFIXES = ("ing", "ed", "es", "s", "ly")
+
+
+def _stem(word: str) -> str:
+    """Strip a common suffix from a word, keeping at least three characters."""
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[: -len(suffix)]
+    return word
+
+
+def content_tokens(text: str) -> Set[str]:
+    """
+    Tokenize text into stemmed content words.
+
+    Args:
+        text: Free text
+
+    Returns:
+        Set of stemmed, lowercased tokens with stopwords and single letters removed
+    """
+    return {
+        _stem(token)
+        for token in TOKEN_PATTERN.findall(text.lower())
+        if len(token) > 1 and token not in STOPWORDS
+    }
+
+
+def _field_values(value: Any) -> Iterable[str]:
+    """Yield every string and number in a nested structured value or model."""
+    if isinstance(value, BaseModel):
+        # Read validated field values directly; no model_dump copy
+        for name, item in vars(value).items():
+            if name not in NON_CONTENT_FIELDS:
+                yield from _field_values(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _field_values(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _field_values(item)
+    elif isinstance(value, bool) or value is None:
+        return
+    else:
+        yield str(value)
+
+
+def coverage_score(entry: SymptomEntry) -> Optional[float]:
+    """
+    Score how much of an entry's raw notes its structured fields cover.
+
+    The score is the share of distinct content words in raw_notes that also
+    appear in any other field (symptom, cause, mediation_attempt, tags,
+    environmental context, ...). Notes whose every content word is already
+    captured score 1.0.
+
+    Args:
+        entry: Validated symptom entry
+
+    Returns:
+        Coverage between 0 and 1, or None when the entry has no raw notes
+    """
+    notes = entry.symptom_details.raw_notes
+    if not notes or not notes.strip():
+        return None
+    note_tokens = content_tokens(notes)
+    if not note_tokens:
+        return 1.0
+
+    field_tokens = _structured_tokens(entry)
+    return round(len(note_tokens & field_tokens) / len(note_tokens), 3)
+
+
+def _structured_tokens(entry: SymptomEntry) -> Set[str]:
+    """Content words of every structured field except the raw notes."""
+    return content_tokens(" ".join(_field_values(entry)))
+
+
+def uncaptured_negations(entry: SymptomEntry) -> Set[str]:
+    """
+    Find negation words in the raw notes that the structured fields lack.
+
+    Args:
+        entry: Validated symptom entry
+
+    Returns:
+        Negation tokens (e.g. "no", "not") present only in raw_notes
+    """
+    notes = entry.symptom_details.raw_notes
+    negations = content_tokens(notes or "") & NEGATIONS
+    if not negations:
+        return set()
+    return negations - _structured_tokens(entry)
+
+
+def covered_enough(entry: SymptomEntry, threshold: float) -> bool:
+    """
+    Check whether an entry's coverage lets it skip the LLM jury.
+
+    An entry whose notes contain a negation the structured fields lack ("no
+    nausea" recorded as "nausea") always goes to the jury, however high its
+    coverage.
+
+    Args:
+        entry: Validated symptom entry with coverage_score set
+        threshold: Minimum coverage to skip the jury (0 disables the pre-check)
+
+    Returns:
+        True if the pre-check is enabled and the entry's coverage meets it
+    """
+    if not threshold or entry.coverage_score is None or entry.coverage_score < threshold:
+        return False
+    return not uncaptured_negations(entry)
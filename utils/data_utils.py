@@ -1,11 +1,15 @@
 """Data validation and cleaning utilities for SymptomMinder."""
 
-import copy
+import hashlib
+import json
 from typing import Any, Dict
 
 # Null value variations to normalize
 NULL_VALUES = {"none", "null", "n/a", "na", "nil", ""}
 
+# Entry fields computed by the server, not part of the entry's content
+DERIVED_FIELDS = ("coverage_score",)
+
 
 def is_null_value(value: Any) -> bool:
     """
@@ -20,59 +24,36 @@ def is_null_value(value: Any) -> bool:
     return isinstance(value, str) and value.strip().lower() in NULL_VALUES
 
 
-def clean_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Clean and normalize entry data from client.
-
-    Args:
-        entry: Raw entry dictionary
-
-    Returns:
-        Cleaned entry dictionary with normalized values
+def derive_entry_id(entry: Dict[str, Any]) -> str:
     """
-    entry = copy.deepcopy(entry)
-    sd = entry.get("symptom_details")
-    if sd:
-        # Convert null-like strings to None or [] for lists
-        for k, v in list(sd.items()):
-            if is_null_value(v):
-                # Use [] for known list fields, else None
-                if k in ("associated_symptoms",):
-                    sd[k] = []
-                else:
-                    sd[k] = None
-        # Convert associated_symptoms to list if needed
-        if "associated_symptoms" in sd and not isinstance(
-            sd["associated_symptoms"], list
-        ):
-            if isinstance(sd["associated_symptoms"], str):
-                sd["associated_symptoms"] = [sd["associated_symptoms"]]
-            elif sd["associated_symptoms"] is None:
-                sd["associated_symptoms"] = []
-    entry["symptom_details"] = sd
-    return entry
-
+    Derive a deterministic document ID from a normalized entry.
 
-def ensure_raw_notes(entry: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Ensure raw_notes field is populated from description or similar fields.
+    The ID combines user_id, timestamp and symptom with a hash of the
+    remaining fields, so resaving the same entry yields the same ID.
+    Server-computed DERIVED_FIELDS are left out.
 
     Args:
-        entry: Entry dictionary with symptom_details
+        entry: JSON-serialized SymptomEntry (model_dump(mode="json"))
 
     Returns:
-        Entry with raw_notes populated if possible
+        32-character hex document ID
     """
-    entry = copy.deepcopy(entry)
-    sd = entry.get("symptom_details", {})
-
-    # Ensure raw_notes is set to user's description if not already present
-    if not sd.get("raw_notes"):
-        # Prefer description, then notes, then summary, then context if present
-        for field in ["description", "notes", "summary", "context"]:
-            if field in sd and isinstance(sd[field], str) and sd[field].strip():
-                sd["raw_notes"] = sd[field].strip()
-                break
-
-    entry["symptom_details"] = sd
-    return entry
+    details = entry.get("symptom_details") or {}
+    rest = {
+        k: v
+        for k, v in entry.items()
+        if k not in ("user_id", "timestamp", "symptom_details", *DERIVED_FIELDS)
+    }
+    rest["symptom_details"] = {k: v for k, v in details.items() if k != "symptom"}
+    rest_hash = hashlib.sha256(
+        json.dumps(rest, sort_keys=True, separators=(",", ":"), default=str).encode()
+    ).hexdigest()
+    key = "|".join(
+        [
+            entry.get("user_id") or "",
+            str(entry.get("timestamp") or ""),
+            (details.get("symptom") or "").strip().lower(),
+            rest_hash,
+        ]
+    )
+    return hashlib.sha256(key.encode()).hexdigest()[:32]
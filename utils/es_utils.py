@@ -1,11 +1,67 @@
 """Elasticsearch utilities for SymptomMinder."""
 
+import asyncio
 import os
 from typing import Optional, Any
-from elasticsearch import AsyncElasticsearch
+from elasticsearch import AsyncElasticsearch, TransportError
 
 # Get configuration from environment
 JURY_COUNTER_INDEX = os.environ.get("JURY_COUNTER_INDEX", "jury_counter")
+JURY_COUNTER_ID = "global_counter"
+
+# Explicit mapping for jury summaries: IDs and hashes as keywords, reports as
+# text only (no oversized .keyword subfields), ratings and counts as numbers
+JURY_SUMMARY_MAPPINGS = {
+    "properties": {
+        "event_id": {"type": "keyword"},
+        "cached_from_event_id": {"type": "keyword"},
+        "content_hash": {"type": "keyword"},
+        "reviewed_at": {"type": "date"},
+        "jury_prompt": {"type": "text", "index": False},
+        "jury_report": {"type": "text"},
+        "jury_models": {"type": "keyword"},
+        "jury_outputs": {
+            "type": "nested",
+            "properties": {
+                "model_id": {"type": "keyword"},
+                "model_label": {"type": "keyword"},
+                "jury_report": {"type": "text"},
+                "success": {"type": "boolean"},
+                "pending": {"type": "boolean"},
+                "error": {"type": "text"},
+                "latency_ms": {"type": "float"},
+                "first_token_ms": {"type": "float"},
+                "input_tokens": {"type": "integer"},
+                "output_tokens": {"type": "integer"},
+                "faithfulness_rating": {"type": "float"},
+                "missing_info": {"type": "text"},
+                "discrepancy_summary": {"type": "text"},
+            },
+        },
+        "successful_models_count": {"type": "integer"},
+        "failed_models_count": {"type": "integer"},
+        "pending_models_count": {"type": "integer"},
+        "input_tokens": {"type": "integer"},
+        "output_tokens": {"type": "integer"},
+        "faithfulness_min": {"type": "float"},
+        "faithfulness_max": {"type": "float"},
+        "faithfulness_mean": {"type": "float"},
+        "faithfulness_disagreement": {"type": "float"},
+        "faithfulness_ratings_count": {"type": "integer"},
+        "jury_aggregation_model": {"type": "keyword"},
+        "jury_aggregation": {"type": "text"},
+        "aggregation_latency_ms": {"type": "float"},
+        "aggregation_input_tokens": {"type": "integer"},
+        "aggregation_output_tokens": {"type": "integer"},
+        "first_verdict_ms": {"type": "float"},
+        "jury_latency_ms": {"type": "float"},
+    }
+}
+
+# Painless script adding params.n to the counter in a single atomic update
+JURY_COUNTER_SCRIPT = (
+    "ctx._source.count = (ctx._source.count == null ? 0 : ctx._source.count) + params.n"
+)
 
 
 def create_es_client(
@@ -90,6 +146,119 @@ def get_es_response_id(resp: Any) -> Optional[str]:
     return None
 
 
+def is_conflict_error(exc: Exception) -> bool:
+    """
+    Check whether an exception is an Elasticsearch 409 version conflict.
+
+    Covers both client ApiErrors and per-item bulk errors.
+
+    Args:
+        exc: Exception raised by an Elasticsearch call
+
+    Returns:
+        True if the error status is 409
+    """
+    status = getattr(exc, "status_code", None)
+    if status is None and hasattr(exc, "meta"):
+        status = getattr(exc.meta, "status", None)
+    return status == 409
+
+
+def is_retryable_error(exc: Exception) -> bool:
+    """
+    Check whether a failed Elasticsearch write is worth retrying later.
+
+    Transport and connection errors, timeouts (including an exceeded latency
+    budget), 429 rejections such as es_rejected_execution_exception, and 5xx
+    errors are retryable. Other 4xx errors (mapping or validation failures)
+    and unexpected exceptions would fail again on replay.
+
+    Args:
+        exc: Exception raised by an Elasticsearch call or a per-item bulk error
+
+    Returns:
+        True if the write may succeed when retried
+    """
+    if isinstance(exc, (TransportError, ConnectionError, TimeoutError)):
+        return True
+    status = getattr(exc, "status_code", None)
+    if status is None and hasattr(exc, "meta"):
+        status = getattr(exc.meta, "status", None)
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+async def ensure_jury_summary_index(es: AsyncElasticsearch, index: str) -> bool:
+    """
+    Create the jury summary index with its explicit mapping if it does not exist.
+
+    An existing index keeps its mapping; recreate it (see
+    data/reset_and_load_gluten_data.py) to pick up mapping changes, and use
+    exact_match_field to query ID fields of an older dynamic mapping.
+
+    Args:
+        es: Elasticsearch client
+        index: Jury summary index name
+
+    Returns:
+        True if the index exists or was created, False if Elasticsearch failed
+    """
+    try:
+        if not await es.indices.exists(index=index):
+            await es.indices.create(index=index, mappings=JURY_SUMMARY_MAPPINGS)
+        return True
+    except Exception as e:
+        if "resource_already_exists_exception" in str(e):
+            # Created concurrently by another process
+            return True
+        return False
+
+
+async def exact_match_field(
+    es: AsyncElasticsearch, index: str, field: str, dynamic: bool = False
+) -> str:
+    """
+    Return the field name to use for term queries and terms aggregations.
+
+    An index created before its explicit mapping was added (e.g. a jury
+    summary index written with dynamic mapping) has string fields mapped as
+    analyzed text with a .keyword subfield. Term queries on the text field
+    miss mixed-case IDs and terms aggregations on it fail, so the .keyword
+    subfield is used instead.
+
+    Args:
+        es: Elasticsearch client
+        index: Index or alias name
+        field: Dotted field path
+        dynamic: The index has no explicit mapping, so a field not mapped yet
+            (or a missing index) will be mapped as text with a .keyword subfield
+
+    Returns:
+        field, or field + ".keyword" if the field is (or will be) mapped as text
+    """
+    unmapped = f"{field}.keyword" if dynamic else field
+    try:
+        resp = await es.indices.get_mapping(index=index)
+    except Exception:
+        # Missing index: it will be created on its first write
+        return unmapped
+    body = resp.body if hasattr(resp, "body") else resp
+    nodes = []
+    for index_mapping in body.values():
+        node = index_mapping.get("mappings", {})
+        for part in field.split("."):
+            node = node.get("properties", {}).get(part)
+            if node is None:
+                break
+        if node is not None:
+            nodes.append(node)
+    if not nodes:
+        return unmapped
+    for node in nodes:
+        if node.get("type") == "text" and "keyword" in node.get("fields", {}):
+            return f"{field}.keyword"
+    return field
+
+
 async def get_jury_counter(es: AsyncElasticsearch) -> int:
     """
     Get the current jury trigger counter from Elasticsearch.
@@ -101,30 +270,85 @@ async def get_jury_counter(es: AsyncElasticsearch) -> int:
         Current counter value (0 if counter doesn't exist)
     """
     try:
-        resp = await es.get(index=JURY_COUNTER_INDEX, id="global_counter")
+        resp = await es.get(index=JURY_COUNTER_INDEX, id=JURY_COUNTER_ID)
         return resp["_source"].get("count", 0)
     except Exception:
         # Counter doesn't exist yet, initialize it
         return 0
 
 
-async def increment_jury_counter(es: AsyncElasticsearch) -> int:
+async def increment_jury_counter(es: AsyncElasticsearch, by: int = 1) -> int:
     """
-    Increment and return the jury trigger counter.
+    Atomically increment and return the jury trigger counter.
+
+    Uses a scripted upsert, so the read-modify-write happens inside
+    Elasticsearch in one round trip and concurrent saves never lose increments.
 
     Args:
         es: Elasticsearch client
+        by: Amount to add to the counter
 
     Returns:
         New counter value after increment (0 if update fails)
     """
     try:
-        current = await get_jury_counter(es)
-        new_count = current + 1
-        await es.index(
-            index=JURY_COUNTER_INDEX, id="global_counter", document={"count": new_count}
+        resp = await es.update(
+            index=JURY_COUNTER_INDEX,
+            id=JURY_COUNTER_ID,
+            script={"source": JURY_COUNTER_SCRIPT, "lang": "painless", "params": {"n": by}},
+            upsert={"count": by},
+            retry_on_conflict=50,
+            source=True,
         )
-        return new_count
+        return resp["get"]["_source"]["count"]
     except Exception:
         # Fallback to 0 if counter update fails
         return 0
+
+
+class JuryCounterLease:
+    """
+    Hands out jury counter values from blocks leased from Elasticsearch.
+
+    Each lease atomically reserves block_size values with one scripted update,
+    so most saves get their counter value without any Elasticsearch round trip.
+    Values are unique across processes, but values left in a block when the
+    process exits are skipped.
+
+    Examples:
+        counter = JuryCounterLease(block_size=50)
+        count = await counter.increment(es)
+    """
+
+    def __init__(self, block_size: int = 50):
+        """
+        Args:
+            block_size: Number of counter values reserved per lease
+        """
+        self.block_size = max(1, block_size)
+        self._next = 1
+        self._end = 0
+        self._lock = asyncio.Lock()
+
+    async def increment(self, es: AsyncElasticsearch, by: int = 1) -> int:
+        """
+        Take the next counter value(s) from the current lease.
+
+        Args:
+            es: Elasticsearch client used when a new block must be leased
+            by: Number of consecutive values to take
+
+        Returns:
+            The last value taken (0 if leasing a new block fails)
+        """
+        async with self._lock:
+            if self._next + by - 1 > self._end:
+                reserve = max(self.block_size, by)
+                end = await increment_jury_counter(es, by=reserve)
+                if not end:
+                    return 0
+                self._next = end - reserve + 1
+                self._end = end
+            value = self._next + by - 1
+            self._next += by
+            return value
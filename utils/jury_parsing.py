@@ -0,0 +1,234 @@
+"""Parsing and local aggregation of LLM jury reports."""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# A rating is only read from the text following "faithfulness" (to the end of
+# its sentence), or from the line after a "Faithfulness Rating" heading
+FAITHFULNESS_PATTERN = re.compile(r"faithfulness", re.IGNORECASE)
+# Scale descriptions such as "(1-10)" or "1 to 10", removed before reading the rating
+SCALE_PATTERN = re.compile(r"\(?\s*\d+\s*(?:-|\u2013|to)\s*10\s*\)?", re.IGNORECASE)
+SENTENCE_END_PATTERN = re.compile(r"[.;!?](?!\d)|\n")
+# What may follow "faithfulness" on a heading line with the rating below it
+HEADING_REST_PATTERN = re.compile(r"^[\s*#:]*(?:rating|score)?[\s*#:()\d-]*$", re.IGNORECASE)
+# "6/10", "7 out of 10"
+SCALED_RATING_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(?:/|out\s+of)\s*10\b", re.IGNORECASE)
+# "Rating: 8", "is 7", "of 9", "at 6", "= 8"
+STATED_RATING_PATTERN = re.compile(
+    r"(?::|=|\bis\b|\bof\b|\bat\b)[\s*]*(\d+(?:\.\d+)?)(?![\d.]*\s*%)", re.IGNORECASE
+)
+# "8/10" or "**8**" alone at the start of the line under a rating heading
+NEXT_LINE_RATING_PATTERN = re.compile(
+    r"^[\s*]*(\d+(?:\.\d+)?)[\s*]*(?:(?:/|out\s+of)\s*10\b|$)", re.IGNORECASE
+)
+HEADING_PATTERN = re.compile(r"^\s*#{1,6}\s+(.*?)\s*$")
+BOLD_LINE_PATTERN = re.compile(r"^\s*\*\*(.+?)\*\*:?\s*$")
+BULLET_PATTERN = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+(.*)$")
+
+
+def _split_sections(text: str) -> List[Tuple[str, int, List[str]]]:
+    """Split markdown into (heading, level, lines); bold-only lines are level 7."""
+    sections = [("", 0, [])]
+    for line in text.splitlines():
+        heading = HEADING_PATTERN.match(line)
+        bold = BOLD_LINE_PATTERN.match(line)
+        if heading:
+            sections.append((heading.group(1), 1, []))
+        elif bold:
+            sections.append((bold.group(1), 7, []))
+        else:
+            sections[-1][2].append(line)
+    return sections
+
+
+def _clean(text: str) -> str:
+    """Strip markdown emphasis and collapse whitespace."""
+    text = re.sub(r"[*`]+", "", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _rating_in(text: str) -> Optional[float]:
+    """Read a 1-10 rating from the text following a "faithfulness" mention."""
+    text = SCALE_PATTERN.sub(" ", text)
+    for pattern in (SCALED_RATING_PATTERN, STATED_RATING_PATTERN):
+        match = pattern.search(text)
+        if match and 1 <= float(match.group(1)) <= 10:
+            return float(match.group(1))
+    return None
+
+
+def parse_faithfulness_rating(text: str) -> Optional[float]:
+    """
+    Extract the 1-10 faithfulness rating from a jury report.
+
+    Only numbers tied to a "faithfulness" mention count: a scaled "N/10" or
+    "N out of 10", or a number after ":", "is", "of" or "at" in the same
+    sentence, or alone on the line after a "Faithfulness Rating" heading.
+    Scale text such as "(1-10)" is skipped, and other "N/10" scores in the
+    report (e.g. severity) are ignored.
+
+    Args:
+        text: Jury model report
+
+    Returns:
+        Rating as a float, or None if no rating in range is found
+    """
+    text = text or ""
+    for mention in FAITHFULNESS_PATTERN.finditer(text):
+        rest = text[mention.end() :]
+        end = SENTENCE_END_PATTERN.search(rest)
+        rating = _rating_in(rest[: end.start()] if end else rest)
+        if rating is not None:
+            return rating
+        # Heading on its own line: the rating may be on the next non-empty line
+        first_line, _, below = rest.partition("\n")
+        lines = [line for line in below.split("\n") if line.strip()]
+        if lines and HEADING_REST_PATTERN.match(first_line):
+            match = NEXT_LINE_RATING_PATTERN.match(lines[0])
+            if match and 1 <= float(match.group(1)) <= 10:
+                return float(match.group(1))
+    return None
+
+
+def parse_missing_info(text: str) -> List[str]:
+    """
+    Extract the missing/misrepresented information bullets from a jury report.
+
+    Collects bullets under a "Missing" heading and its bold sub-headings,
+    skipping "correctly captured" sub-sections.
+
+    Args:
+        text: Jury model report
+
+    Returns:
+        List of cleaned bullet texts
+    """
+    items = []
+    in_section = False
+    for heading, level, lines in _split_sections(text or ""):
+        lowered = heading.lower()
+        if level == 1:
+            in_section = "missing" in lowered or "misrepresent" in lowered
+            collect = in_section
+        elif level == 7 and in_section:
+            collect = "correct" not in lowered
+        else:
+            collect = in_section
+        if not collect:
+            continue
+        for line in lines:
+            bullet = BULLET_PATTERN.match(line)
+            if bullet:
+                items.append(_clean(bullet.group(1)))
+    return items
+
+
+def parse_discrepancy_summary(text: str) -> str:
+    """
+    Extract the discrepancy summary from a jury report.
+
+    Args:
+        text: Jury model report
+
+    Returns:
+        Summary section text, or the last paragraph if no summary heading exists
+    """
+    for heading, level, lines in _split_sections(text or ""):
+        if level == 1 and "summary" in heading.lower():
+            summary = _clean(" ".join(lines))
+            if summary:
+                return summary
+    paragraphs = [p for p in re.split(r"\n\s*\n", text or "") if p.strip()]
+    return _clean(paragraphs[-1]) if paragraphs else ""
+
+
+def parse_jury_report(text: str) -> Dict[str, Any]:
+    """
+    Extract structured findings from a jury model report.
+
+    Args:
+        text: Jury model report
+
+    Returns:
+        Dict with faithfulness_rating, missing_info and discrepancy_summary
+    """
+    return {
+        "faithfulness_rating": parse_faithfulness_rating(text),
+        "missing_info": parse_missing_info(text),
+        "discrepancy_summary": parse_discrepancy_summary(text),
+    }
+
+
+def _cell(text: str) -> str:
+    """Make text safe for a single markdown table cell."""
+    return text.replace("|", "\\|").replace("\n", " ").strip() or "-"
+
+
+def render_jury_table(jury_outputs: List[Dict[str, Any]]) -> str:
+    """
+    Render jury findings as a markdown table, one row per model.
+
+    Args:
+        jury_outputs: Jury outputs with model_label and parsed findings
+
+    Returns:
+        Markdown table with Model, Missing/Misrepresented Info,
+        Faithfulness Rating and Summary of Discrepancies columns; models
+        still running past the quorum are shown as Pending
+    """
+    rows = [
+        "| Model | Missing/Misrepresented Info | Faithfulness Rating | Summary of Discrepancies |",
+        "|---|---|---|---|",
+    ]
+    for output in jury_outputs:
+        if output.get("pending"):
+            rows.append(f"| {_cell(output['model_label'])} | - | - | Pending |")
+            continue
+        if not output.get("success", True):
+            rows.append(
+                f"| {_cell(output['model_label'])} | - | - | "
+                f"{_cell('Error: ' + str(output.get('error')))} |"
+            )
+            continue
+        rating = output.get("faithfulness_rating")
+        rows.append(
+            f"| {_cell(output['model_label'])} "
+            f"| {_cell('; '.join(output.get('missing_info') or []))} "
+            f"| {f'{rating:g}/10' if rating is not None else '-'} "
+            f"| {_cell(output.get('discrepancy_summary') or '')} |"
+        )
+    return "\n".join(rows)
+
+
+def summarize_faithfulness(jury_outputs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Summarize faithfulness ratings across jury models.
+
+    Args:
+        jury_outputs: Jury outputs with parsed faithfulness_rating values
+
+    Returns:
+        Dict with faithfulness_min, faithfulness_max, faithfulness_mean,
+        faithfulness_disagreement (max minus min) and faithfulness_ratings_count;
+        the statistics are None when no model produced a rating
+    """
+    ratings = [
+        o["faithfulness_rating"]
+        for o in jury_outputs
+        if o.get("success", True) and o.get("faithfulness_rating") is not None
+    ]
+    if not ratings:
+        return {
+            "faithfulness_min": None,
+            "faithfulness_max": None,
+            "faithfulness_mean": None,
+            "faithfulness_disagreement": None,
+            "faithfulness_ratings_count": 0,
+        }
+    return {
+        "faithfulness_min": min(ratings),
+        "faithfulness_max": max(ratings),
+        "faithfulness_mean": round(sum(ratings) / len(ratings), 2),
+        "faithfulness_disagreement": max(ratings) - min(ratings),
+        "faithfulness_ratings_count": len(ratings),
+    }
@@ -0,0 +1,192 @@
+"""Risk-adaptive sampling policy for choosing which saves go to the jury."""
+
+import random
+from collections import deque
+from typing import Any, Dict, Optional
+
+from symptom_schema import SymptomEntry
+from utils.cache import TTLCache
+
+# Weights of each risk signal in the combined score (they sum to 1)
+RISK_WEIGHTS = {
+    "notes_length": 0.35,
+    "null_fields": 0.25,
+    "severity": 0.15,
+    "faithfulness_history": 0.25,
+}
+
+# Raw notes at or above this length count as maximally risky
+NOTES_LENGTH_CAP = 600
+
+# Detail fields that can be left null when structuring raw notes
+OPTIONAL_DETAIL_FIELDS = (
+    "length_minutes",
+    "cause",
+    "mediation_attempt",
+    "on_medication",
+    "onset_type",
+    "intensity_pattern",
+    "associated_symptoms",
+    "relief_factors",
+)
+
+
+def risk_features(entry: SymptomEntry) -> Dict[str, float]:
+    """
+    Compute cheap local risk signals for an entry, each scaled to 0-1.
+
+    Args:
+        entry: Validated symptom entry
+
+    Returns:
+        Dict with notes_length, null_fields and severity signals
+    """
+    details = entry.symptom_details
+    notes = details.raw_notes or ""
+    empty = sum(1 for field in OPTIONAL_DETAIL_FIELDS if getattr(details, field) in (None, []))
+    return {
+        "notes_length": min(len(notes) / NOTES_LENGTH_CAP, 1.0),
+        # Null fields only signal lost information when there were notes to structure
+        "null_fields": empty / len(OPTIONAL_DETAIL_FIELDS) if notes else 0.0,
+        "severity": (details.severity - 1) / 9,
+    }
+
+
+class AdaptiveJuryPolicy:
+    """
+    Sends the riskiest entries to the jury while holding a target jury rate.
+
+    Each entry gets a risk score from its notes length, null fields, severity
+    and the user's recent jury faithfulness. An entry is reviewed when its
+    score is in the top target_rate fraction of recently seen scores. A small
+    share of the budget reviews random entries, so low-risk entries are still
+    audited and the user history keeps getting fresh ratings.
+
+    Examples:
+        policy = AdaptiveJuryPolicy(target_rate=0.2)
+        if policy.should_review(entry):
+            ...
+        policy.record_faithfulness(entry.user_id, 6.5)
+    """
+
+    def __init__(
+        self,
+        target_rate: float,
+        window: int = 500,
+        warmup: int = 20,
+        explore_share: float = 0.1,
+        history_users: int = 10000,
+        history_alpha: float = 0.3,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            target_rate: Fraction of saves to send to the jury (0-1)
+            window: Number of recent scores the selection threshold is taken from
+            warmup: Scores needed before thresholding; until then entries are sampled at random
+            explore_share: Fraction of the jury budget spent on random entries
+            history_users: Maximum users whose faithfulness history is kept
+            history_alpha: Weight of the newest rating in each user's moving average
+            seed: Optional random seed (for reproducible replays)
+        """
+        self.target_rate = min(max(target_rate, 0.0), 1.0)
+        self.warmup = warmup
+        self.explore_rate = self.target_rate * explore_share
+        self.risk_rate = self.target_rate - self.explore_rate
+        self.history_alpha = history_alpha
+        self._scores = deque(maxlen=max(1, window))
+        self._history = TTLCache(maxsize=history_users)
+        self._random = random.Random(seed)
+        self.seen = 0
+        self.selected = 0
+
+    def score(self, entry: SymptomEntry) -> float:
+        """
+        Combine an entry's risk signals into a 0-1 risk score.
+
+        Args:
+            entry: Validated symptom entry
+
+        Returns:
+            Weighted risk score; users without history count as average risk
+        """
+        features = risk_features(entry)
+        mean = self._history.get(entry.user_id) if entry.user_id else None
+        features["faithfulness_history"] = (10 - mean) / 9 if mean is not None else 0.5
+        return sum(RISK_WEIGHTS[name] * value for name, value in features.items())
+
+    def should_review(self, entry: SymptomEntry) -> bool:
+        """
+        Decide whether an entry goes to the jury.
+
+        Args:
+            entry: Validated symptom entry
+
+        Returns:
+            True if the entry should be reviewed
+        """
+        score = self.score(entry)
+        self._scores.append(score)
+        self.seen += 1
+        if len(self._scores) < self.warmup:
+            selected = self._random.random() < self.target_rate
+        elif self._random.random() < self.explore_rate:
+            selected = True
+        else:
+            selected = self._in_top_fraction(score)
+        if selected:
+            self.selected += 1
+        return selected
+
+    def _in_top_fraction(self, score: float) -> bool:
+        """
+        Check whether a score ranks in the top risk_rate fraction of recent scores.
+
+        Scores tie often (severity buckets, similar notes), so an entry tied
+        with others at the boundary is selected with the probability that
+        fills the remaining slots; otherwise ties would never be selected and
+        the jury rate would fall well below target.
+        """
+        if self.risk_rate <= 0:
+            return False
+        target = len(self._scores) * self.risk_rate
+        above = sum(1 for s in self._scores if s > score)
+        if above >= target:
+            return False
+        tied = sum(1 for s in self._scores if s == score)
+        if above + tied <= target:
+            return True
+        return self._random.random() < (target - above) / tied
+
+    def record_faithfulness(self, user_id: Optional[str], rating: Optional[float]) -> None:
+        """
+        Fold a completed jury's mean faithfulness into the user's history.
+
+        Args:
+            user_id: User the reviewed entry belongs to
+            rating: Mean faithfulness rating from the jury (ignored if None)
+        """
+        if not user_id or rating is None:
+            return
+        previous = self._history.get(user_id)
+        if previous is None:
+            self._history.set(user_id, rating)
+        else:
+            self._history.set(
+                user_id, self.history_alpha * rating + (1 - self.history_alpha) * previous
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report policy state.
+
+        Returns:
+            Dict with target and observed jury rates and tracked user count
+        """
+        return {
+            "target_rate": self.target_rate,
+            "seen": self.seen,
+            "selected": self.selected,
+            "observed_rate": round(self.selected / self.seen, 4) if self.seen else 0.0,
+            "users_tracked": len(self._history),
+        }
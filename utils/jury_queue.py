@@ -0,0 +1,178 @@
+"""Background job queue for running LLM jury reviews off the save path."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Job status values
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+STATUS_REJECTED = "rejected"
+
+
+class JuryJobQueue:
+    """
+    In-process asyncio job queue with a bounded pool of workers.
+
+    Jobs are zero-argument callables returning an awaitable jury result. The
+    status of the most recent jobs is kept in memory, keyed by event_id, so
+    callers can poll for progress after the save has returned.
+
+    Examples:
+        queue = JuryJobQueue(workers=2, maxsize=100)
+        queue.submit(event_id, lambda: llm_jury_compare_notes(...))
+        queue.get_status(event_id)
+    """
+
+    def __init__(self, workers: int = 2, maxsize: int = 100, history: int = 1000):
+        """
+        Args:
+            workers: Number of concurrent worker tasks
+            maxsize: Maximum number of pending jobs (0 for unbounded)
+            history: Number of job status records to keep in memory
+        """
+        self.workers = max(1, workers)
+        self.maxsize = maxsize
+        self.history = history
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._tasks: List[asyncio.Task] = []
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    @property
+    def started(self) -> bool:
+        """Whether worker tasks are running."""
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """Start worker tasks on the running event loop (no-op if already started)."""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"jury-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def stop(self, drain: bool = False, timeout: Optional[float] = None) -> None:
+        """
+        Stop worker tasks.
+
+        Jobs still running when the workers stop are cancelled, and jobs that
+        never started are marked failed.
+
+        Args:
+            drain: If True, wait for pending jobs to finish before stopping
+            timeout: Maximum seconds to wait when draining (None waits indefinitely)
+        """
+        if drain and self._tasks:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        while not self._queue.empty():
+            event_id, _ = self._queue.get_nowait()
+            record = self._jobs.get(event_id)
+            if record is not None and record["status"] == STATUS_QUEUED:
+                record["status"] = STATUS_FAILED
+                record["error"] = "Server stopped before the review started"
+                record["finished_at"] = time.time()
+            self._queue.task_done()
+
+    def submit(self, event_id: str, job: Callable[[], Awaitable[dict]]) -> bool:
+        """
+        Enqueue a jury job for an event.
+
+        Args:
+            event_id: Elasticsearch document ID of the saved entry
+            job: Zero-argument callable returning the jury coroutine
+
+        Returns:
+            True if the job was queued, False if the queue is full
+        """
+        self.start()
+        record = {
+            "event_id": event_id,
+            "status": STATUS_QUEUED,
+            "queued_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+            "error": None,
+        }
+        try:
+            self._queue.put_nowait((event_id, job))
+        except asyncio.QueueFull:
+            record["status"] = STATUS_REJECTED
+            record["error"] = "Jury queue is full"
+            self._record(event_id, record)
+            return False
+        self._record(event_id, record)
+        return True
+
+    def get_status(self, event_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the status record of the most recent job for an event.
+
+        Args:
+            event_id: Elasticsearch document ID of the saved entry
+
+        Returns:
+            Copy of the job status record, or None if unknown
+        """
+        record = self._jobs.get(event_id)
+        return dict(record) if record else None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize queue state.
+
+        Returns:
+            Dict with worker count, pending jobs and counts by status
+        """
+        by_status: Dict[str, int] = {}
+        for record in self._jobs.values():
+            by_status[record["status"]] = by_status.get(record["status"], 0) + 1
+        return {
+            "workers": self.workers,
+            "started": self.started,
+            "pending": self._queue.qsize(),
+            "maxsize": self.maxsize,
+            "jobs_by_status": by_status,
+        }
+
+    def _record(self, event_id: str, record: Dict[str, Any]) -> None:
+        """Store a status record, evicting the oldest beyond the history limit."""
+        self._jobs[event_id] = record
+        self._jobs.move_to_end(event_id)
+        while len(self._jobs) > self.history:
+            self._jobs.popitem(last=False)
+
+    async def _worker(self) -> None:
+        """Run queued jobs until cancelled."""
+        while True:
+            event_id, job = await self._queue.get()
+            record = self._jobs.get(event_id) or {"event_id": event_id}
+            record["status"] = STATUS_RUNNING
+            record["started_at"] = time.time()
+            try:
+                result = await job()
+                if isinstance(result, dict) and result.get("status") == "error":
+                    record["status"] = STATUS_FAILED
+                    record["error"] = result.get("error")
+                else:
+                    record["status"] = STATUS_COMPLETED
+            except asyncio.CancelledError:
+                record["status"] = STATUS_FAILED
+                record["error"] = "Cancelled"
+                raise
+            except Exception as e:
+                record["status"] = STATUS_FAILED
+                record["error"] = str(e)
+            finally:
+                record["finished_at"] = time.time()
+                self._queue.task_done()
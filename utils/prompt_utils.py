@@ -1,5 +1,7 @@
 """Prompt generation utilities for SymptomMinder."""
 
+from typing import Any, Optional
+
 from symptom_schema import SymptomEntry
 
 
@@ -38,3 +40,48 @@ def generate_review_prompt(entry: SymptomEntry) -> str:
         f"Please review the following symptom entry for accuracy before saving:\n\n"
         f"{summary}\nIs this information correct?"
     )
+
+
+def compact_entry(value: Any) -> Any:
+    """
+    Recursively drop None, empty strings, empty lists and empty dicts.
+
+    False and 0 are kept, since they are meaningful answers.
+
+    Args:
+        value: JSON-serializable value (typically a structured entry dict)
+
+    Returns:
+        The value without empty fields
+    """
+    if isinstance(value, dict):
+        compacted = {k: compact_entry(v) for k, v in value.items()}
+        return {k: v for k, v in compacted.items() if v not in (None, "", [], {})}
+    if isinstance(value, list):
+        compacted = [compact_entry(v) for v in value]
+        return [v for v in compacted if v not in (None, "", [], {})]
+    return value
+
+
+def truncate_to_tokens(text: Optional[str], max_tokens: int) -> Optional[str]:
+    """
+    Truncate text to roughly max_tokens, keeping its start and end.
+
+    Uses the same ~4 characters per token estimate as the jury rate limiter.
+    The middle of over-long text is replaced by a marker with the number of
+    characters removed.
+
+    Args:
+        text: Text to truncate (None is returned unchanged)
+        max_tokens: Token budget (0 disables truncation)
+
+    Returns:
+        Text within the budget
+    """
+    max_chars = max_tokens * 4
+    if not text or not max_tokens or len(text) <= max_chars:
+        return text
+    head = max_chars * 2 // 3
+    tail = max_chars - head
+    removed = len(text) - head - tail
+    return f"{text[:head]} [... {removed} characters truncated ...] {text[-tail:]}"
@@ -0,0 +1,169 @@
+"""Concurrency and rate limiting for LLM jury calls."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at a per-minute rate.
+
+    Capacity equals the per-minute limit, so at most one minute's budget can
+    be spent in a burst. A per-minute limit of 0 or less means unlimited.
+    """
+
+    def __init__(self, per_minute: float):
+        """
+        Args:
+            per_minute: Tokens added per minute (and bucket capacity); <= 0 for no limit
+        """
+        self.unlimited = per_minute <= 0
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """
+        Seconds until amount tokens are available (0 if available now).
+
+        Args:
+            amount: Tokens needed (clamped to capacity)
+        """
+        if self.unlimited:
+            return 0.0
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float) -> None:
+        """
+        Take amount tokens from the bucket.
+
+        Args:
+            amount: Tokens to take (clamped to capacity)
+        """
+        if self.unlimited:
+            return
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+
+class JuryRateLimiter:
+    """
+    Server-wide limiter for jury model calls.
+
+    Paces requests-per-minute and tokens-per-minute per model, then caps the
+    number of calls in flight across all models. Excess calls wait in line
+    instead of failing with provider 429s.
+
+    Examples:
+        limiter = JuryRateLimiter(max_concurrency=6, requests_per_minute=50)
+        async with limiter.acquire(model_id, estimated_tokens):
+            response = await client.messages.create(...)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 6,
+        requests_per_minute: float = 50,
+        tokens_per_minute: float = 40000,
+    ):
+        """
+        Args:
+            max_concurrency: Maximum jury calls in flight across all models
+            requests_per_minute: Requests per minute allowed per model (<= 0 for no limit)
+            tokens_per_minute: Input plus output tokens per minute allowed per model
+                (<= 0 for no limit)
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._buckets: Dict[str, tuple] = {}
+        self._model_locks: Dict[str, asyncio.Lock] = {}
+        self._waiting = 0
+        self._active = 0
+        self._acquired = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._last_wait = 0.0
+
+    @asynccontextmanager
+    async def acquire(self, model: str, tokens: int) -> AsyncIterator[None]:
+        """
+        Wait for a rate-limit slot and a concurrency slot for one model call.
+
+        Args:
+            model: Model ID the call is made against
+            tokens: Estimated input plus output tokens for the call
+        """
+        started = time.monotonic()
+        self._waiting += 1
+        try:
+            await self._pace(model, tokens)
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        waited = time.monotonic() - started
+        self._acquired += 1
+        self._total_wait += waited
+        self._last_wait = waited
+        self._max_wait = max(self._max_wait, waited)
+
+        self._active += 1
+        try:
+            yield
+        finally:
+            self._active -= 1
+            self._semaphore.release()
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Report limiter state.
+
+        Returns:
+            Dict with queue depth, calls in flight and wait times in milliseconds
+        """
+        return {
+            "queue_depth": self._waiting,
+            "in_flight": self._active,
+            "max_concurrency": self.max_concurrency,
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_per_minute": self.tokens_per_minute,
+            "calls_started": self._acquired,
+            "avg_wait_ms": round(self._total_wait / self._acquired * 1000, 1)
+            if self._acquired
+            else 0.0,
+            "last_wait_ms": round(self._last_wait * 1000, 1),
+            "max_wait_ms": round(self._max_wait * 1000, 1),
+        }
+
+    async def _pace(self, model: str, tokens: int) -> None:
+        """Sleep until the model's request and token buckets allow this call."""
+        if model not in self._buckets:
+            self._buckets[model] = (
+                TokenBucket(self.requests_per_minute),
+                TokenBucket(self.tokens_per_minute),
+            )
+            self._model_locks[model] = asyncio.Lock()
+        requests, token_budget = self._buckets[model]
+
+        # One waiter per model at a time keeps calls in arrival order
+        async with self._model_locks[model]:
+            while True:
+                delay = max(requests.wait_time(1), token_budget.wait_time(tokens))
+                if delay <= 0:
+                    requests.consume(1)
+                    token_budget.consume(tokens)
+                    return
+                await asyncio.sleep(delay)
@@ -0,0 +1,259 @@
+"""Durable local write-ahead spool for entries Elasticsearch could not accept."""
+
+import asyncio
+import json
+import logging
+import os
+import struct
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from elasticsearch import AsyncElasticsearch
+
+from utils.bulk_indexer import BulkItemError, parse_bulk_item
+from utils.cache import SearchResultCache
+from utils.es_utils import is_conflict_error, is_retryable_error
+
+logger = logging.getLogger(__name__)
+
+# Record header: payload length and CRC32 of the payload, both big-endian uint32
+RECORD_HEADER = struct.Struct(">II")
+
+
+def encode_record(record: Dict[str, Any]) -> bytes:
+    """
+    Encode a record as a length-prefixed, checksummed JSON payload.
+
+    Args:
+        record: JSON-serializable record
+
+    Returns:
+        Header followed by the UTF-8 JSON payload
+    """
+    payload = json.dumps(record, separators=(",", ":")).encode()
+    return RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def read_records(path: Path) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Read all complete records from a spool file.
+
+    Reading stops at the first truncated or corrupt record, which can only be
+    a torn write at the tail of the file.
+
+    Args:
+        path: Spool file path
+
+    Returns:
+        Tuple of decoded records in write order and the byte length they span
+    """
+    records = []
+    data = path.read_bytes()
+    offset = 0
+    while offset + RECORD_HEADER.size <= len(data):
+        length, crc = RECORD_HEADER.unpack_from(data, offset)
+        start = offset + RECORD_HEADER.size
+        payload = data[start : start + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            break
+        records.append(json.loads(payload))
+        offset = start + length
+    return records, offset
+
+
+class EntrySpool:
+    """
+    Append-only, fsync'd spool of symptom entries awaiting Elasticsearch.
+
+    Saves that fail, or exceed the latency budget, are appended here instead of
+    being lost. A background replayer drains the spool to Elasticsearch with
+    _bulk create requests using each record's content-derived ID, so entries
+    that did reach Elasticsearch before the failure are skipped as duplicates.
+    Records Elasticsearch rejects permanently (e.g. a mapping error) are moved
+    to a dead-letter file next to the spool instead of being retried forever.
+
+    Examples:
+        spool = EntrySpool("/data/spool.log", es, latency_budget_ms=500)
+        spool.start()
+        await spool.append(es_index, doc_id, document)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        es: AsyncElasticsearch,
+        latency_budget_ms: float = 0,
+        replay_interval: float = 5.0,
+        batch_size: int = 500,
+        search_cache: Optional[SearchResultCache] = None,
+    ):
+        """
+        Args:
+            path: Spool file path (its directory is created if missing)
+            es: Elasticsearch client used for replay
+            latency_budget_ms: Spool saves slower than this (0 for no budget)
+            replay_interval: Seconds between replay attempts
+            batch_size: Maximum records per _bulk replay request
+            search_cache: Optional search result cache, invalidated for replayed entries
+        """
+        self.path = Path(path)
+        self.replay_path = self.path.with_name(self.path.name + ".replaying")
+        self.dead_letter_path = self.path.with_name(self.path.name + ".dead")
+        self.es = es
+        self.latency_budget = latency_budget_ms / 1000 if latency_budget_ms else None
+        self.replay_interval = replay_interval
+        self.batch_size = max(1, batch_size)
+        self.search_cache = search_cache
+        self.spooled = 0
+        self.replayed = 0
+        self.dead_lettered = 0
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._truncate_torn_tail()
+
+    async def append(self, es_index: str, doc_id: str, document: dict) -> None:
+        """
+        Durably append an entry to the spool.
+
+        Args:
+            es_index: Index the entry belongs in
+            doc_id: Content-derived document ID
+            document: JSON-serializable entry document
+        """
+        record = {
+            "index": es_index,
+            "id": doc_id,
+            "document": document,
+            "spooled_at": time.time(),
+        }
+        data = encode_record(record)
+        async with self._lock:
+            await asyncio.to_thread(self._append_sync, self.path, data)
+        self.spooled += 1
+
+    def start(self) -> None:
+        """Start the background replayer on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._replay_loop(), name="spool-replayer")
+
+    async def stop(self) -> None:
+        """Stop the background replayer; spooled records stay on disk."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def replay_once(self) -> int:
+        """
+        Drain spooled records to Elasticsearch.
+
+        The spool file is rotated aside under the lock so new appends continue
+        into a fresh file. Records that fail with a retryable error are
+        appended back to the spool, and records that fail permanently are moved
+        to the dead-letter file with their error. If Elasticsearch is
+        unreachable, the rotated file is kept and retried on the next call.
+
+        Returns:
+            Number of records written (or already present) in Elasticsearch
+        """
+        async with self._lock:
+            if not self.replay_path.exists():
+                if not self.path.exists() or self.path.stat().st_size == 0:
+                    return 0
+                os.replace(self.path, self.replay_path)
+
+        records, _ = await asyncio.to_thread(read_records, self.replay_path)
+        written = 0
+        failed = []
+        dead = []
+        touched = set()  # (index, user_id) of entries now in Elasticsearch
+        for i in range(0, len(records), self.batch_size):
+            batch = records[i : i + self.batch_size]
+            operations = []
+            for record in batch:
+                operations.append({"create": {"_index": record["index"], "_id": record["id"]}})
+                operations.append(record["document"])
+            # Propagates when Elasticsearch is still down; the rotated file is retried
+            resp = await self.es.bulk(operations=operations)
+            for record, item in zip(batch, resp["items"]):
+                try:
+                    parse_bulk_item(item)
+                    written += 1
+                except BulkItemError as e:
+                    if is_conflict_error(e):
+                        written += 1
+                    elif is_retryable_error(e):
+                        failed.append(record)
+                        continue
+                    else:
+                        logger.error(
+                            "Moving spooled entry %s to %s: %s",
+                            record["id"],
+                            self.dead_letter_path,
+                            e,
+                        )
+                        dead.append({**record, "error": str(e), "failed_at": time.time()})
+                        continue
+                touched.add((record["index"], record["document"].get("user_id")))
+
+        async with self._lock:
+            if failed:
+                data = b"".join(encode_record(record) for record in failed)
+                await asyncio.to_thread(self._append_sync, self.path, data)
+            if dead:
+                data = b"".join(encode_record(record) for record in dead)
+                await asyncio.to_thread(self._append_sync, self.dead_letter_path, data)
+            self.replay_path.unlink()
+        self.dead_lettered += len(dead)
+        if self.search_cache is not None:
+            for es_index, user_id in touched:
+                self.search_cache.invalidate(es_index, user_id)
+        self.replayed += written
+        return written
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize spool state.
+
+        Returns:
+            Dict with spool and dead-letter paths, bytes pending on disk and record counters
+        """
+        pending_bytes = sum(p.stat().st_size for p in (self.path, self.replay_path) if p.exists())
+        return {
+            "path": str(self.path),
+            "pending_bytes": pending_bytes,
+            "dead_letter_path": str(self.dead_letter_path),
+            "spooled": self.spooled,
+            "replayed": self.replayed,
+            "dead_lettered": self.dead_lettered,
+        }
+
+    async def _replay_loop(self) -> None:
+        """Periodically replay the spool until cancelled."""
+        while True:
+            try:
+                await self.replay_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Elasticsearch still unavailable; try again next interval
+                pass
+            await asyncio.sleep(self.replay_interval)
+
+    def _truncate_torn_tail(self) -> None:
+        """Drop a partial record left by a crash so new appends stay readable."""
+        if not self.path.exists():
+            return
+        _, valid_length = read_records(self.path)
+        if valid_length < self.path.stat().st_size:
+            os.truncate(self.path, valid_length)
+
+    @staticmethod
+    def _append_sync(path: Path, data: bytes) -> None:
+        """Append bytes to a file and fsync before returning."""
+        with open(path, "ab") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())